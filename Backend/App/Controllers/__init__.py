@@ -10,4 +10,6 @@ from .eventRegistrationControllers import *
 from .jobApplicationController import *
 from .initialize import *
 from .boardPostController import *
-from .communityBoardController import *
\ No newline at end of file
+from .communityBoardController import *
+from .taskController import *
+from .announcementController import *
\ No newline at end of file
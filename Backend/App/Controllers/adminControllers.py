@@ -1,6 +1,8 @@
 from App.database import db
 from App.Models import User, Event, Job, Message
-from App.Controllers import eventController
+from App.Controllers import announcementController, eventController
+from App.Controllers.auth import revoke_user_tokens
+from App.Controllers.userCache import invalidateUser
 from datetime import datetime, timezone, timedelta
 
 
@@ -11,6 +13,9 @@ def approveUser(user_id: str) -> None:
     if user.role != "alumni":
         raise ValueError("Only alumni accounts require approval")
     user.isApproved = True
+    # Tokens issued before approval carry approved=False; force a fresh login
+    revoke_user_tokens(user)
+    invalidateUser(user)
     db.session.commit()
 
 
@@ -68,23 +73,10 @@ def manageEvent(event_id: str, action: str) -> None:
         raise ValueError("action must be cancel or reopen")
 
 
-def sendAnnouncement(admin_id: str, content: str) -> int:
-    if not content.strip():
-        raise ValueError("content is required")
-    recipients = User.query.filter_by(role="alumni", isApproved=True).all()
-    count = 0
-    for recipient in recipients:
-        message = Message(
-            senderID=admin_id,
-            receiverID=recipient.userID,
-            content=content.strip(),
-            status="sent",
-            attachments=[]
-        )
-        db.session.add(message)
-        count += 1
-    db.session.commit()
-    return count
+def sendAnnouncement(admin_id: str, content: str, expires_in_days: int = None) -> int:
+    """Publish a global announcement as one row and return the size of its alumni audience."""
+    announcementController.createAnnouncement(admin_id, content, expires_in_days)
+    return User.query.filter_by(role="alumni", isApproved=True).count()
 
 def suspendUser(user_id: str, reason: str, duration_days: int, admin_id: str) -> None:
     user = db.session.get(User, user_id)
@@ -96,6 +88,8 @@ def suspendUser(user_id: str, reason: str, duration_days: int, admin_id: str) ->
     user.isSuspended = True
     user.suspendedUntil = datetime.now(timezone.utc) + timedelta(days=duration_days)
     user.banReason = reason  # could also store suspension reason separately; reuse for now
+    revoke_user_tokens(user)
+    invalidateUser(user)
     db.session.commit()
 
 def unsuspendUser(user_id: str) -> None:
@@ -104,6 +98,8 @@ def unsuspendUser(user_id: str) -> None:
         raise ValueError("User not found")
     user.isSuspended = False
     user.suspendedUntil = None
+    revoke_user_tokens(user)
+    invalidateUser(user)
     db.session.commit()
 
 def banUser(user_id: str, reason: str, admin_id: str) -> None:
@@ -116,6 +112,8 @@ def banUser(user_id: str, reason: str, admin_id: str) -> None:
     user.isSuspended = True  # permanent ban also uses suspended flag
     user.suspendedUntil = None  # permanent
     user.banReason = reason
+    revoke_user_tokens(user)
+    invalidateUser(user)
     db.session.commit()
 
 def unbanUser(user_id: str) -> None:
@@ -125,4 +123,6 @@ def unbanUser(user_id: str) -> None:
     user.isSuspended = False
     user.suspendedUntil = None
     user.banReason = None
+    revoke_user_tokens(user)
+    invalidateUser(user)
     db.session.commit()
\ No newline at end of file
@@ -0,0 +1,70 @@
+from datetime import datetime, timezone, timedelta
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from App.database import db
+from App.Models import Announcement, AnnouncementRead, User
+from App.utils import _keyset_page
+
+
+def validateAnnouncement(content: str, expires_in_days: int = None):
+    """Check announcement input and return its expiry time (None for no expiry)."""
+    if not content or not content.strip():
+        raise ValueError("content is required")
+    if expires_in_days is None:
+        return None
+    if int(expires_in_days) <= 0:
+        raise ValueError("expiresInDays must be a positive integer")
+    return datetime.now(timezone.utc) + timedelta(days=int(expires_in_days))
+
+
+def createAnnouncement(author_id: str, content: str, expires_in_days: int = None) -> str:
+    """Store a global announcement as a single row; recipients see it at inbox query time."""
+    expires_at = validateAnnouncement(content, expires_in_days)
+    announcement = Announcement(authorID=author_id, content=content.strip(), expiresAt=expires_at)
+    db.session.add(announcement)
+    db.session.commit()
+    return announcement.announcementID
+
+
+def _activeFilter():
+    return or_(Announcement.expiresAt.is_(None), Announcement.expiresAt > datetime.now(timezone.utc))
+
+
+def listAnnouncementsPage(user_id: str, limit: int = 50, cursor: str = None) -> dict:
+    """Keyset page of active announcements seeking on (createdAt, announcementID), newest first.
+    Each row carries the author's name and whether `user_id` has read it.
+    """
+    limit = min(max(int(limit or 50), 1), 200)
+    query = (
+        db.session.query(Announcement, User.name, AnnouncementRead.readID)
+        .join(User, User.userID == Announcement.authorID)
+        .outerjoin(AnnouncementRead, and_(
+            AnnouncementRead.announcementID == Announcement.announcementID,
+            AnnouncementRead.userID == user_id,
+        ))
+        .filter(_activeFilter())
+    )
+    rows, next_cursor = _keyset_page(
+        query, [Announcement.createdAt, Announcement.announcementID], cursor, limit,
+        key=lambda row: [row[0].createdAt, row[0].announcementID],
+    )
+    announcements = []
+    for announcement, author_name, read_id in rows:
+        data = announcement.to_dict()
+        data["authorName"] = author_name
+        data["read"] = read_id is not None
+        announcements.append(data)
+    return {"announcements": announcements, "nextCursor": next_cursor}
+
+
+def markAnnouncementRead(user_id: str, announcement_id: str) -> None:
+    """Record a read receipt; idempotent."""
+    if not db.session.get(Announcement, announcement_id):
+        raise ValueError("Announcement not found")
+    try:
+        with db.session.begin_nested():
+            db.session.add(AnnouncementRead(announcementID=announcement_id, userID=user_id))
+    except IntegrityError:
+        pass
+    db.session.commit()
+
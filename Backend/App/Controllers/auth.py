@@ -1,32 +1,202 @@
 # File: App/Controllers/auth.py
 
+import threading
+import time
+from datetime import timezone
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+from flask import current_app, g, jsonify
 from flask_jwt_extended import (
     create_access_token,
     decode_token,
-    get_jwt_identity,
+    get_jwt,
     verify_jwt_in_request,
     JWTManager,
 )
+from sqlalchemy import event
+from sqlalchemy.orm import Session, with_polymorphic
+from werkzeug.security import check_password_hash, generate_password_hash
 from App.Models import User
+from App.Models.user import PASSWORD_HASH_PROFILES, password_hash_method
 from App.database import db
 
 
+# Lightweight stand-in for a User built purely from token claims
+TokenUser = namedtuple("TokenUser", ["userID", "role", "isApproved", "isSuspended"])
+
+# userID -> (tokenVersion, monotonic expiry), least recently used first; shared by all requests in this process
+_token_versions = OrderedDict()
+_token_versions_lock = threading.Lock()
+TOKEN_VERSION_CACHE_SIZE = 10000
+
+
 def authenticate_user(email: str, password: str):
     """
     Verify email and password.
     Returns User object if credentials are valid, otherwise None.
+    Hashes made with an outdated method or cost are upgraded on success.
     """
     user = User.query.filter_by(email=email.strip().lower()).first()
     if user and user.check_password(password):
+        if user.password_needs_rehash():
+            user.set_password(password)
+            db.session.commit()
         return user
     return None
 
 
+def benchmark_password_hashing(profiles=None, seconds: float = 1.0) -> list:
+    """
+    Time password verification on a single core for each hashing profile
+    (or werkzeug method string) in `profiles`; defaults to every known profile.
+    Returns one dict per profile with verifyMs and loginsPerSecondPerCore.
+    """
+    results = []
+    for profile in profiles or PASSWORD_HASH_PROFILES:
+        method = password_hash_method(profile)
+        stored = generate_password_hash("benchmark-password", method=method)
+        count, start = 0, time.perf_counter()
+        while True:
+            check_password_hash(stored, "benchmark-password")
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= seconds:
+                break
+        results.append({
+            "profile": profile,
+            "method": method,
+            "verifyMs": round(elapsed * 1000 / count, 3),
+            "loginsPerSecondPerCore": round(count / elapsed, 1),
+        })
+    return results
+
+
 def issue_access_token(user: User) -> str:
     """
     Generate a JWT access token for the given user.
+    Role, approval and suspension state are embedded as claims so
+    claims-only lookups need no database row; "tv" pins the token to
+    the user's current tokenVersion.
+    """
+    until = user.suspendedUntil
+    if until is not None and until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    claims = {
+        "role": user.role,
+        "approved": bool(user.isApproved),
+        "suspended": bool(user.isSuspended),
+        "suspendedUntil": int(until.timestamp()) if until else None,
+        "tv": user.tokenVersion or 0,
+    }
+    return create_access_token(identity=user, additional_claims=claims)
+
+
+def current_token_version(user_id: str):
+    """
+    Return the user's tokenVersion, cached in-process for TOKEN_VERSION_TTL seconds.
+    Returns None if the user no longer exists.
     """
-    return create_access_token(identity=user)
+    now = time.monotonic()
+    with _token_versions_lock:
+        entry = _token_versions.get(user_id)
+        if entry is not None and entry[1] > now:
+            _token_versions.move_to_end(user_id)
+            return entry[0]
+    version = db.session.query(User.tokenVersion).filter(User.userID == user_id).scalar()
+    _remember_token_version(user_id, version, now)
+    return version
+
+
+def _remember_token_version(user_id, version, now=None):
+    ttl = current_app.config.get("TOKEN_VERSION_TTL", 30)
+    with _token_versions_lock:
+        _token_versions[user_id] = (version, (now or time.monotonic()) + ttl)
+        _token_versions.move_to_end(user_id)
+        while len(_token_versions) > TOKEN_VERSION_CACHE_SIZE:
+            _token_versions.popitem(last=False)
+
+
+def revoke_user_tokens(user: User) -> None:
+    """
+    Invalidate every token issued to the user so far by bumping tokenVersion.
+    Once the caller commits, takes effect immediately in this process and
+    within TOKEN_VERSION_TTL seconds in other workers.
+    """
+    user.tokenVersion = (user.tokenVersion or 0) + 1
+    db.session.info.setdefault("revoked_token_versions", {})[user.userID] = user.tokenVersion
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_revoked_token_versions(session):
+    # Only committed versions reach the cache, so a rolled-back revocation never rejects valid tokens
+    for user_id, version in session.info.pop("revoked_token_versions", {}).items():
+        _remember_token_version(user_id, version)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_revoked_token_versions(session):
+    session.info.pop("revoked_token_versions", None)
+
+
+def _claims_suspended(jwt_data: dict) -> bool:
+    if not jwt_data.get("suspended"):
+        return False
+    until = jwt_data.get("suspendedUntil")
+    return until is None or until > time.time()
+
+
+def load_user(user_id: str):
+    """
+    Load a User with its Alumni/Admin subclass columns in a single query.
+    Returns the polymorphic instance or None.
+    """
+    if not user_id:
+        return None
+    entity = with_polymorphic(User, "*")
+    return db.session.query(entity).filter(entity.userID == user_id).one_or_none()
+
+
+def _resolve_user(jwt_data: dict, claims_only: bool = False):
+    # The loaded row is memoized on g against the decoded token itself, so
+    # it lives exactly as long as one verify_jwt_in_request() call.
+    if not jwt_data:
+        return None
+    if claims_only and "role" in jwt_data:
+        # Same cached lookup as the revocation check; a deleted account has no version
+        if current_token_version(jwt_data["sub"]) is None:
+            return None
+        return TokenUser(
+            jwt_data["sub"], jwt_data["role"], bool(jwt_data.get("approved")),
+            _claims_suspended(jwt_data),
+        )
+    cached = g.get("_resolved_user")
+    if cached is not None and cached[0] is jwt_data:
+        user = cached[1]
+    else:
+        user = load_user(jwt_data.get("sub"))
+        g._resolved_user = (jwt_data, user)
+    if claims_only and user is not None:
+        return TokenUser(user.userID, user.role, bool(user.isApproved), user.is_suspended())
+    return user
+
+
+def resolve_current_user(claims_only: bool = False):
+    """
+    Return the authenticated user for the current request, loading it at most once.
+    With claims_only=True returns a TokenUser built from the JWT claims
+    (tokens issued without claims fall back to the database row).
+    Returns None when the request carries no valid token.
+    """
+    try:
+        jwt_data = get_jwt()
+    except RuntimeError:
+        try:
+            verify_jwt_in_request(optional=True)
+            jwt_data = get_jwt()
+        except Exception:
+            return None
+    return _resolve_user(jwt_data, claims_only)
 
 
 def decode_access_token(token: str):
@@ -66,14 +236,49 @@ def setup_jwt(app):
         # Return the string userID as the JWT subject
         return user.userID
 
+    @jwt.token_in_blocklist_loader
+    def token_revoked_callback(_jwt_header, jwt_data):
+        version = current_token_version(jwt_data["sub"])
+        return version is None or jwt_data.get("tv", 0) != version
+
     @jwt.user_lookup_loader
     def user_lookup_callback(_jwt_header, jwt_data):
-        identity = jwt_data["sub"]
-        return db.session.get(User, identity)
+        # Claims only: the full row is loaded lazily by resolve_current_user().
+        # Returning None for a deleted account makes the request fail with 401.
+        return _resolve_user(jwt_data, claims_only=True)
 
     return jwt
 
 
+def role_required(*roles, error: str = None):
+    """
+    Build a view decorator that verifies the JWT and authorizes purely from
+    its claims: the role must be one of `roles`, alumni must be approved and
+    the account must not be suspended. No user row is loaded.
+    """
+    error = error or f"{' or '.join(roles).capitalize()} access required"
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            verify_jwt_in_request()
+            claims = resolve_current_user(claims_only=True)
+            if claims is None:
+                return jsonify({"error": "Authentication required"}), 401
+            if claims.role not in roles or (claims.role == "alumni" and not claims.isApproved):
+                return jsonify({"error": error}), 403
+            if claims.isSuspended:
+                return jsonify({"error": "Account suspended"}), 403
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+alumni_required = role_required("alumni")
+admin_required = role_required("admin")
+member_required = role_required("alumni", "admin")
+
+
 def add_auth_context(app):
     """
     Add authentication context to all templates (for server‑side rendering).
@@ -82,9 +287,7 @@ def add_auth_context(app):
     @app.context_processor
     def inject_user():
         try:
-            verify_jwt_in_request(optional=True)
-            user_id = get_jwt_identity()
-            user = db.session.get(User, user_id) if user_id else None
+            user = resolve_current_user()
             is_authenticated = user is not None
         except Exception:
             is_authenticated = False
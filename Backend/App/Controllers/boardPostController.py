@@ -1,7 +1,20 @@
+import logging
 from datetime import datetime, timezone
 from uuid import uuid4
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 from App.database import db
-from App.Models import BoardPost, CommunityBoard, Alumni
+from App.Models import BoardPost, CommunityBoard, User, PostLike, PostComment
+from App.utils import _keyset_page
+from App.Controllers import communityBoardController
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of liker IDs shipped with each post in the feed; the full list is paged via listPostLikers.
+FEED_LIKERS_PREVIEW = 20
+# Number of most recent comments shipped with each post in the feed; older ones are paged via listComments.
+FEED_COMMENTS_PREVIEW = 3
 
 
 def createBoardPost(alumni_id: str, board_id: str, content: str):
@@ -11,8 +24,7 @@ def createBoardPost(alumni_id: str, board_id: str, content: str):
     board = db.session.get(CommunityBoard, board_id)
     if not board:
         raise ValueError(f"Board {board_id} not found")
-    members = board.memberIDs or []
-    if alumni_id != board.alumniID and alumni_id not in members:
+    if alumni_id != board.alumniID and not communityBoardController.isBoardMember(board_id, alumni_id):
         raise PermissionError("Join board before posting")
     
     post = BoardPost(
@@ -65,68 +77,262 @@ def deleteBoardPost(post_id: str, alumni_id: str, is_admin: bool = False) -> Non
     if not is_admin and post.alumniID != alumni_id:
         raise PermissionError("Only author or admin can delete this post")
     
+    PostLike.query.filter_by(postID=post_id).delete(synchronize_session=False)
+    PostComment.query.filter_by(postID=post_id).delete(synchronize_session=False)
     db.session.delete(post)
     db.session.commit()
 
 
+def _adjustPostCounter(post_id: str, column, delta: int) -> None:
+    """Apply `delta` to a stored counter in SQL so concurrent writers never overwrite each other."""
+    query = BoardPost.query.filter(BoardPost.postID == post_id)
+    if delta < 0:
+        query = query.filter(column > 0)
+    query.update({column: column + delta}, synchronize_session=False)
+
+
 def likePost(post_id: str, alumni_id: str) -> dict:
-    post = db.session.get(BoardPost, post_id)
-    if not post:
+    if not db.session.query(BoardPost.postID).filter_by(postID=post_id).scalar():
         raise ValueError(f"Post {post_id} not found")
     
-    liked_by = set(post.likedBy or [])
-    if alumni_id in liked_by:
-        liked_by.remove(alumni_id)
+    removed = PostLike.query.filter_by(postID=post_id, alumniID=alumni_id).delete(synchronize_session=False)
+    if removed:
+        _adjustPostCounter(post_id, BoardPost.likesCount, -1)
         liked = False
     else:
-        liked_by.add(alumni_id)
         liked = True
-    
-    post.likedBy = sorted(liked_by)
-    post.likesCount = len(liked_by)
+        try:
+            with db.session.begin_nested():
+                db.session.add(PostLike(postID=post_id, alumniID=alumni_id))
+            _adjustPostCounter(post_id, BoardPost.likesCount, 1)
+        except IntegrityError:
+            # A concurrent request already recorded this like; the counter was bumped there.
+            pass
     db.session.commit()
     
-    return {"likesCount": post.likesCount, "liked": liked, "likedBy": post.likedBy or []}
+    likes_count = db.session.query(BoardPost.likesCount).filter_by(postID=post_id).scalar()
+    return {"likesCount": likes_count, "liked": liked}
+
+
+def isPostLikedBy(post_id: str, alumni_id: str) -> bool:
+    """Single probe on the (postID, alumniID) unique index."""
+    return db.session.query(PostLike.likeID).filter_by(postID=post_id, alumniID=alumni_id).first() is not None
+
+
+def listPostLikers(post_id: str, limit: int = 50, cursor: str = None) -> dict:
+    """Page through the IDs of users who liked a post, most recent first."""
+    if not db.session.query(BoardPost.postID).filter_by(postID=post_id).scalar():
+        raise ValueError(f"Post {post_id} not found")
+    limit = min(max(int(limit or 50), 1), 200)
+    likes, next_cursor = _keyset_page(
+        PostLike.query.filter_by(postID=post_id), [PostLike.likedAt, PostLike.likeID], cursor, limit
+    )
+    return {"likedBy": [like.alumniID for like in likes], "nextCursor": next_cursor}
+
+
+def _existingUserIDs(user_ids) -> set:
+    """Return the subset of user_ids that still have a users row."""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return set()
+    return {row.userID for row in db.session.query(User.userID).filter(User.userID.in_(user_ids))}
+
+
+def migrateLegacyLikes(batch_size: int = 500) -> dict:
+    """Move likes stored in the legacy BoardPost.likedBy JSON column into post_likes.
+    IDs of users that no longer exist cannot be referenced from post_likes; they are logged and
+    counted as skipped. Idempotent: migrated posts have their JSON list cleared.
+    Returns {"inserted": n, "skipped": n}.
+    """
+    inserted = skipped = 0
+    last_post_id = ""
+    while True:
+        posts = BoardPost.query.filter(BoardPost.postID > last_post_id).order_by(BoardPost.postID).limit(batch_size).all()
+        if not posts:
+            break
+        known = _existingUserIDs(uid for post in posts for uid in (post.likedBy or []))
+        for post in posts:
+            legacy_ids = list(dict.fromkeys(post.likedBy or []))
+            if not legacy_ids:
+                continue
+            unknown = [uid for uid in legacy_ids if uid not in known]
+            if unknown:
+                LOGGER.warning("Post %s: skipped likes from unknown users %s", post.postID, unknown)
+                skipped += len(unknown)
+            legacy_ids = [uid for uid in legacy_ids if uid in known]
+            existing = {
+                row.alumniID for row in
+                db.session.query(PostLike.alumniID).filter(PostLike.postID == post.postID, PostLike.alumniID.in_(legacy_ids))
+            }
+            new_rows = [
+                {"likeID": str(uuid4()), "postID": post.postID, "alumniID": uid, "likedAt": post.postedDate}
+                for uid in legacy_ids if uid not in existing
+            ]
+            if new_rows:
+                db.session.execute(PostLike.__table__.insert(), new_rows)
+                inserted += len(new_rows)
+            post.likedBy = []
+            post.likesCount = PostLike.query.filter_by(postID=post.postID).count()
+        last_post_id = posts[-1].postID
+        db.session.commit()
+    return {"inserted": inserted, "skipped": skipped}
 
 
 def addComment(post_id: str, alumni_id: str, alumni_name: str, content: str) -> dict:
     if not content.strip():
         raise ValueError("Comment content cannot be empty")
     
-    post = db.session.get(BoardPost, post_id)
-    if not post:
+    if not db.session.query(BoardPost.postID).filter_by(postID=post_id).scalar():
         raise ValueError(f"Post {post_id} not found")
     
-    comments = list(post.comments or [])
-    comment = {
-        "commentID": str(uuid4()),
-        "authorID": alumni_id,
-        "authorName": alumni_name,
-        "content": content.strip(),
-        "time": datetime.now(timezone.utc).isoformat(),
-        "avatar": f"https://ui-avatars.com/api/?name={alumni_name.replace(' ', '+')}&background=0D8ABC&color=fff"
-    }
-    comments.append(comment)
-    post.comments = comments
+    comment = PostComment(
+        postID=post_id,
+        authorID=alumni_id,
+        content=content.strip(),
+        time=datetime.now(timezone.utc),
+    )
+    db.session.add(comment)
+    _adjustPostCounter(post_id, BoardPost.commentsCount, 1)
     db.session.commit()
-    return comment
+    return comment.to_dict(alumni_name)
 
 
-def listAllPosts() -> list:
-    """Return serialized posts with author names and comment counts."""
-    posts = BoardPost.query.order_by(BoardPost.postedDate.desc()).all()
+def listComments(post_id: str, limit: int = 20, cursor: str = None) -> dict:
+    """Page through a post's comments, newest first, seeking on (time, commentID)."""
+    if not db.session.query(BoardPost.postID).filter_by(postID=post_id).scalar():
+        raise ValueError(f"Post {post_id} not found")
+    limit = min(max(int(limit or 20), 1), 100)
+    query = db.session.query(PostComment, User.name).outerjoin(User, User.userID == PostComment.authorID).filter(
+        PostComment.postID == post_id
+    )
+    rows, next_cursor = _keyset_page(
+        query, [PostComment.time, PostComment.commentID], cursor, limit,
+        key=lambda row: [row[0].time, row[0].commentID],
+    )
+    return {"comments": [comment.to_dict(author_name) for comment, author_name in rows], "nextCursor": next_cursor}
+
+
+def migrateLegacyComments(batch_size: int = 500) -> dict:
+    """Move comments stored in the legacy BoardPost.comments JSON column into post_comments.
+    Entries without an author or content, or whose author no longer exists, cannot be moved; they
+    stay in the JSON list and are logged and counted as skipped. Idempotent: moved entries are removed
+    from the list. Returns {"inserted": n, "skipped": n}.
+    """
+    inserted = skipped = 0
+    last_post_id = ""
+    while True:
+        posts = BoardPost.query.filter(BoardPost.postID > last_post_id).order_by(BoardPost.postID).limit(batch_size).all()
+        if not posts:
+            break
+        known = _existingUserIDs(
+            entry.get("authorID") for post in posts for entry in (post.comments or [])
+            if isinstance(entry, dict) and isinstance(entry.get("authorID"), str)
+        )
+        for post in posts:
+            if not post.comments:
+                continue
+            new_rows, kept = [], []
+            for entry in post.comments:
+                if not (isinstance(entry, dict) and entry.get("content") and entry.get("authorID") in known):
+                    kept.append(entry)
+                    continue
+                try:
+                    posted = datetime.fromisoformat(entry["time"]) if entry.get("time") else post.postedDate
+                except (TypeError, ValueError):
+                    posted = post.postedDate
+                new_rows.append({
+                    "commentID": str(uuid4()),
+                    "postID": post.postID,
+                    "authorID": entry["authorID"],
+                    "content": entry["content"],
+                    "time": posted,
+                })
+            if kept:
+                LOGGER.warning("Post %s: kept %d legacy comments without a known author or content", post.postID, len(kept))
+                skipped += len(kept)
+            if new_rows:
+                db.session.execute(PostComment.__table__.insert(), new_rows)
+                inserted += len(new_rows)
+            post.comments = kept
+            post.commentsCount = PostComment.query.filter_by(postID=post.postID).count()
+        last_post_id = posts[-1].postID
+        db.session.commit()
+    return {"inserted": inserted, "skipped": skipped}
+
+
+def _feedQuery(board_id: str = None):
+    """Posts joined with their author's name in a single SELECT."""
+    query = db.session.query(BoardPost, User.name).outerjoin(User, User.userID == BoardPost.alumniID)
+    if board_id:
+        query = query.filter(BoardPost.boardID == board_id)
+    return query
+
+
+def _serializeFeedRows(rows: list, viewer_id: str = None) -> list:
+    """Serialize (post, author name) rows with a bounded liker preview and the viewer's liked flag."""
+    post_ids = [post.postID for post, _ in rows]
+    likers = {post_id: [] for post_id in post_ids}
+    recent_comments = {post_id: [] for post_id in post_ids}
+    liked_ids = set()
+    if post_ids:
+        ranked = db.session.query(
+            PostLike.postID,
+            PostLike.alumniID,
+            func.row_number().over(partition_by=PostLike.postID, order_by=PostLike.likedAt.desc()).label("rank"),
+        ).filter(PostLike.postID.in_(post_ids)).subquery()
+        for post_id, liker_id in db.session.query(ranked.c.postID, ranked.c.alumniID).filter(ranked.c.rank <= FEED_LIKERS_PREVIEW):
+            likers[post_id].append(liker_id)
+        ranked_comments = db.session.query(
+            PostComment,
+            func.row_number().over(
+                partition_by=PostComment.postID, order_by=(PostComment.time.desc(), PostComment.commentID.desc())
+            ).label("rank"),
+        ).filter(PostComment.postID.in_(post_ids)).subquery()
+        latest = aliased(PostComment, ranked_comments)
+        comment_rows = (
+            db.session.query(latest, User.name)
+            .outerjoin(User, User.userID == latest.authorID)
+            .filter(ranked_comments.c.rank <= FEED_COMMENTS_PREVIEW)
+            .order_by(latest.time.asc(), latest.commentID.asc())
+        )
+        for comment, author_name in comment_rows:
+            recent_comments[comment.postID].append(comment.to_dict(author_name))
+        if viewer_id:
+            liked_ids = {
+                row.postID for row in
+                db.session.query(PostLike.postID).filter(PostLike.alumniID == viewer_id, PostLike.postID.in_(post_ids))
+            }
+
     result = []
-    for post in posts:
-        author = db.session.get(Alumni, post.alumniID)
+    for post, author_name in rows:
         result.append({
             "postID": post.postID,
             "boardID": post.boardID,
-            "authorName": author.name if author else "Unknown",
+            "authorName": author_name or "Unknown",
             "content": post.content,
             "postedDate": post.postedDate.isoformat(),
             "likesCount": post.likesCount,
-            "likedBy": post.likedBy or [],
-            "comments": post.comments or [],
-            "commentsCount": len(post.comments or []),
+            "likedBy": likers[post.postID],
+            "liked": post.postID in liked_ids,
+            "comments": recent_comments[post.postID],
+            "commentsCount": post.commentsCount,
         })
     return result
+
+
+def listAllPosts(viewer_id: str = None) -> list:
+    """Return serialized posts with author names and comment counts."""
+    rows = _feedQuery().order_by(BoardPost.postedDate.desc(), BoardPost.postID.desc()).all()
+    return _serializeFeedRows(rows, viewer_id)
+
+
+def listPostFeed(limit: int = 50, cursor: str = None, board_id: str = None, viewer_id: str = None) -> dict:
+    """Keyset-paginated feed seeking on (postedDate, postID), newest first.
+    Returns {"posts": [...], "nextCursor": token or None}; raises ValueError for a bad cursor.
+    """
+    limit = min(max(int(limit or 50), 1), 100)
+    rows, next_cursor = _keyset_page(
+        _feedQuery(board_id), [BoardPost.postedDate, BoardPost.postID], cursor, limit,
+        key=lambda row: [row[0].postedDate, row[0].postID],
+    )
+    return {"posts": _serializeFeedRows(rows, viewer_id), "nextCursor": next_cursor}
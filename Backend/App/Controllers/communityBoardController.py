@@ -1,7 +1,13 @@
-from datetime import datetime
+import logging
+from datetime import datetime, timezone
 from uuid import uuid4
+from sqlalchemy import and_, case, func
+from sqlalchemy.orm import aliased
+from sqlalchemy.exc import IntegrityError
 from App.database import db
-from App.Models import CommunityBoard, BoardPost, Job, Event, Alumni
+from App.Models import CommunityBoard, BoardMember, BoardPost, Job, Event, User
+
+LOGGER = logging.getLogger(__name__)
 
 
 def listAllPostsRaw() -> list:
@@ -9,25 +15,43 @@ def listAllPostsRaw() -> list:
     return BoardPost.query.order_by(BoardPost.postedDate.desc()).all()
 
 
-def listBoardMembers(board_id: str) -> list:
-    """Return list of members (alumni) for a board."""
+def isBoardMember(board_id: str, alumni_id: str) -> bool:
+    """Single probe on the (boardID, alumniID) unique index."""
+    return db.session.query(BoardMember.membershipID).filter_by(boardID=board_id, alumniID=alumni_id).first() is not None
+
+
+def listBoardMembers(board_id: str, limit: int = None, offset: int = 0, include_email: bool = True) -> list:
+    """Return members of a board from one joined query, owner first then by name.
+    `limit`/`offset` paginate; `include_email=False` skips the email column for lightweight listings.
+    """
     board = db.session.get(CommunityBoard, board_id)
     if not board:
         raise ValueError("Board not found")
 
-    member_ids = list({*(board.memberIDs or []), board.alumniID})
+    columns = [User.userID, User.name, User.role] + ([User.email] if include_email else [])
+    query = (
+        db.session.query(*columns)
+        .join(BoardMember, BoardMember.alumniID == User.userID)
+        .filter(BoardMember.boardID == board_id)
+        .order_by(case((User.userID == board.alumniID, 0), else_=1), User.name.asc(), User.userID.asc())
+    )
+    if limit is not None:
+        limit = min(max(int(limit or 100), 1), 500)
+        offset = max(int(offset or 0), 0)
+        query = query.offset(offset).limit(limit)
+
     members = []
-    for uid in member_ids:
-        alumni = db.session.get(Alumni, uid)
-        if alumni:
-            members.append({
-                "userID": alumni.alumniID,
-                "name": alumni.name,
-                "email": alumni.email,
-                "role": "alumni",
-                "avatar": f"https://ui-avatars.com/api/?name={alumni.name}&background=random",
-                "isAdmin": (uid == board.alumniID)
-            })
+    for row in query.all():
+        member = {
+            "userID": row.userID,
+            "name": row.name,
+            "role": row.role,
+            "avatar": f"https://ui-avatars.com/api/?name={row.name}&background=random",
+            "isAdmin": (row.userID == board.alumniID)
+        }
+        if include_email:
+            member["email"] = row.email
+        members.append(member)
     return members
 
 
@@ -39,9 +63,10 @@ def createBoard(owner_id: str, name: str, description: str = None) -> str:
         alumniID=owner_id,
         name=name.strip(),
         description=description.strip() if description else None,
-        memberIDs=[owner_id],
+        memberIDs=[],
     )
     db.session.add(board)
+    db.session.add(BoardMember(boardID=board.boardID, alumniID=owner_id, role="owner"))
     db.session.commit()
     return board.boardID
 
@@ -50,11 +75,13 @@ def joinBoard(alumni_id: str, board_id: str) -> None:
     board = db.session.get(CommunityBoard, board_id)
     if not board:
         raise ValueError("Board not found")
-    members = board.memberIDs or []
-    if alumni_id in members or alumni_id == board.alumniID:
+    if alumni_id == board.alumniID:
+        raise ValueError("Already a member of the board")
+    try:
+        with db.session.begin_nested():
+            db.session.add(BoardMember(boardID=board_id, alumniID=alumni_id, role="member"))
+    except IntegrityError:
         raise ValueError("Already a member of the board")
-    members.append(alumni_id)
-    board.memberIDs = members
     db.session.commit()
 
 
@@ -64,30 +91,92 @@ def leaveBoard(alumni_id: str, board_id: str) -> None:
         raise ValueError("Board not found")
     if board.alumniID == alumni_id:
         raise ValueError("Community admin cannot leave their own board")
-    members = board.memberIDs or []
-    if alumni_id not in members:
+    removed = BoardMember.query.filter_by(boardID=board_id, alumniID=alumni_id).delete(synchronize_session=False)
+    if not removed:
         raise ValueError("Not a member of the board")
-    members = [mid for mid in members if mid != alumni_id]
-    board.memberIDs = members
     db.session.commit()
 
 
-def listBoardsForUser(alumni_id: str) -> list:
-    boards = CommunityBoard.query.all()
+def listBoardsForUser(alumni_id: str, search: str = None, limit: int = None, offset: int = 0) -> list:
+    """List boards with owner name, member count and the caller's membership flag in one query.
+    Optional `search` is a case-insensitive substring match on the name, with LIKE wildcards
+    in it matched literally; the leading wildcard means it scans rather than seeks the name
+    index. `limit`/`offset` paginate (ordered by name).
+    """
+    member_counts = (
+        db.session.query(BoardMember.boardID, func.count(BoardMember.membershipID).label("members"))
+        .group_by(BoardMember.boardID)
+        .subquery()
+    )
+    mine = aliased(BoardMember)
+    query = (
+        db.session.query(
+            CommunityBoard,
+            User.name,
+            func.coalesce(member_counts.c.members, 0),
+            mine.membershipID,
+        )
+        .outerjoin(User, User.userID == CommunityBoard.alumniID)
+        .outerjoin(member_counts, member_counts.c.boardID == CommunityBoard.boardID)
+        .outerjoin(mine, and_(mine.boardID == CommunityBoard.boardID, mine.alumniID == alumni_id))
+    )
+    if search and search.strip():
+        term = search.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        query = query.filter(CommunityBoard.name.ilike(f"%{term}%", escape="\\"))
+    query = query.order_by(CommunityBoard.name.asc(), CommunityBoard.boardID.asc())
+    if limit is not None:
+        limit = min(max(int(limit or 50), 1), 200)
+        offset = max(int(offset or 0), 0)
+        query = query.offset(offset).limit(limit)
+
     results = []
-    for board in boards:
-        member_ids = board.memberIDs or []
-        if board.alumniID not in member_ids:
-            member_ids.append(board.alumniID)
+    for board, owner_name, members, membership_id in query.all():
         results.append({
             "board": board,
-            "members": len(member_ids),
-            "isMember": alumni_id in member_ids,
-            "adminName": board.owner.name if board.owner else None
+            "members": members,
+            "isMember": membership_id is not None or board.alumniID == alumni_id,
+            "adminName": owner_name
         })
     return results
 
 
+def migrateLegacyMembers() -> dict:
+    """Move membership stored in the legacy CommunityBoard.memberIDs JSON column into board_members.
+    Also guarantees every owner has an "owner" row. IDs of users that no longer exist are logged and
+    counted as skipped. Idempotent; returns {"inserted": n, "skipped": n}.
+    """
+    inserted = skipped = 0
+    for board in CommunityBoard.query.order_by(CommunityBoard.boardID).all():
+        wanted = list(dict.fromkeys([board.alumniID, *(board.memberIDs or [])]))
+        known = {row.userID for row in db.session.query(User.userID).filter(User.userID.in_(wanted))}
+        unknown = [uid for uid in wanted if uid not in known]
+        if unknown:
+            LOGGER.warning("Board %s: skipped memberships of unknown users %s", board.boardID, unknown)
+            skipped += len(unknown)
+        wanted = [uid for uid in wanted if uid in known]
+        existing = {
+            row.alumniID for row in
+            db.session.query(BoardMember.alumniID).filter(BoardMember.boardID == board.boardID, BoardMember.alumniID.in_(wanted))
+        }
+        new_rows = [
+            {
+                "membershipID": str(uuid4()),
+                "boardID": board.boardID,
+                "alumniID": uid,
+                "role": "owner" if uid == board.alumniID else "member",
+                "joinedAt": datetime.now(timezone.utc),
+            }
+            for uid in wanted if uid not in existing
+        ]
+        if new_rows:
+            db.session.execute(BoardMember.__table__.insert(), new_rows)
+            inserted += len(new_rows)
+        if board.memberIDs:
+            board.memberIDs = []
+        db.session.commit()
+    return {"inserted": inserted, "skipped": skipped}
+
+
 def viewBoardDetails(board_id: str, alumni_id: str = None) -> dict:
     board = db.session.get(CommunityBoard, board_id)
     if not board:
@@ -110,8 +199,7 @@ def createPostInBoard(board_id: str, alumni_id: str, content: str) -> str:
     if not board:
         raise ValueError("Board not found")
 
-    member_ids = list({*(board.memberIDs or []), board.alumniID})
-    if alumni_id not in member_ids:
+    if alumni_id != board.alumniID and not isBoardMember(board_id, alumni_id):
         raise PermissionError("Join the board before contributing")
 
     if not content.strip():
@@ -1,8 +1,13 @@
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
 from flask import current_app
+from sqlalchemy import and_, exists, literal, select, tuple_, union_all
+from sqlalchemy.exc import IntegrityError
 from App.database import db
-from App.Models import Event, EventRegistration, Message
-from App.Controllers import eventRegistrationControllers
+from App.Models import Conversation, Event, EventRegistration, Message
+from App.Controllers import eventRegistrationControllers, messageController, taskController
+from App.utils import _sql_uuid
+
+REMINDER_KEY_PREFIX = "reminder:"
 
 
 def listRegisteredEvents(alumni_id: str) -> list:
@@ -11,8 +16,13 @@ def listRegisteredEvents(alumni_id: str) -> list:
     return [reg.eventID for reg in registrations]
 
 
-def registerEvent(event_id: str, alumni_id: str) -> dict:
-    """Register an alumni for an event (non-toggle)."""
+def registerEvent(event_id: str, alumni_id: str, waitlist: bool = False) -> dict:
+    """Register an alumni for an event (non-toggle). With `waitlist`, a full event queues them instead."""
+    if waitlist:
+        result = eventRegistrationControllers.registerOrWaitlist(event_id, alumni_id)
+        if result["status"] == "waitlisted":
+            return {"registered": False, "waitlisted": True, "position": result["position"]}
+        return {"registered": True, "registrationID": result["registrationID"]}
     reg_id = eventRegistrationControllers.registerForEvent(event_id, alumni_id)
     return {"registered": True, "registrationID": reg_id}
 
@@ -75,25 +85,132 @@ def reopenEvent(event_id: str, requester_id: str, is_admin: bool = False) -> Non
     db.session.commit()
 
 
-def sendReminders(event_id: str, sender_id: str) -> int:
+def _reminderPairs(event: Event, sender_id: str):
+    """(ownerID, peerID) of the sender's conversation with each registered attendee of `event`."""
+    return select(literal(sender_id).label("ownerID"), EventRegistration.attendeeID.label("peerID")).where(
+        EventRegistration.eventID == event.eventID, EventRegistration.status == "registered"
+    )
+
+
+def _reminderAudience(event_id: str, sender_id: str) -> int:
+    """Registered attendees who can receive a reminder from `sender_id` (everyone but the sender)."""
+    return EventRegistration.query.filter(
+        EventRegistration.eventID == event_id, EventRegistration.status == "registered",
+        EventRegistration.attendeeID != sender_id,
+    ).count()
+
+
+def _reminderSelect(event: Event, sender_id: str, sent_at: datetime):
+    """SELECT one reminder row per registered attendee of `event` who has not already received one.
+    The dedup key includes the event's schedule, so rescheduling allows a fresh round. Each row lands in
+    the sender's conversation with the attendee; the sender's own registration has no thread and is skipped.
+    """
+    content = f"Reminder: {event.title} is on {event.date.isoformat()} at {event.time.strftime('%I:%M %p').lstrip('0')}."
+    dedup_key = literal(f"{REMINDER_KEY_PREFIX}{event.eventID}:{event.date.isoformat()}T{event.time.isoformat()}:") + EventRegistration.attendeeID
+    return select(
+        _sql_uuid(db.engine.dialect.name),
+        literal(sender_id),
+        EventRegistration.attendeeID,
+        literal(content),
+        literal(sent_at, db.DateTime),
+        literal("sent"),
+        literal([], db.JSON),
+        dedup_key,
+        Conversation.threadID,
+    ).join(
+        Conversation, and_(Conversation.ownerID == literal(sender_id), Conversation.peerID == EventRegistration.attendeeID)
+    ).where(
+        EventRegistration.eventID == event.eventID,
+        EventRegistration.status == "registered",
+        ~exists().where(Message.dedupKey == dedup_key),
+    )
+
+
+def _insertReminders(selects: list, pairs: list, sent_at: datetime) -> int:
+    """Create missing threads, insert the reminder rows and update their threads; the caller commits."""
+    messageController.ensureThreads(union_all(*pairs) if len(pairs) > 1 else pairs[0])
+    rows = union_all(*selects) if len(selects) > 1 else selects[0]
+    sent = db.session.execute(Message.__table__.insert().from_select(
+        ["messageID", "senderID", "receiverID", "content", "timestamp", "status", "attachments", "dedupKey", "threadID"], rows
+    )).rowcount
+    if sent:
+        messageController.recordBulkInThreads(Message.query.filter(
+            Message.timestamp == sent_at, Message.dedupKey.startswith(REMINDER_KEY_PREFIX, autoescape=True)
+        ))
+    return sent
+
+
+def dispatchReminders(event_id: str, sender_id: str, task_id: str = None) -> dict:
+    """Send reminders for an event in one set-based statement.
+    Returns {"sent": n, "skipped": m} where skipped attendees had already been reminded.
+    """
     event = db.session.get(Event, event_id)
     if not event:
         raise ValueError("Event not found")
-    
-    registrations = EventRegistration.query.filter_by(eventID=event_id, status="registered").all()
-    count = 0
-    for reg in registrations:
-        reminder = Message(
-            senderID=sender_id,
-            receiverID=reg.attendeeID,
-            content=f"Reminder: {event.title} is on {event.date.isoformat()} at {event.time.strftime('%I:%M %p').lstrip('0')}.",
-            status="sent",
-            attachments=[]
-        )
-        db.session.add(reminder)
-        count += 1
+    registered = _reminderAudience(event_id, sender_id)
+    sent_at = datetime.now(timezone.utc)
+    try:
+        sent = _insertReminders([_reminderSelect(event, sender_id, sent_at)], [_reminderPairs(event, sender_id)], sent_at)
+    except IntegrityError:
+        # A concurrent dispatch inserted some of the same keys; the anti-join now skips them
+        db.session.rollback()
+        event = db.session.get(Event, event_id)
+        sent_at = datetime.now(timezone.utc)
+        sent = _insertReminders([_reminderSelect(event, sender_id, sent_at)], [_reminderPairs(event, sender_id)], sent_at)
+    if task_id:
+        taskController.updateTaskProgress(task_id, registered)
     db.session.commit()
-    return count
+    return {"sent": sent, "skipped": max(registered - sent, 0)}
+
+
+def sendReminders(event_id: str, sender_id: str) -> int:
+    return dispatchReminders(event_id, sender_id)["sent"]
+
+
+def startReminders(event_id: str, sender_id: str) -> dict:
+    """Queue reminder dispatch as a background task; returns {"taskID", "registeredCount"}."""
+    if not db.session.get(Event, event_id):
+        raise ValueError("Event not found")
+    registered = _reminderAudience(event_id, sender_id)
+    task_id = taskController.createTask("reminders", created_by=sender_id, total=registered)
+    taskController.runTask(task_id, dispatchReminders, event_id, sender_id)
+    return {"taskID": task_id, "registeredCount": registered}
+
+
+def _upcomingEventsQuery(start: datetime, end: datetime):
+    """Active events whose (date, time) falls within [start, end]; served by ix_events_schedule."""
+    return Event.query.filter(
+        tuple_(Event.date, Event.time) >= tuple_(start.date(), start.time()),
+        tuple_(Event.date, Event.time) <= tuple_(end.date(), end.time()),
+        Event.status.in_(["active", "approved"]),
+    ).order_by(Event.date, Event.time, Event.eventID)
+
+
+def sendUpcomingReminders(window_hours: float = 24, now: datetime = None, batch_size: int = 100) -> dict:
+    """Remind attendees of every event starting within `window_hours` of `now` (local time).
+    Events are batched into one UNION ALL INSERT ... SELECT per `batch_size` events, sent in the
+    creator's name. Dedup keys record who was reminded, so repeated passes only reach new registrants.
+    Returns {"events": n, "sent": m}.
+    """
+    now = now or datetime.now()
+    events = _upcomingEventsQuery(now, now + timedelta(hours=window_hours)).all()
+    sent = 0
+    for start in range(0, len(events), batch_size):
+        chunk = events[start:start + batch_size]
+        sent_at = datetime.now(timezone.utc)
+        try:
+            sent += _insertReminders(
+                [_reminderSelect(event, event.alumniID, sent_at) for event in chunk],
+                [_reminderPairs(event, event.alumniID) for event in chunk],
+                sent_at,
+            )
+            db.session.commit()
+        except IntegrityError:
+            # Overlapping with a manual dispatch; retry the chunk event by event
+            db.session.rollback()
+            for event in chunk:
+                sent += dispatchReminders(event.eventID, event.alumniID)["sent"]
+    return {"events": len(events), "sent": sent}
 
 
 def listEvents(status: str = "active", limit: int = None, offset: int = 0, current_user=None) -> list:
@@ -121,3 +238,19 @@ def listEvents(status: str = "active", limit: int = None, offset: int = 0, curre
             ev_dict["registered"] = ev.eventID in registered_ids
         result.append(ev_dict)
     return result
+
+
+def getEventForUser(event_id: str, user=None) -> dict:
+    """Fetch one event by primary key with its seat counter and the user's registered flag.
+    Raises ValueError if the event does not exist.
+    """
+    event = db.session.get(Event, event_id)
+    if not event:
+        raise ValueError("Event not found")
+    ev_dict = event.to_dict()
+    if user is not None and getattr(user, "role", None) == "alumni":
+        reg_status = db.session.query(EventRegistration.status).filter_by(
+            eventID=event_id, attendeeID=user.userID
+        ).scalar()
+        ev_dict["registered"] = reg_status == "registered"
+    return ev_dict
@@ -1,8 +1,73 @@
 # File: Backend/App/Controllers/eventRegistrationControllers.py
 
-from datetime import datetime, timezone
+import hashlib
+import zlib
+from datetime import date, datetime, timezone
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from App.database import db
-from App.Models import Event, EventRegistration, Message, User
+from App.Models import Event, EventRegistration, User, WaitlistEntry
+from App.Controllers import messageController
+
+# Registration statuses that occupy a seat and are counted in Event.registeredCount
+SEAT_STATUSES = ("registered", "checked_in")
+BULK_CHECK_IN_LIMIT = 500
+REPLAY_CHECK_IN_LIMIT = 2000
+
+
+def _reserveSeat(event_id: str) -> bool:
+    """Atomically take one seat; the WHERE clause makes overbooking impossible under concurrency."""
+    return bool(Event.query.filter(
+        Event.eventID == event_id, Event.registeredCount < Event.maxAttendees
+    ).update({Event.registeredCount: Event.registeredCount + 1}, synchronize_session=False))
+
+
+def _freeSeat(event_id: str) -> None:
+    Event.query.filter(Event.eventID == event_id, Event.registeredCount > 0).update(
+        {Event.registeredCount: Event.registeredCount - 1}, synchronize_session=False
+    )
+
+
+def _promoteNextWaitlisted(event_id: str):
+    """Pop the head of the event's waitlist into the seat the caller holds and queue a message
+    telling the attendee, all in the caller's transaction. The pop is a single seek on
+    uq_event_waitlist_position; on PostgreSQL, concurrent promoters skip a head row another holds.
+    Returns the promoted attendee ID, or None if nobody is waiting.
+    """
+    while True:
+        entry = (
+            WaitlistEntry.query.filter_by(eventID=event_id)
+            .order_by(WaitlistEntry.position)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if not entry:
+            return None
+        attendee_id = entry.attendeeID
+        # A concurrent promotion may have popped the same head; only the deleter wins it
+        if not WaitlistEntry.query.filter_by(entryID=entry.entryID).delete(synchronize_session=False):
+            continue
+        existing = EventRegistration.query.filter_by(eventID=event_id, attendeeID=attendee_id).first()
+        if existing and existing.status in SEAT_STATUSES:
+            continue
+        if existing:
+            existing.status = "registered"
+        else:
+            db.session.add(EventRegistration(eventID=event_id, attendeeID=attendee_id, status="registered"))
+        event = db.session.get(Event, event_id)
+        messageController.sendSystemMessage(
+            event.alumniID, attendee_id, f"A seat opened up: you are now registered for the event '{event.title}'."
+        )
+        return attendee_id
+
+
+def _releaseSeat(event_id: str):
+    """Hand a freed seat to the next waitlisted attendee, or return it to the pool."""
+    promoted = _promoteNextWaitlisted(event_id)
+    if promoted is None:
+        _freeSeat(event_id)
+    return promoted
+
 
 def registerForEvent(event_id: str, attendee_id: str, payment_status: str = "pending") -> str:
     event = db.session.get(Event, event_id)
@@ -10,19 +75,41 @@ def registerForEvent(event_id: str, attendee_id: str, payment_status: str = "pen
         raise ValueError("Event not available")
     
     existing = EventRegistration.query.filter_by(eventID=event_id, attendeeID=attendee_id).first()
-    if existing:
+    if existing and (existing.status in SEAT_STATUSES or existing.status == "waitlisted"):
         raise ValueError("Already registered")
     
-    if EventRegistration.query.filter_by(eventID=event_id, status="registered").count() >= event.maxAttendees:
+    if not _reserveSeat(event_id):
         raise ValueError("Event is full")
     
-    registration = EventRegistration(
-        eventID=event_id,
-        attendeeID=attendee_id,
-        status="registered",
-        paymentStatus=payment_status
-    )
-    db.session.add(registration)
+    if existing:
+        # Reuse a cancelled registration, as _promoteNextWaitlisted does; the status guard
+        # lets only one of two concurrent re-registrations claim it
+        reused = EventRegistration.query.filter_by(
+            registrationID=existing.registrationID, status=existing.status
+        ).update({
+            EventRegistration.status: "registered",
+            EventRegistration.paymentStatus: payment_status,
+            EventRegistration.registrationDate: date.today(),
+            EventRegistration.checkedInAt: None,
+        }, synchronize_session=False)
+        if not reused:
+            db.session.rollback()
+            raise ValueError("Already registered")
+        registration = existing
+    else:
+        registration = EventRegistration(
+            eventID=event_id,
+            attendeeID=attendee_id,
+            status="registered",
+            paymentStatus=payment_status
+        )
+        db.session.add(registration)
+        try:
+            db.session.flush()
+        except IntegrityError:
+            # Concurrent duplicate registration; rolling back also returns the reserved seat
+            db.session.rollback()
+            raise ValueError("Already registered")
     db.session.commit()
 
     # Send confirmation message to attendee
@@ -32,18 +119,14 @@ def registerForEvent(event_id: str, attendee_id: str, payment_status: str = "pen
         sender_id = admin.userID if admin else None
         
         if sender_id:
-            confirmation_msg = Message(
-                senderID=sender_id,
-                receiverID=attendee_id,
-                content=f"You have successfully registered for the event '{event.title}'. We look forward to seeing you!",
-                status="sent",
-                attachments=[]
+            messageController.sendSystemMessage(
+                sender_id, attendee_id,
+                f"You have successfully registered for the event '{event.title}'. We look forward to seeing you!",
             )
-            db.session.add(confirmation_msg)
             db.session.commit()
     except Exception:
         # Non‑critical; don't fail registration
-        pass
+        db.session.rollback()
 
     return registration.registrationID
 
@@ -54,10 +137,107 @@ def cancelRegistration(registration_id: str, requester_id: str, is_admin: bool =
         raise ValueError("Registration not found")
     if not is_admin and reg.attendeeID != requester_id:
         raise PermissionError("Only the attendee or admin can cancel this registration")
-    reg.status = "cancelled"
+    # Conditional UPDATE so two concurrent cancels release the seat only once
+    released = EventRegistration.query.filter(
+        EventRegistration.registrationID == registration_id, EventRegistration.status.in_(SEAT_STATUSES)
+    ).update({"status": "cancelled"}, synchronize_session=False)
+    if released:
+        _releaseSeat(reg.eventID)
+    else:
+        reg.status = "cancelled"
+    db.session.commit()
+
+
+def joinWaitlist(event_id: str, attendee_id: str) -> int:
+    """Queue an attendee for a full event; returns their waitlist position."""
+    event = db.session.get(Event, event_id)
+    if not event or event.status not in {"active", "approved"}:
+        raise ValueError("Event not available")
+    if db.session.query(EventRegistration.registrationID).filter(
+        EventRegistration.eventID == event_id, EventRegistration.attendeeID == attendee_id,
+        EventRegistration.status.in_(SEAT_STATUSES),
+    ).first():
+        raise ValueError("Already registered")
+    if event.registeredCount < event.maxAttendees:
+        raise ValueError("Event still has seats available; register instead")
+    Event.query.filter_by(eventID=event_id).update(
+        {Event.waitlistTail: Event.waitlistTail + 1}, synchronize_session=False
+    )
+    position = db.session.query(Event.waitlistTail).filter_by(eventID=event_id).scalar()
+    db.session.add(WaitlistEntry(eventID=event_id, attendeeID=attendee_id, position=position))
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()
+        raise ValueError("Already on the waitlist")
+    db.session.commit()
+    return position
+
+
+def registerOrWaitlist(event_id: str, attendee_id: str, payment_status: str = "pending") -> dict:
+    """Register if a seat is free, otherwise join the waitlist.
+    Returns {"status": "registered", "registrationID"} or {"status": "waitlisted", "position"}.
+    """
+    try:
+        return {"status": "registered", "registrationID": registerForEvent(event_id, attendee_id, payment_status)}
+    except ValueError as e:
+        if str(e) != "Event is full":
+            raise
+    return {"status": "waitlisted", "position": joinWaitlist(event_id, attendee_id)}
+
+
+def getWaitlistStatus(event_id: str, attendee_id: str) -> dict:
+    """Return the attendee's ticket position and how many people are ahead of them."""
+    position = db.session.query(WaitlistEntry.position).filter_by(eventID=event_id, attendeeID=attendee_id).scalar()
+    if position is None:
+        raise ValueError("Not on the waitlist")
+    ahead = WaitlistEntry.query.filter(WaitlistEntry.eventID == event_id, WaitlistEntry.position < position).count()
+    return {"eventID": event_id, "position": position, "ahead": ahead}
+
+
+def leaveWaitlist(event_id: str, attendee_id: str) -> None:
+    removed = WaitlistEntry.query.filter_by(eventID=event_id, attendeeID=attendee_id).delete(synchronize_session=False)
+    if not removed:
+        raise ValueError("Not on the waitlist")
     db.session.commit()
 
 
+def fillFromWaitlist(event_id: str) -> list:
+    """Promote waitlisted attendees into any free seats; returns the promoted attendee IDs."""
+    promoted = []
+    while _reserveSeat(event_id):
+        attendee_id = _promoteNextWaitlisted(event_id)
+        if attendee_id is None:
+            _freeSeat(event_id)
+            break
+        promoted.append(attendee_id)
+    db.session.commit()
+    return promoted
+
+
+def reconcileSeatCounts(event_id: str = None) -> int:
+    """Recompute Event.registeredCount from registrations in one UPDATE and refill freed seats
+    from waitlists. Returns the number of events whose counter had drifted.
+    """
+    held = select(func.count(EventRegistration.registrationID)).where(
+        EventRegistration.eventID == Event.eventID, EventRegistration.status.in_(SEAT_STATUSES)
+    ).scalar_subquery()
+    query = Event.query.filter(Event.registeredCount != held)
+    if event_id:
+        query = query.filter(Event.eventID == event_id)
+    fixed = query.update({Event.registeredCount: held}, synchronize_session=False)
+    db.session.commit()
+
+    waiting = db.session.query(WaitlistEntry.eventID).join(Event, Event.eventID == WaitlistEntry.eventID).filter(
+        Event.registeredCount < Event.maxAttendees
+    )
+    if event_id:
+        waiting = waiting.filter(WaitlistEntry.eventID == event_id)
+    for (waiting_event_id,) in waiting.distinct().all():
+        fillFromWaitlist(waiting_event_id)
+    return fixed
+
+
 def checkIn(registration_id: str) -> None:
     reg = db.session.get(EventRegistration, registration_id)
     if not reg:
@@ -66,4 +246,161 @@ def checkIn(registration_id: str) -> None:
         raise ValueError("Only registered attendees can check in")
     reg.status = "checked_in"
     reg.checkedInAt = datetime.now(timezone.utc)
-    db.session.commit()
\ No newline at end of file
+    db.session.commit()
+
+def _requireDoorAccess(event_id: str, requester_id: str, is_admin: bool) -> Event:
+    event = db.session.get(Event, event_id)
+    if not event:
+        raise ValueError("Event not found")
+    if not is_admin and event.alumniID != requester_id:
+        raise PermissionError("Only the event organizer or an admin can check in attendees")
+    return event
+
+
+def bulkCheckIn(event_id: str, requester_id: str, registration_ids: list = None, attendee_ids: list = None,
+                is_admin: bool = False) -> list:
+    """Check in a batch of registrations (by registration or attendee ID) with one UPDATE.
+    Idempotent: each requested ID gets a result of checked_in, already_checked_in,
+    not_registered (e.g. cancelled) or not_found, so scanners can retry a batch safely.
+    """
+    _requireDoorAccess(event_id, requester_id, is_admin)
+    for field, ids in (("registrationIDs", registration_ids), ("attendeeIDs", attendee_ids)):
+        if ids is not None and (not isinstance(ids, list) or not all(isinstance(item_id, str) for item_id in ids)):
+            raise ValueError(f"{field} must be a list of strings")
+    registration_ids = list(dict.fromkeys(registration_ids or []))
+    attendee_ids = list(dict.fromkeys(attendee_ids or []))
+    if not registration_ids and not attendee_ids:
+        raise ValueError("registrationIDs or attendeeIDs are required")
+    if len(registration_ids) + len(attendee_ids) > BULK_CHECK_IN_LIMIT:
+        raise ValueError(f"At most {BULK_CHECK_IN_LIMIT} check-ins per batch")
+
+    matches = or_(EventRegistration.registrationID.in_(registration_ids), EventRegistration.attendeeID.in_(attendee_ids))
+    before = {
+        (row.registrationID, row.attendeeID): row.status
+        for row in db.session.query(
+            EventRegistration.registrationID, EventRegistration.attendeeID, EventRegistration.status
+        ).filter(EventRegistration.eventID == event_id, matches)
+    }
+    EventRegistration.query.filter(
+        EventRegistration.eventID == event_id, EventRegistration.status == "registered", matches
+    ).update({"status": "checked_in", "checkedInAt": datetime.now(timezone.utc)}, synchronize_session=False)
+    db.session.commit()
+
+    by_registration = {reg_id: status for (reg_id, _), status in before.items()}
+    by_attendee = {attendee_id: status for (_, attendee_id), status in before.items()}
+    outcome = {"registered": "checked_in", "checked_in": "already_checked_in"}
+    results = []
+    for kind, ids, lookup in (("registrationID", registration_ids, by_registration), ("attendeeID", attendee_ids, by_attendee)):
+        for item_id in ids:
+            status = lookup.get(item_id)
+            result = "not_found" if status is None else outcome.get(status, "not_registered")
+            results.append({kind: item_id, "result": result})
+    return results
+
+
+def checkInCode(event_id: str, attendee_id: str, registration_id: str) -> str:
+    """Short badge code; mixing in the random registration ID keeps it unguessable from attendee IDs."""
+    return hashlib.sha256(f"{event_id}:{attendee_id}:{registration_id}".encode("utf-8")).hexdigest()[:10]
+
+
+def exportCheckInSnapshot(event_id: str, requester_id: str, is_admin: bool = False):
+    """Gzip-compressed TSV of seat holders for offline door use:
+    attendeeID, name, code, checkedIn (1/0), one line each after a header row.
+    Access is checked up front; the returned iterator then yields compressed chunks
+    as rows are read, so the snapshot is never held in memory.
+    """
+    _requireDoorAccess(event_id, requester_id, is_admin)
+    return _snapshotChunks(event_id)
+
+
+def _snapshotChunks(event_id: str):
+    rows = (
+        db.session.query(EventRegistration.registrationID, EventRegistration.attendeeID, EventRegistration.status, User.name)
+        .join(User, User.userID == EventRegistration.attendeeID)
+        .filter(EventRegistration.eventID == event_id, EventRegistration.status.in_(SEAT_STATUSES))
+        .order_by(User.name)
+        .yield_per(1000)
+    )
+    compressor = zlib.compressobj(wbits=31)  # 31: gzip container
+    yield compressor.compress(b"attendeeID\tname\tcode\tcheckedIn\n")
+    for row in rows:
+        name = " ".join((row.name or "").split())  # keep the format flat: no tabs or newlines
+        code = checkInCode(event_id, row.attendeeID, row.registrationID)
+        chunk = compressor.compress(f"{row.attendeeID}\t{name}\t{code}\t{int(row.status == 'checked_in')}\n".encode("utf-8"))
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+
+def _parseScanTime(value):
+    scanned = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if scanned.tzinfo is not None:
+        scanned = scanned.astimezone(timezone.utc).replace(tzinfo=None)
+    return scanned
+
+
+def replayOfflineCheckIns(event_id: str, requester_id: str, check_ins: list, is_admin: bool = False) -> list:
+    """Apply a log of offline scans ({"attendeeID", "code", "checkedInAt"}) recorded against a snapshot.
+    Codes are verified; each attendee's earliest scan wins, including over an existing check-in.
+    Returns one result per log entry: checked_in, already_checked_in, duplicate, not_registered,
+    not_found or invalid.
+    """
+    _requireDoorAccess(event_id, requester_id, is_admin)
+    if not isinstance(check_ins, list) or not check_ins:
+        raise ValueError("checkIns must be a non-empty list")
+    if len(check_ins) > REPLAY_CHECK_IN_LIMIT:
+        raise ValueError(f"At most {REPLAY_CHECK_IN_LIMIT} check-ins per replay")
+    if any(isinstance(item, dict) and item.get("attendeeID") is not None and not isinstance(item["attendeeID"], str)
+           for item in check_ins):
+        raise ValueError("attendeeID must be a string")
+
+    attendee_ids = {item.get("attendeeID") for item in check_ins if isinstance(item, dict) and item.get("attendeeID")}
+    registrations = {
+        row.attendeeID: row for row in db.session.query(
+            EventRegistration.registrationID, EventRegistration.attendeeID, EventRegistration.status
+        ).filter(EventRegistration.eventID == event_id, EventRegistration.attendeeID.in_(attendee_ids))
+    }
+
+    results, earliest = [], {}
+    for item in check_ins:
+        attendee_id = item.get("attendeeID") if isinstance(item, dict) else None
+        reg = registrations.get(attendee_id)
+        try:
+            scanned = _parseScanTime(item["checkedInAt"])
+        except (KeyError, TypeError, ValueError):
+            results.append({"attendeeID": attendee_id, "result": "invalid"})
+            continue
+        if reg is None:
+            results.append({"attendeeID": attendee_id, "result": "not_found"})
+        elif item.get("code") != checkInCode(event_id, attendee_id, reg.registrationID):
+            results.append({"attendeeID": attendee_id, "result": "invalid"})
+        elif reg.status not in SEAT_STATUSES:
+            results.append({"attendeeID": attendee_id, "result": "not_registered"})
+        elif attendee_id in earliest:
+            earliest[attendee_id] = min(earliest[attendee_id], scanned)
+            results.append({"attendeeID": attendee_id, "result": "duplicate"})
+        else:
+            earliest[attendee_id] = scanned
+            outcome = "checked_in" if reg.status == "registered" else "already_checked_in"
+            results.append({"attendeeID": attendee_id, "result": outcome})
+
+    if earliest:
+        table = EventRegistration.__table__
+        params = [{"attendee": attendee_id, "scanned": scanned} for attendee_id, scanned in earliest.items()]
+        # Two executemany statements: fresh check-ins, then earliest-scan-wins for existing ones
+        db.session.execute(
+            update(table).where(
+                table.c.eventID == event_id, table.c.attendeeID == bindparam("attendee"), table.c.status == "registered"
+            ).values(status="checked_in", checkedInAt=bindparam("scanned")),
+            params,
+        )
+        db.session.execute(
+            update(table).where(
+                table.c.eventID == event_id, table.c.attendeeID == bindparam("attendee"),
+                table.c.status == "checked_in",
+                or_(table.c.checkedInAt.is_(None), table.c.checkedInAt > bindparam("scanned")),
+            ).values(checkedInAt=bindparam("scanned")),
+            params,
+        )
+    db.session.commit()
+    return results
@@ -4,13 +4,16 @@ initialize.py - Database initialization and sample data seeding (200+ realistic
 import logging
 import random
 from datetime import date, time, timedelta, datetime, timezone
-from werkzeug.security import generate_password_hash
 from flask import current_app
+from sqlalchemy import inspect, literal, text
 from App.Models import (
-    User, Admin, Alumni, Profile, CommunityBoard, Job, Event, BoardPost,
-    JobApplication, Message, EventRegistration
+    User, Admin, Alumni, Profile, CommunityBoard, BoardMember, Job, Event, BoardPost,
+    JobApplication, Message, EventRegistration, PostLike, PostComment
 )
+from App.Models.user import hash_password
 from App.database import db
+from App.Controllers.eventRegistrationControllers import reconcileSeatCounts
+from App.Controllers.messageController import backfillConversations
 from uuid import uuid4
 
 LOGGER = logging.getLogger(__name__)
@@ -55,6 +58,10 @@ def add_sample_data(app=None):
 
 def _seed():
     LOGGER.info("Generating sample data...")
+    # Sample passwords use the configured method (cheap under TESTING) unless SEED_PASSWORD_HASH_METHOD
+    # overrides it; accounts seeded with another method are upgraded on first login
+    seed_method = current_app.config.get("SEED_PASSWORD_HASH_METHOD")
+    shared_password = hash_password("password123", seed_method)
     # ---- 1. Alumni (150) ----
     alumni_list = []
     alumni_map = {}
@@ -67,7 +74,7 @@ def _seed():
     for email, name, grad, fac, deg, job, co, loc in known:
         alumni = Alumni(
             email=email,
-            password=generate_password_hash(f"{name.split()[0].lower()}pass"),
+            password=hash_password(f"{name.split()[0].lower()}pass", seed_method),
             name=name,
             role="alumni",
             graduationYear=grad,
@@ -102,7 +109,7 @@ def _seed():
         co = random.choice(companies)
         alumni = Alumni(
             email=email,
-            password=generate_password_hash("password123"),
+            password=shared_password,
             name=name,
             role="alumni",
             graduationYear=grad,
@@ -153,18 +160,23 @@ def _seed():
     db.session.flush()
 
     # Assign members: each board gets 5-20 members (including owner)
+    board_members = {}
     for board in boards:
         members = random.sample(alumni_ids, k=random.randint(5, 20))
         if board.alumniID not in members:
             members.append(board.alumniID)
-        board.memberIDs = members
+        board_members[board.boardID] = members
+        db.session.add_all([
+            BoardMember(boardID=board.boardID, alumniID=uid, role="owner" if uid == board.alumniID else "member")
+            for uid in members
+        ])
     db.session.flush()
 
     # ---- 4. Jobs (60) ----
     jobs = []
     for _ in range(60):
         board = random.choice(boards)
-        poster = random.choice(board.memberIDs)
+        poster = random.choice(board_members[board.boardID])
         status = random.choice(["open", "closed", "pending_vote"])
         expiry = random_future_date()
         low = random.randint(40, 120)
@@ -206,7 +218,7 @@ def _seed():
     event_titles = ["Annual Gala", "Tech Symposium", "Career Fair", "Networking Mixer", "Alumni Lecture", "Panel Discussion", "Workshop", "Hackathon", "Charity Run", "Cultural Show", "Sport Day", "Webinar Series", "Industry Meetup", "Startup Pitch", "Book Launch", "Film Screening", "Concert", "Food Festival", "Art Exhibition", "Health Fair"]
     for _ in range(40):
         board = random.choice(boards)
-        creator = random.choice(board.memberIDs)
+        creator = random.choice(board_members[board.boardID])
         event_date = random.choice([random_future_date(), random_past_date()])
         if event_date < date.today():
             status = "cancelled"
@@ -230,33 +242,39 @@ def _seed():
 
     # ---- 6. Board Posts (200) ----
     posts = []
+    post_likers = []
+    post_comments = []
     for _ in range(200):
         board = random.choice(boards)
-        author = random.choice(board.memberIDs)
-        liked_by = random.sample(board.memberIDs, k=random.randint(0, min(10, len(board.memberIDs))))
+        author = random.choice(board_members[board.boardID])
+        liked_by = random.sample(board_members[board.boardID], k=random.randint(0, min(10, len(board_members[board.boardID]))))
         comments = []
         for _ in range(random.randint(0, 5)):
-            commenter = random.choice(board.memberIDs)
-            commenter_name = next((a.name for a in alumni_list if a.alumniID == commenter), "Alumni")
-            comments.append({
-                "commentID": str(random.randint(10000, 99999)),
-                "authorID": commenter,
-                "authorName": commenter_name,
-                "content": random.choice(["Great post!", "Thanks for sharing!", "Interesting perspective.", "I agree.", "Well said."]),
-                "time": random_past_date().isoformat(),
-                "avatar": f"https://ui-avatars.com/api/?name={commenter_name}"
-            })
+            comments.append(PostComment(
+                authorID=random.choice(board_members[board.boardID]),
+                content=random.choice(["Great post!", "Thanks for sharing!", "Interesting perspective.", "I agree.", "Well said."]),
+                time=datetime.combine(random_past_date(), random_time()),
+            ))
         post = BoardPost(
             boardID=board.boardID,
             alumniID=author,
             content=random.choice(["Excited about the upcoming event!", "Looking for job opportunities.", "Let's collaborate!", "Check out this resource.", "Happy to be part of this community."]),
             likesCount=len(liked_by),
-            likedBy=liked_by,
-            comments=comments
+            likedBy=[],
+            comments=[],
+            commentsCount=len(comments)
         )
+        post_likers.append(liked_by)
+        post_comments.append(comments)
         posts.append(post)
     db.session.add_all(posts)
     db.session.flush()
+    for post, liked_by, comments in zip(posts, post_likers, post_comments):
+        db.session.add_all([PostLike(postID=post.postID, alumniID=uid) for uid in liked_by])
+        for comment in comments:
+            comment.postID = post.postID
+        db.session.add_all(comments)
+    db.session.flush()
 
     # ---- 7. Job Applications (80) ----
     apps = []
@@ -276,10 +294,10 @@ def _seed():
     seen = set()
     for _ in range(100):
         event = random.choice(events)
-        board = db.session.get(CommunityBoard, event.boardID)
-        if not board or not board.memberIDs:
+        members = board_members.get(event.boardID)
+        if not members:
             continue
-        attendee = random.choice(board.memberIDs)
+        attendee = random.choice(members)
         key = (event.eventID, attendee)
         if key in seen:
             continue
@@ -320,13 +338,62 @@ def _seed():
     db.session.add_all(msgs)
 
     db.session.commit()
+    backfillConversations()
+    reconcileSeatCounts()
     LOGGER.info("Sample data generation complete: %d alumni, %d boards, %d jobs, %d events, %d posts, %d applications, %d registrations, %d messages",
                 len(alumni_list), len(boards), len(jobs), len(events), len(posts), len(apps), len(regs), len(msgs))
 
 
+def _add_column_sql(table, column, dialect) -> str:
+    """Render ALTER TABLE ... ADD COLUMN for a model column missing from an existing table.
+    Scalar defaults are written as a server default so existing rows get a value; NOT NULL is only
+    added alongside such a default. Foreign keys are not added here.
+    """
+    quote = dialect.identifier_preparer.quote
+    sql = f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} {column.type.compile(dialect=dialect)}"
+    default = column.default.arg if column.default is not None and column.default.is_scalar else None
+    if default is not None:
+        rendered = literal(default, column.type).compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        sql += f" DEFAULT {rendered}"
+        if not column.nullable:
+            sql += " NOT NULL"
+    return sql
+
+
+def upgrade_schema() -> list:
+    """Bring tables created by an older release up to the current models.
+    db.create_all() only creates missing tables, so columns and indexes added to existing tables
+    (post and event counters, user suspension and token/cache versions, message threads and dedup keys,
+    feed indexes) are added here. Idempotent; returns the "table.column" / index names it created.
+    """
+    connection = db.session.connection()
+    dialect = connection.dialect
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    applied = []
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in columns:
+                connection.execute(text(_add_column_sql(table, column, dialect)))
+                applied.append(f"{table.name}.{column.name}")
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in indexes:
+                index.create(bind=connection)
+                applied.append(index.name)
+    db.session.commit()
+    for change in applied:
+        LOGGER.info("Schema upgraded: %s", change)
+    return applied
+
+
 def initialize_database(app, create_default_admin=True):
     with app.app_context():
         db.create_all()
+        upgrade_schema()
         if create_default_admin:
             _create_default_admin()
 
@@ -337,7 +404,7 @@ def _create_default_admin():
         return
     admin = Admin(
         email=admin_email,
-        password=generate_password_hash("Admin@123"),
+        password=hash_password("Admin@123"),
         name="System Administrator",
         role="admin",
         adminLevel="super",
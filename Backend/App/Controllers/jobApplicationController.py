@@ -2,7 +2,8 @@
 
 from datetime import datetime, timezone
 from App.database import db
-from App.Models import Job, JobApplication, Message, User
+from App.Models import Job, JobApplication, User
+from App.Controllers import messageController
 
 
 def createApplication(alumni_id: str, job_id: str) -> dict:
@@ -36,18 +37,14 @@ def createApplication(alumni_id: str, job_id: str) -> dict:
         sender_id = admin.userID if admin else None
         
         if sender_id:
-            confirmation_msg = Message(
-                senderID=sender_id,
-                receiverID=alumni_id,
-                content=f"Your application for '{job.title}' at {job.company} has been submitted successfully. The employer will review it shortly.",
-                status="sent",
-                attachments=[]
+            messageController.sendSystemMessage(
+                sender_id, alumni_id,
+                f"Your application for '{job.title}' at {job.company} has been submitted successfully. The employer will review it shortly.",
             )
-            db.session.add(confirmation_msg)
             db.session.commit()
     except Exception:
         # Non‑critical, don't fail the application
-        pass
+        db.session.rollback()
 
     return application
 
@@ -104,14 +101,10 @@ def updateApplicationStatus(application_id: str, new_status: str, is_admin: bool
             sender_id = admin.userID if admin else None
             
             if sender_id:
-                msg = Message(
-                    senderID=sender_id,
-                    receiverID=app.alumniID,
-                    content=f"Congratulations! Your application for '{job.title}' has been approved. The employer will contact you soon.",
-                    status="sent",
-                    attachments=[]
+                messageController.sendSystemMessage(
+                    sender_id, app.alumniID,
+                    f"Congratulations! Your application for '{job.title}' has been approved. The employer will contact you soon.",
                 )
-                db.session.add(msg)
                 db.session.commit()
 
     return app
\ No newline at end of file
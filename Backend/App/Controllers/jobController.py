@@ -2,10 +2,13 @@
 
 from datetime import datetime, date, timezone
 from flask import current_app
+from sqlalchemy.orm import joinedload
 from uuid import uuid4
 
 from App.database import db
 from App.Models import Job, JobApplication, Alumni, User
+from App.utils import _keyset_page
+from App.Controllers.userCache import getUserSnapshot, invalidateUser
 
 
 def createJob(alumni_id: str, board_id: str, title: str, company: str,
@@ -58,16 +61,17 @@ def saveJob(alumni_id: str, job_id: str) -> dict:
         saved_ids.add(job_id)
         saved = True
     user.savedJobIDs = list(saved_ids)
+    invalidateUser(user)
     db.session.commit()
     return {"saved": saved, "savedJobIDs": user.savedJobIDs}
 
 
 def showSavedJobs(alumni_id: str) -> list:
     """Return list of saved job IDs."""
-    user = db.session.get(User, alumni_id)
+    user = getUserSnapshot(alumni_id)
     if not user:
         raise ValueError("User not found")
-    return user.savedJobIDs or []
+    return list(user.savedJobIDs)
 
 
 def addTestimonial(job_id: str, alumni_id: str, name: str, avatar: str, stars: int, comment: str) -> dict:
@@ -160,6 +164,26 @@ def closeJob(job_id: str, requester_id: str, is_admin: bool = False) -> None:
     db.session.commit()
 
 
+def _serializeJobs(jobs: list, current_user=None, applied_map: dict = None) -> list:
+    """Serialize jobs, adding applied/saved flags for alumni."""
+    is_alumni = current_user is not None and getattr(current_user, "role", None) == "alumni"
+    if is_alumni and applied_map is None:
+        apps = JobApplication.query.filter_by(alumniID=current_user.userID).all()
+        applied_map = {app.jobID: app.status for app in apps}
+    saved_set = set(current_user.savedJobIDs or []) if is_alumni else set()
+
+    result = []
+    for job in jobs:
+        job_dict = job.to_dict()
+        job_dict["testimonials"] = job.testimonials or []
+        if is_alumni:
+            job_dict["applied"] = job.jobID in applied_map
+            job_dict["applicationStatus"] = applied_map.get(job.jobID)
+            job_dict["saved"] = job.jobID in saved_set
+        result.append(job_dict)
+    return result
+
+
 def listJobs(status: str = "open", limit: int = None, offset: int = 0, current_user=None) -> list:
     """List jobs. If `limit` is provided returns serialized jobs with applied/saved flags for alumni.
     Otherwise returns model objects.
@@ -169,26 +193,45 @@ def listJobs(status: str = "open", limit: int = None, offset: int = 0, current_u
 
     limit = min(max(int(limit or 200), 1), 500)
     offset = max(int(offset or 0), 0)
-    query = Job.query.order_by(Job.postedDate.desc()).offset(offset).limit(limit)
+    query = Job.query.filter(Job.status == status).order_by(Job.postedDate.desc()).offset(offset).limit(limit)
     jobs = query.all()
+    return _serializeJobs(jobs, current_user)
 
-    applied_map = {}
-    saved_set = set()
-    if current_user and getattr(current_user, "role", None) == "alumni":
-        apps = JobApplication.query.filter_by(alumniID=current_user.userID).all()
+
+def listJobsPage(status: str = "open", limit: int = 50, cursor: str = None, current_user=None) -> dict:
+    """Keyset-paginated job feed seeking on (postedDate, jobID) within `status`.
+    Returns {"jobs": [...], "nextCursor": token or None}; raises ValueError for a bad cursor.
+    """
+    limit = min(max(int(limit or 50), 1), 500)
+    query = Job.query.options(joinedload(Job.poster)).filter(Job.status == status)
+    jobs, next_cursor = _keyset_page(query, [Job.postedDate, Job.jobID], cursor, limit)
+
+    applied_map = None
+    if current_user is not None and getattr(current_user, "role", None) == "alumni":
+        job_ids = [job.jobID for job in jobs]
+        apps = JobApplication.query.filter(
+            JobApplication.alumniID == current_user.userID,
+            JobApplication.jobID.in_(job_ids),
+        ).all() if job_ids else []
         applied_map = {app.jobID: app.status for app in apps}
-        saved_set = set(current_user.savedJobIDs or [])
+    return {"jobs": _serializeJobs(jobs, current_user, applied_map), "nextCursor": next_cursor}
 
-    result = []
-    for job in jobs:
-        job_dict = job.to_dict()
-        job_dict["testimonials"] = job.testimonials or []
-        if current_user and getattr(current_user, "role", None) == "alumni":
-            job_dict["applied"] = job.jobID in applied_map
-            job_dict["applicationStatus"] = applied_map.get(job.jobID)
-            job_dict["saved"] = job.jobID in saved_set
-        result.append(job_dict)
-    return result
+
+def getJobForUser(job_id: str, user=None) -> dict:
+    """Fetch one job by primary key and enrich it with the user's applied/saved flags.
+    Raises ValueError if the job does not exist.
+    """
+    job = db.session.get(Job, job_id, options=[joinedload(Job.poster)])
+    if not job:
+        raise ValueError("Job not found")
+
+    applied_map = None
+    if user is not None and getattr(user, "role", None) == "alumni":
+        app_status = db.session.query(JobApplication.status).filter_by(
+            alumniID=user.userID, jobID=job_id
+        ).limit(1).scalar()
+        applied_map = {job_id: app_status} if app_status is not None else {}
+    return _serializeJobs([job], user, applied_map)[0]
 
 
 def viewJobApplications(job_id: str, requester_id: str, is_admin: bool = False) -> list:
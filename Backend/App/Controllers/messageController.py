@@ -1,5 +1,117 @@
+from sqlalchemy import and_, exists, func, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from datetime import datetime, timezone
+from uuid import uuid4
 from App.database import db
-from App.Models import Message, User
+from App.Models import Conversation, Message, User
+from App.Controllers import announcementController
+from App.Controllers.userCache import getUserSnapshot, invalidateUser
+from App.utils import _encode_cursor, _keyset_page
+
+
+def _threadFor(user_id: str, peer_id: str) -> str:
+    """Return the threadID shared by two users, creating both participant rows on first contact."""
+    if user_id == peer_id:
+        raise ValueError("Cannot message yourself")
+    thread_id = db.session.query(Conversation.threadID).filter_by(ownerID=user_id, peerID=peer_id).scalar()
+    if thread_id:
+        return thread_id
+    thread_id = str(uuid4())
+    try:
+        with db.session.begin_nested():
+            db.session.add_all([
+                Conversation(threadID=thread_id, ownerID=user_id, peerID=peer_id),
+                Conversation(threadID=thread_id, ownerID=peer_id, peerID=user_id),
+            ])
+    except IntegrityError:
+        # A concurrent first message created the pair; reuse its thread
+        thread_id = db.session.query(Conversation.threadID).filter_by(ownerID=user_id, peerID=peer_id).scalar()
+    return thread_id
+
+
+def _recordInThread(msg: Message, count_unread: bool = True) -> None:
+    """Add `msg` to its thread and move both participants' last-message pointers in SQL.
+    The receiver's unread counter is incremented atomically in the same transaction.
+    """
+    msg.threadID = _threadFor(msg.senderID, msg.receiverID)
+    db.session.add(msg)
+    db.session.flush()
+    Conversation.query.filter(
+        Conversation.threadID == msg.threadID,
+        or_(Conversation.lastMessageID.is_(None), Conversation.lastMessageAt <= msg.timestamp),
+    ).update({"lastMessageID": msg.messageID, "lastMessageAt": msg.timestamp}, synchronize_session=False)
+    if count_unread:
+        Conversation.query.filter_by(threadID=msg.threadID, ownerID=msg.receiverID).update(
+            {Conversation.unreadCount: Conversation.unreadCount + 1}, synchronize_session=False
+        )
+
+
+def sendSystemMessage(sender_id: str, receiver_id: str, content: str):
+    """Add a notice (confirmation, promotion) to the thread shared by sender and receiver; the caller commits.
+    Self-addressed notices, e.g. to an organizer on their own event, have no thread and are skipped.
+    Returns the Message or None.
+    """
+    if sender_id == receiver_id:
+        return None
+    msg = Message(senderID=sender_id, receiverID=receiver_id, content=content, status="sent", attachments=[])
+    _recordInThread(msg)
+    return msg
+
+
+def ensureThreads(pairs) -> int:
+    """Create conversations for every distinct (ownerID, peerID) row of the `pairs` SELECT that has none.
+    Set-based senders call this before an INSERT ... SELECT that joins conversations for the threadID.
+    Only the missing ID pairs are fetched. Returns the number of threads created.
+    """
+    pairs = pairs.subquery()
+    rows = db.session.execute(
+        select(pairs.c.ownerID, pairs.c.peerID).where(
+            pairs.c.ownerID != pairs.c.peerID,
+            ~exists().where(Conversation.ownerID == pairs.c.ownerID, Conversation.peerID == pairs.c.peerID),
+        ).distinct()
+    ).all()
+    missing = list(dict.fromkeys(tuple(sorted(row)) for row in rows))
+    if not missing:
+        return 0
+    now = datetime.now(timezone.utc)
+    values = []
+    for user_id, peer_id in missing:
+        thread_id = str(uuid4())
+        for owner, peer in ((user_id, peer_id), (peer_id, user_id)):
+            values.append({"conversationID": str(uuid4()), "threadID": thread_id, "ownerID": owner,
+                           "peerID": peer, "lastMessageAt": now, "unreadCount": 0})
+    try:
+        with db.session.begin_nested():
+            db.session.execute(Conversation.__table__.insert(), values)
+    except IntegrityError:
+        # A concurrent first message created some pairs; fall back to one lookup per pair
+        for user_id, peer_id in missing:
+            _threadFor(user_id, peer_id)
+    return len(missing)
+
+
+def recordBulkInThreads(inserted) -> None:
+    """Update threads for messages written by a set-based INSERT ... SELECT, entirely in SQL.
+    `inserted` is a Message query matching exactly those rows. Both participants' last-message
+    pointers move to the newest of them, and each receiver's unread counter grows by its share.
+    """
+    new = inserted.with_entities(Message.messageID, Message.threadID, Message.receiverID, Message.timestamp).subquery()
+    in_thread = new.c.threadID == Conversation.threadID
+    latest_at = select(func.max(new.c.timestamp)).where(in_thread).scalar_subquery()
+    latest_id = (
+        select(new.c.messageID).where(in_thread)
+        .order_by(new.c.timestamp.desc(), new.c.messageID.desc()).limit(1).scalar_subquery()
+    )
+    Conversation.query.filter(
+        exists().where(in_thread),
+        or_(Conversation.lastMessageID.is_(None), Conversation.lastMessageAt <= latest_at),
+    ).update({"lastMessageID": latest_id, "lastMessageAt": latest_at}, synchronize_session=False)
+    received = and_(in_thread, new.c.receiverID == Conversation.ownerID)
+    Conversation.query.filter(exists().where(received)).update(
+        {Conversation.unreadCount: Conversation.unreadCount + select(func.count()).where(received).scalar_subquery()},
+        synchronize_session=False,
+    )
 
 
 def requestMessage(sender_id: str, receiver_id: str, content: str = None) -> str:
@@ -7,7 +119,7 @@ def requestMessage(sender_id: str, receiver_id: str, content: str = None) -> str
         raise ValueError("receiverID is required")
     if sender_id == receiver_id:
         raise ValueError("Cannot connect to yourself")
-    receiver = db.session.get(User, receiver_id)
+    receiver = getUserSnapshot(receiver_id)
     if not receiver:
         raise ValueError("Target alumni not found")
     existing = Message.query.filter_by(senderID=sender_id, receiverID=receiver_id, status="requested").first()
@@ -22,7 +134,7 @@ def requestMessage(sender_id: str, receiver_id: str, content: str = None) -> str
         status="requested",
         attachments=[]
     )
-    db.session.add(msg)
+    _recordInThread(msg)
     db.session.commit()
     return msg.messageID
 
@@ -50,10 +162,12 @@ def rejectMessageRequest(message_id: str, receiver_id: str) -> None:
 def sendMessage(sender_id: str, receiver_id: str, content: str) -> str:
     if not receiver_id or not content:
         raise ValueError("receiverID and content are required")
-    receiver = db.session.get(User, receiver_id)
+    if sender_id == receiver_id:
+        raise ValueError("Cannot message yourself")
+    receiver = getUserSnapshot(receiver_id)
     if receiver and sender_id in (receiver.blockedUserIDs or []):
         raise PermissionError("You are blocked by this user")
-    sender = db.session.get(User, sender_id)
+    sender = getUserSnapshot(sender_id)
     if sender and receiver_id in (sender.blockedUserIDs or []):
         raise PermissionError("You blocked this user")
     msg = Message(
@@ -63,22 +177,157 @@ def sendMessage(sender_id: str, receiver_id: str, content: str) -> str:
         status="sent",
         attachments=[]
     )
-    db.session.add(msg)
+    _recordInThread(msg)
     db.session.commit()
     return msg.messageID
 
 
-def showInbox(user_id: str) -> list:
-    return Message.query.filter_by(receiverID=user_id).order_by(Message.timestamp.desc()).limit(50).all()
+def _messagePage(query, limit: int = 50, cursor: str = None) -> dict:
+    """Seek one page of `query` on (timestamp, messageID), newest first.
+    Sender and receiver are joined in the same SELECT so `Message.to_dict` never lazy-loads.
+    """
+    limit = min(max(int(limit or 50), 1), 200)
+    query = query.options(
+        joinedload(Message.sender).load_only(User.name),
+        joinedload(Message.receiver).load_only(User.name),
+    )
+    messages, next_cursor = _keyset_page(query, [Message.timestamp, Message.messageID], cursor, limit)
+    return {"messages": messages, "nextCursor": next_cursor}
+
+
+def showInboxPage(user_id: str, limit: int = 50, cursor: str = None) -> dict:
+    """Return {"messages": [...], "nextCursor": token or None} for received messages.
+    Raises ValueError for a bad cursor.
+    """
+    return _messagePage(Message.query.filter_by(receiverID=user_id), limit, cursor)
+
 
+def showInboxFeed(user_id: str, limit: int = 50, cursor: str = None, include_announcements: bool = False) -> dict:
+    """Serialized inbox page with active announcements merged in at query time.
+    Both sources seek past the same (timestamp, id) cursor and are merged newest first;
+    each item carries "type" ("message" or "announcement"). Raises ValueError for a bad cursor.
+    """
+    limit = min(max(int(limit or 50), 1), 200)
+    page = showInboxPage(user_id, limit, cursor)
+    items = [(m.timestamp, m.messageID, dict(m.to_dict(), type="message")) for m in page["messages"]]
+    has_more = page["nextCursor"] is not None
+    if include_announcements:
+        announcements = announcementController.listAnnouncementsPage(user_id, limit, cursor)
+        for a in announcements["announcements"]:
+            items.append((datetime.fromisoformat(a["createdAt"]), a["announcementID"], {
+                "type": "announcement",
+                "messageID": a["announcementID"],
+                "senderID": a["authorID"],
+                "senderName": a["authorName"],
+                "receiverID": user_id,
+                "content": a["content"],
+                "timestamp": a["createdAt"],
+                "status": "read" if a["read"] else "sent",
+                "attachments": [],
+            }))
+        has_more = has_more or announcements["nextCursor"] is not None
+    items.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    has_more = has_more or len(items) > limit
+    items = items[:limit]
+    next_cursor = _encode_cursor(items[-1][0], items[-1][1]) if has_more and items else None
+    return {"messages": [item[2] for item in items], "nextCursor": next_cursor}
 
-def showSentMessages(user_id: str) -> list:
-    return Message.query.filter_by(senderID=user_id).order_by(Message.timestamp.desc()).limit(50).all()
 
+def showSentMessagesPage(user_id: str, limit: int = 50, cursor: str = None) -> dict:
+    """Return {"messages": [...], "nextCursor": token or None} for sent messages."""
+    return _messagePage(Message.query.filter_by(senderID=user_id), limit, cursor)
 
-def showMessageRequests(user_id: str) -> list:
+
+def showMessageRequestsPage(user_id: str, limit: int = 50, cursor: str = None) -> dict:
+    """Return {"messages": [...], "nextCursor": token or None} for pending requests."""
+    return _messagePage(Message.query.filter_by(receiverID=user_id, status="requested"), limit, cursor)
+
+
+def showInbox(user_id: str, limit: int = 50, cursor: str = None) -> list:
+    return showInboxPage(user_id, limit, cursor)["messages"]
+
+
+def showSentMessages(user_id: str, limit: int = 50, cursor: str = None) -> list:
+    return showSentMessagesPage(user_id, limit, cursor)["messages"]
+
+
+def showMessageRequests(user_id: str, limit: int = 50, cursor: str = None) -> list:
     """Return pending message requests for the user."""
-    return Message.query.filter_by(receiverID=user_id, status="requested").order_by(Message.timestamp.desc()).all()
+    return showMessageRequestsPage(user_id, limit, cursor)["messages"]
+
+
+def listConversations(user_id: str, limit: int = 50, cursor: str = None) -> dict:
+    """Keyset-paginated thread list for `user_id`, most recently active first.
+    One indexed query returns the peer's name, the last message preview and the unread count.
+    """
+    limit = min(max(int(limit or 50), 1), 200)
+    query = (
+        db.session.query(Conversation, User.name, Message.content, Message.senderID)
+        .join(User, User.userID == Conversation.peerID)
+        .outerjoin(Message, Message.messageID == Conversation.lastMessageID)
+        .filter(Conversation.ownerID == user_id)
+    )
+    rows, next_cursor = _keyset_page(
+        query, [Conversation.lastMessageAt, Conversation.conversationID], cursor, limit,
+        key=lambda row: [row[0].lastMessageAt, row[0].conversationID],
+    )
+    conversations = []
+    for conversation, peer_name, last_content, last_sender in rows:
+        data = conversation.to_dict()
+        data["peerName"] = peer_name
+        data["lastMessage"] = {"content": last_content, "senderID": last_sender} if last_content is not None else None
+        conversations.append(data)
+    return {"conversations": conversations, "nextCursor": next_cursor}
+
+
+def isConversationParticipant(user_id: str, thread_id: str) -> bool:
+    return db.session.query(
+        Conversation.query.filter_by(threadID=thread_id, ownerID=user_id).exists()
+    ).scalar()
+
+
+def showThreadPage(user_id: str, thread_id: str, limit: int = 50, cursor: str = None) -> dict:
+    """Return {"messages": [...], "nextCursor": token or None} for one thread the user takes part in.
+    Raises ValueError if the thread is unknown to the user or the cursor is malformed.
+    """
+    if not isConversationParticipant(user_id, thread_id):
+        raise ValueError("Conversation not found")
+    return _messagePage(Message.query.filter_by(threadID=thread_id), limit, cursor)
+
+
+def markConversationRead(user_id: str, thread_id: str) -> None:
+    updated = Conversation.query.filter_by(threadID=thread_id, ownerID=user_id).update(
+        {"unreadCount": 0}, synchronize_session=False
+    )
+    if not updated:
+        raise ValueError("Conversation not found")
+    db.session.commit()
+
+
+def backfillConversations(batch_size: int = 500) -> int:
+    """Attach messages sent before threads existed to their conversations.
+    Covers direct messages and older system notices and reminders. Backfilled messages are treated as read.
+    Legacy self-addressed messages have no conversation and are skipped. Batches seek past the last
+    (timestamp, messageID) seen, so rows that stay thread-less are never re-read.
+    Idempotent; returns the number of messages attached.
+    """
+    attached = 0
+    last = None
+    while True:
+        query = Message.query.filter(
+            Message.threadID.is_(None), Message.senderID != Message.receiverID
+        )
+        if last is not None:
+            query = query.filter(tuple_(Message.timestamp, Message.messageID) > tuple_(*last))
+        batch = query.order_by(Message.timestamp, Message.messageID).limit(batch_size).all()
+        if not batch:
+            break
+        last = (batch[-1].timestamp, batch[-1].messageID)
+        for msg in batch:
+            _recordInThread(msg, count_unread=False)
+        attached += len(batch)
+        db.session.commit()
+    return attached
 
 
 def blockUser(user_id: str, block_user_id: str) -> list:
@@ -94,5 +343,6 @@ def blockUser(user_id: str, block_user_id: str) -> list:
     else:
         blocked.add(block_user_id)
     user.blockedUserIDs = list(blocked)
+    invalidateUser(user)
     db.session.commit()
     return user.blockedUserIDs
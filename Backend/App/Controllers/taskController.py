@@ -0,0 +1,71 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from flask import current_app
+from App.database import db
+from App.Models import BackgroundTask
+
+LOGGER = logging.getLogger(__name__)
+
+# Small in-process pool: fan-out work is database bound, so a couple of workers is plenty
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="background-task")
+
+
+def createTask(kind: str, created_by: str = None, total: int = None) -> str:
+    task = BackgroundTask(kind=kind, createdBy=created_by, total=total)
+    db.session.add(task)
+    db.session.commit()
+    return task.taskID
+
+
+def getTask(task_id: str, requester_id: str = None, is_admin: bool = False) -> dict:
+    """Return a task's progress. When `requester_id` is given, only its creator or an admin may read it."""
+    task = db.session.get(BackgroundTask, task_id)
+    if not task:
+        raise ValueError("Task not found")
+    if requester_id is not None and not is_admin and task.createdBy != requester_id:
+        raise PermissionError("Not allowed to view this task")
+    return task.to_dict()
+
+
+def updateTaskProgress(task_id: str, processed: int) -> None:
+    """Stage a progress update; it is committed together with the caller's batch."""
+    BackgroundTask.query.filter_by(taskID=task_id).update({"processed": processed}, synchronize_session=False)
+
+
+def _finishTask(task_id: str, status: str, result=None, error: str = None) -> None:
+    BackgroundTask.query.filter_by(taskID=task_id).update(
+        {"status": status, "result": result, "error": error, "finishedAt": datetime.now(timezone.utc)},
+        synchronize_session=False,
+    )
+    db.session.commit()
+
+
+def _runTask(task_id: str, func, args, kwargs):
+    BackgroundTask.query.filter_by(taskID=task_id).update({"status": "running"}, synchronize_session=False)
+    db.session.commit()
+    try:
+        result = func(*args, task_id=task_id, **kwargs)
+    except Exception as e:
+        db.session.rollback()
+        LOGGER.exception("Background task %s failed", task_id)
+        _finishTask(task_id, "failed", error=str(e))
+        return
+    _finishTask(task_id, "completed", result=result)
+
+
+def runTask(task_id: str, func, *args, **kwargs) -> None:
+    """Run `func(*args, task_id=task_id, **kwargs)` and record its outcome on the task.
+    Runs on the worker pool with its own app context, or inline when BACKGROUND_TASKS_INLINE
+    is set (defaults to on under TESTING, where in-memory databases are per-connection).
+    """
+    app = current_app._get_current_object()
+    if app.config.get("BACKGROUND_TASKS_INLINE", app.testing):
+        _runTask(task_id, func, args, kwargs)
+        return
+
+    def _target():
+        with app.app_context():
+            _runTask(task_id, func, args, kwargs)
+
+    _executor.submit(_target)
@@ -0,0 +1,114 @@
+# File: App/Controllers/userCache.py
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
+
+from flask import current_app
+from App.database import db
+from App.Models import User
+
+
+# Read-only copy of the base users row; password is deliberately left out
+UserSnapshot = namedtuple("UserSnapshot", [
+    "userID", "email", "name", "role", "isApproved", "isSuspended", "suspendedUntil",
+    "notificationPreferences", "savedJobIDs", "blockedUserIDs", "cacheVersion",
+])
+
+_SNAPSHOT_COLUMNS = [getattr(User, field) for field in UserSnapshot._fields]
+
+# userID -> (snapshot, monotonic time it was last loaded or rechecked)
+_entries = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "revalidations": 0, "evictions": 0}
+
+
+def _settings():
+    config = current_app.config
+    return config.get("USER_CACHE_TTL", 5), config.get("USER_CACHE_SIZE", 2048)
+
+
+def _snapshot(row) -> UserSnapshot:
+    values = row._asdict()
+    values["notificationPreferences"] = MappingProxyType(dict(values["notificationPreferences"] or {}))
+    values["savedJobIDs"] = tuple(values["savedJobIDs"] or ())
+    values["blockedUserIDs"] = tuple(values["blockedUserIDs"] or ())
+    return UserSnapshot(**values)
+
+
+def _store(user_id: str, snapshot: UserSnapshot, size: int) -> None:
+    with _lock:
+        _entries[user_id] = (snapshot, time.monotonic())
+        _entries.move_to_end(user_id)
+        while len(_entries) > size:
+            _entries.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+def getUserSnapshot(user_id: str):
+    """
+    Return an immutable UserSnapshot for user_id, or None if the user does not exist.
+    Fresh entries are served without a query. Once an entry is older than
+    USER_CACHE_TTL seconds, a PK lookup of cacheVersion decides whether it can be
+    kept, so writes made by other workers are picked up within the TTL.
+    """
+    if not user_id:
+        return None
+    ttl, size = _settings()
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(user_id)
+        if entry is not None and now - entry[1] < ttl:
+            _entries.move_to_end(user_id)
+            _stats["hits"] += 1
+            return entry[0]
+    if entry is not None:
+        version = db.session.query(User.cacheVersion).filter(User.userID == user_id).scalar()
+        if version == entry[0].cacheVersion:
+            with _lock:
+                _stats["revalidations"] += 1
+            _store(user_id, entry[0], size)
+            return entry[0]
+    with _lock:
+        _stats["misses"] += 1
+    row = db.session.query(*_SNAPSHOT_COLUMNS).filter(User.userID == user_id).first()
+    if row is None:
+        evictUser(user_id)
+        return None
+    snapshot = _snapshot(row)
+    _store(user_id, snapshot, size)
+    return snapshot
+
+
+def invalidateUser(user: User) -> None:
+    """
+    Mark a user row as changed: bumps cacheVersion so other workers drop their
+    copy on the next recheck, and evicts the local entry. The caller commits.
+    """
+    user.cacheVersion = (user.cacheVersion or 0) + 1
+    evictUser(user.userID)
+
+
+def evictUser(user_id: str) -> None:
+    """Drop a single entry from this process's cache."""
+    with _lock:
+        _entries.pop(user_id, None)
+
+
+def clearUserCache() -> None:
+    """Empty the cache and reset its counters."""
+    with _lock:
+        _entries.clear()
+        for key in _stats:
+            _stats[key] = 0
+
+
+def userCacheStats() -> dict:
+    """Return hit/miss counters and current size for this process."""
+    with _lock:
+        stats = dict(_stats)
+        stats["size"] = len(_entries)
+    lookups = stats["hits"] + stats["revalidations"] + stats["misses"]
+    stats["hitRate"] = round((stats["hits"] + stats["revalidations"]) / lookups, 4) if lookups else 0.0
+    return stats
@@ -1,20 +1,24 @@
 # File: App/Controllers/userController.py
 
+import hashlib
 import re
-from werkzeug.security import generate_password_hash, check_password_hash
-from flask_jwt_extended import get_jwt_identity
+import secrets
+from datetime import datetime, timedelta, timezone
+from werkzeug.security import check_password_hash
 from App.database import db
-from App.Models import User, Alumni, Admin, Profile
-from App.Controllers.auth import authenticate_user, issue_access_token
+from App.Models import User, Alumni, Admin, PasswordResetToken, Profile
+from App.Models.user import hash_password
+from App.Controllers.auth import authenticate_user, issue_access_token, resolve_current_user
+from App.Controllers.userCache import getUserSnapshot, invalidateUser
 from App.utils import _to_bool
 
+PASSWORD_RESET_TTL = timedelta(hours=1)
 
-def currentUser():
-    """Retrieve current user from JWT identity. Returns User object or None."""
-    user_id = get_jwt_identity()
-    if not user_id:
-        return None
-    return db.session.get(User, user_id)
+
+def currentUser(claims_only: bool = False):
+    """Retrieve current user from JWT identity. Returns User object or None.
+    With claims_only=True returns a TokenUser (userID, role, isApproved) from the token claims."""
+    return resolve_current_user(claims_only)
 
 
 def registerUser(email: str, password: str, name: str, role: str, **kwargs) -> dict:
@@ -36,7 +40,7 @@ def registerUser(email: str, password: str, name: str, role: str, **kwargs) -> d
     if role not in {"alumni", "admin"}:
         raise ValueError("Role must be 'alumni' or 'admin'")
     
-    hashed_pw = generate_password_hash(password)
+    hashed_pw = hash_password(password)
     
     if role == "alumni":
         required = ["graduationYear", "faculty", "degree"]
@@ -137,6 +141,7 @@ def updateProfile(user_id: str, name: str = None, email: str = None) -> dict:
             raise ValueError("Email already in use")
         user.email = new_email
     
+    invalidateUser(user)
     db.session.commit()
     return user.to_dict()
 
@@ -151,16 +156,63 @@ def resetPassword(user_id: str, old_password: str, new_password: str) -> None:
     if len(new_password) < 8:
         raise ValueError("New password must be at least 8 characters")
     
-    user.password = generate_password_hash(new_password)
+    user.set_password(new_password)
+    db.session.commit()
+
+
+def _hashResetToken(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def createPasswordResetToken(email: str):
+    """Issue a reset token for the account with `email`, replacing any earlier one.
+    Returns the raw token (only its hash is stored), or None if no such account exists.
+    """
+    user_id = db.session.query(User.userID).filter_by(email=email.strip().lower()).scalar()
+    if not user_id:
+        return None
+    token = secrets.token_urlsafe(32)
+    PasswordResetToken.query.filter_by(userID=user_id).delete(synchronize_session=False)
+    db.session.add(PasswordResetToken(
+        userID=user_id,
+        tokenHash=_hashResetToken(token),
+        expiresAt=datetime.now(timezone.utc) + PASSWORD_RESET_TTL,
+    ))
+    db.session.commit()
+    return token
+
+
+def resetPasswordWithToken(token: str, new_password: str) -> None:
+    """Consume a reset token via its unique hash index and set the new password."""
+    token_hash = _hashResetToken(token)
+    row = PasswordResetToken.query.filter(
+        PasswordResetToken.tokenHash == token_hash, PasswordResetToken.expiresAt > datetime.now(timezone.utc)
+    ).first()
+    # Deleting by hash makes the token single-use even if two resets race
+    if not row or not PasswordResetToken.query.filter_by(tokenHash=token_hash).delete(synchronize_session=False):
+        raise ValueError("Invalid or expired token")
+    user = db.session.get(User, row.userID)
+    if not user:
+        raise ValueError("Invalid or expired token")
+    user.set_password(new_password)
     db.session.commit()
 
 
+def sweepExpiredResetTokens() -> int:
+    """Delete expired reset tokens; returns the number removed."""
+    removed = PasswordResetToken.query.filter(
+        PasswordResetToken.expiresAt <= datetime.now(timezone.utc)
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return removed
+
+
 def sendNotification(user_id: str, channel: str, message: str) -> dict:
     """Simulate sending a notification. Returns notification data."""
-    user = db.session.get(User, user_id)
+    user = getUserSnapshot(user_id)
     if not user:
         raise ValueError("User not found")
-    prefs = user.notificationPreferences or {}
+    prefs = user.notificationPreferences
     if not prefs.get(channel, False):
         raise ValueError(f"{channel} notifications are disabled for this user")
     
@@ -174,10 +226,10 @@ def sendNotification(user_id: str, channel: str, message: str) -> dict:
 
 def showNotificationPreferences(user_id: str) -> dict:
     """Return user's notification preferences."""
-    user = db.session.get(User, user_id)
+    user = getUserSnapshot(user_id)
     if not user:
         raise ValueError("User not found")
-    return user.notificationPreferences or {}
+    return dict(user.notificationPreferences)
 
 
 def updateNotificationPreferences(user_id: str, preferences: dict) -> dict:
@@ -189,12 +241,13 @@ def updateNotificationPreferences(user_id: str, preferences: dict) -> dict:
     if not user:
         raise ValueError("User not found")
     
-    existing = user.notificationPreferences or {}
+    existing = dict(user.notificationPreferences or {})
     allowed_keys = {"email", "events", "jobs", "messages", "moderation", "reports"}
     for key, value in preferences.items():
         if key in allowed_keys:
             existing[key] = _to_bool(value, default=existing.get(key, False))
     
     user.notificationPreferences = existing
+    invalidateUser(user)
     db.session.commit()
     return existing
\ No newline at end of file
@@ -1,25 +1,43 @@
 from App.Models.admin import Admin
 from App.Models.alumni import Alumni
+from App.Models.announcement import Announcement
+from App.Models.announcementRead import AnnouncementRead
+from App.Models.backgroundTask import BackgroundTask
+from App.Models.boardMember import BoardMember
 from App.Models.boardPost import BoardPost
 from App.Models.communityBoard import CommunityBoard
+from App.Models.conversation import Conversation
 from App.Models.event import Event
 from App.Models.eventRegistration import EventRegistration
 from App.Models.job import Job
 from App.Models.jobApplication import JobApplication
 from App.Models.message import Message
+from App.Models.passwordResetToken import PasswordResetToken
+from App.Models.postComment import PostComment
+from App.Models.postLike import PostLike
 from App.Models.profile import Profile
 from App.Models.user import User
+from App.Models.waitlistEntry import WaitlistEntry
 
 __all__ = [
     "Admin",
     "Alumni",
+    "Announcement",
+    "AnnouncementRead",
+    "BackgroundTask",
+    "BoardMember",
     "BoardPost",
     "CommunityBoard",
+    "Conversation",
     "Event",
     "EventRegistration",
     "Job",
     "JobApplication",
     "Message",
+    "PasswordResetToken",
+    "PostComment",
+    "PostLike",
     "Profile",
     "User",
+    "WaitlistEntry",
 ]
\ No newline at end of file
@@ -0,0 +1,30 @@
+from App.database import db
+from datetime import datetime, timezone
+from uuid import uuid4
+
+class Announcement(db.Model):
+    __tablename__ = "announcements"
+
+    announcementID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    authorID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False)
+    content = db.Column(db.Text, nullable=False)
+    createdAt = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    expiresAt = db.Column(db.DateTime, nullable=True)
+
+    author = db.relationship("User", foreign_keys=[authorID])
+
+    __table_args__ = (
+        db.Index("ix_announcements_created", "createdAt", "announcementID"),
+    )
+
+    def __repr__(self):
+        return f'<Announcement {self.announcementID}>'
+
+    def to_dict(self):
+        return {
+            "announcementID": self.announcementID,
+            "authorID": self.authorID,
+            "content": self.content,
+            "createdAt": self.createdAt.isoformat(),
+            "expiresAt": self.expiresAt.isoformat() if self.expiresAt else None,
+        }
@@ -0,0 +1,20 @@
+from App.database import db
+from datetime import datetime, timezone
+from uuid import uuid4
+
+class AnnouncementRead(db.Model):
+    """Sparse read receipt: a row exists only once a user has read an announcement."""
+    __tablename__ = "announcement_reads"
+
+    readID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    announcementID = db.Column(db.String(36), db.ForeignKey("announcements.announcementID"), nullable=False)
+    userID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False)
+    readAt = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.UniqueConstraint("announcementID", "userID", name="uq_announcement_read"),
+        db.Index("ix_announcement_reads_user", "userID", "announcementID"),
+    )
+
+    def __repr__(self):
+        return f'<AnnouncementRead {self.announcementID} by {self.userID}>'
@@ -0,0 +1,42 @@
+from App.database import db
+from datetime import datetime, timezone
+from uuid import uuid4
+
+class BackgroundTask(db.Model):
+    """Progress record for work that runs outside the request, such as announcement fan-out."""
+    __tablename__ = "background_tasks"
+
+    taskID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    kind = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    total = db.Column(db.Integer, nullable=True)
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    result = db.Column(db.JSON, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    createdBy = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=True)
+    createdAt = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    finishedAt = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f'<BackgroundTask {self.taskID} {self.kind} {self.status}>'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if getattr(self, 'status', None) is None:
+            self.status = 'queued'
+        if getattr(self, 'processed', None) is None:
+            self.processed = 0
+
+    def to_dict(self):
+        return {
+            "taskID": self.taskID,
+            "kind": self.kind,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "result": self.result,
+            "error": self.error,
+            "createdBy": self.createdBy,
+            "createdAt": self.createdAt.isoformat(),
+            "finishedAt": self.finishedAt.isoformat() if self.finishedAt else None,
+        }
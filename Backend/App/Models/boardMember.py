@@ -0,0 +1,35 @@
+from App.database import db
+from datetime import datetime, timezone
+from uuid import uuid4
+
+class BoardMember(db.Model):
+    __tablename__ = "board_members"
+
+    membershipID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    boardID = db.Column(db.String(36), db.ForeignKey("community_boards.boardID"), nullable=False)
+    alumniID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False)
+    role = db.Column(db.String(20), nullable=False, default="member")
+    joinedAt = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    board = db.relationship("CommunityBoard", back_populates="members")
+
+    __table_args__ = (
+        db.UniqueConstraint("boardID", "alumniID", name="uq_board_member"),
+        db.Index("ix_board_members_alumni_board", "alumniID", "boardID"),
+    )
+
+    def __repr__(self):
+        return f'<BoardMember {self.alumniID} in Board {self.boardID}>'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if getattr(self, 'role', None) is None:
+            self.role = 'member'
+
+    def to_dict(self):
+        return {
+            "boardID": self.boardID,
+            "alumniID": self.alumniID,
+            "role": self.role,
+            "joinedAt": self.joinedAt.isoformat(),
+        }
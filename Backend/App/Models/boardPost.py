@@ -11,12 +11,20 @@ class BoardPost(db.Model):
     content = db.Column(db.Text, nullable=False)
     postedDate = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     likesCount = db.Column(db.Integer, nullable=False, default=0)
+    # Legacy JSON storage; likes live in post_likes (see boardPostController.migrateLegacyLikes)
     likedBy = db.Column(db.JSON, nullable=False, default=list)
+    # Legacy JSON storage; comments live in post_comments (see boardPostController.migrateLegacyComments)
     comments = db.Column(db.JSON, nullable=False, default=list)
+    commentsCount = db.Column(db.Integer, nullable=False, default=0)
 
     board = db.relationship("CommunityBoard", back_populates="posts")
     author = db.relationship("Alumni", back_populates="posts")
 
+    __table_args__ = (
+        db.Index("ix_board_posts_posted", "postedDate", "postID"),
+        db.Index("ix_board_posts_board_posted", "boardID", "postedDate", "postID"),
+    )
+
     def __repr__(self):
         return f'<BoardPost {self.postID}>'
     
@@ -32,6 +40,8 @@ class BoardPost(db.Model):
             self.likedBy = []
         if getattr(self, 'comments', None) is None:
             self.comments = []
+        if getattr(self, 'commentsCount', None) is None:
+            self.commentsCount = 0
     
     def to_dict(self):
         return {
@@ -41,6 +51,5 @@ class BoardPost(db.Model):
             "content": self.content,
             "postedDate": self.postedDate.isoformat(),
             "likesCount": self.likesCount,
-            "likedBy": self.likedBy or [],
-            "comments": self.comments or [],
+            "commentsCount": self.commentsCount,
         }
@@ -7,11 +7,13 @@ class CommunityBoard(db.Model):
 
     boardID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
     alumniID = db.Column(db.String(36), db.ForeignKey("alumni.alumniID"), nullable=False)
-    name = db.Column(db.String(120), nullable=False)
+    name = db.Column(db.String(120), nullable=False, index=True)
     description = db.Column(db.Text, nullable=True)
+    # Legacy JSON storage; membership lives in board_members (see communityBoardController.migrateLegacyMembers)
     memberIDs = db.Column(MutableList.as_mutable(db.JSON), nullable=False, default=list)
     
     owner = db.relationship("Alumni", back_populates="boards")
+    members = db.relationship("BoardMember", back_populates="board", lazy="dynamic")
     posts = db.relationship("BoardPost", back_populates="board", lazy="dynamic")
     jobs = db.relationship("Job", back_populates="board", lazy="dynamic")
     events = db.relationship("Event", back_populates="board", lazy="dynamic")
@@ -0,0 +1,41 @@
+from App.database import db
+from datetime import datetime, timezone
+from uuid import uuid4
+
+class Conversation(db.Model):
+    """One row per participant of a two-person thread; both rows share `threadID`."""
+    __tablename__ = "conversations"
+
+    conversationID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    threadID = db.Column(db.String(36), nullable=False)
+    ownerID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False)
+    peerID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False)
+    lastMessageID = db.Column(db.String(36), db.ForeignKey("messages.messageID"), nullable=True)
+    lastMessageAt = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    unreadCount = db.Column(db.Integer, nullable=False, default=0)
+
+    peer = db.relationship("User", foreign_keys=[peerID])
+    lastMessage = db.relationship("Message", foreign_keys=[lastMessageID])
+
+    __table_args__ = (
+        db.UniqueConstraint("ownerID", "peerID", name="uq_conversation_pair"),
+        db.Index("ix_conversations_owner_last", "ownerID", "lastMessageAt", "conversationID"),
+        db.Index("ix_conversations_thread", "threadID"),
+    )
+
+    def __repr__(self):
+        return f'<Conversation {self.threadID} for {self.ownerID}>'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if getattr(self, 'unreadCount', None) is None:
+            self.unreadCount = 0
+
+    def to_dict(self):
+        return {
+            "threadID": self.threadID,
+            "peerID": self.peerID,
+            "lastMessageID": self.lastMessageID,
+            "lastMessageAt": self.lastMessageAt.isoformat(),
+            "unreadCount": self.unreadCount,
+        }
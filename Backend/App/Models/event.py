@@ -14,6 +14,10 @@ class Event(db.Model):
     location = db.Column(db.String(255), nullable=False)
     maxAttendees = db.Column(db.Integer, nullable=False)
     status = db.Column(db.String(50), nullable=False, default="active")
+    # Seats held (registered or checked in); reserved with a conditional UPDATE, see eventRegistrationControllers
+    registeredCount = db.Column(db.Integer, nullable=False, default=0)
+    # Last waitlist position handed out; positions are allocated by incrementing this in SQL
+    waitlistTail = db.Column(db.Integer, nullable=False, default=0)
 
     creator = db.relationship("Alumni", back_populates="events")
     board = db.relationship("CommunityBoard", back_populates="events")
@@ -21,6 +25,10 @@ class Event(db.Model):
         "EventRegistration", back_populates="event", lazy="dynamic"
     )
 
+    __table_args__ = (
+        db.Index("ix_events_schedule", "date", "time", "status"),
+    )
+
     def __repr__(self):
         return f'<Event {self.title} on {self.date}>'
 
@@ -29,6 +37,10 @@ class Event(db.Model):
         super().__init__(*args, **kwargs)
         if getattr(self, 'status', None) is None:
             self.status = 'active'
+        if getattr(self, 'registeredCount', None) is None:
+            self.registeredCount = 0
+        if getattr(self, 'waitlistTail', None) is None:
+            self.waitlistTail = 0
 
     def to_dict(self):
         return {
@@ -41,5 +53,6 @@ class Event(db.Model):
             "time": self.time.isoformat(),
             "location": self.location,
             "maxAttendees": self.maxAttendees,
+            "registeredCount": self.registeredCount,
             "status": self.status,
         }
\ No newline at end of file
@@ -25,6 +25,10 @@ class Job(db.Model):
     approver = db.relationship("Admin", back_populates="approvedJobs")
     applications = db.relationship("JobApplication", back_populates="job", lazy="dynamic")
 
+    __table_args__ = (
+        db.Index("ix_jobs_status_posted", "status", "postedDate", "jobID"),
+    )
+
     def __init__(self, *args, **kwargs):
         # Call base constructor then set defaults without overwriting provided values
         super().__init__(*args, **kwargs)
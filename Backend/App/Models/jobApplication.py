@@ -16,6 +16,10 @@ class JobApplication(db.Model):
     job = db.relationship("Job", back_populates="applications")
     applicant = db.relationship("Alumni", back_populates="applications")
 
+    __table_args__ = (
+        db.Index("ix_job_applications_alumni_job", "alumniID", "jobID"),
+    )
+
     def __repr__(self):
         return f'<JobApplication {self.applicationID}>'
     
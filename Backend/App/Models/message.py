@@ -8,16 +8,27 @@ class Message(db.Model):
     messageID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
     senderID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False)
     receiverID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False)
+    threadID = db.Column(db.String(36), nullable=True)
     content = db.Column(db.Text, nullable=False)
     timestamp = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     status = db.Column(db.String(50), nullable=False, default="requested")
     attachments = db.Column(db.JSON, nullable=False, default=list)
+    # Set on system-generated messages (e.g. event reminders) so re-sends are skipped
+    dedupKey = db.Column(db.String(160), nullable=True)
 
     sender = db.relationship("User", foreign_keys=[senderID], back_populates="sentMessages")
     receiver = db.relationship(
         "User", foreign_keys=[receiverID], back_populates="receivedMessages"
     )
 
+    __table_args__ = (
+        db.Index("ix_messages_receiver_time", "receiverID", "timestamp", "messageID"),
+        db.Index("ix_messages_sender_time", "senderID", "timestamp", "messageID"),
+        db.Index("ix_messages_receiver_status_time", "receiverID", "status", "timestamp", "messageID"),
+        db.Index("ix_messages_thread_time", "threadID", "timestamp", "messageID"),
+        db.Index("uq_messages_dedup_key", "dedupKey", unique=True),
+    )
+
     def __repr__(self):
         return f'<Message {self.messageID} from {self.senderID} to {self.receiverID}>'
     
@@ -28,6 +39,7 @@ class Message(db.Model):
             "senderName": self.sender.name if self.sender else self.senderID,
             "receiverID": self.receiverID,
             "receiverName": self.receiver.name if self.receiver else self.receiverID,
+            "threadID": self.threadID,
             "content": self.content,
             "timestamp": self.timestamp.isoformat(),
             "status": self.status,
@@ -0,0 +1,16 @@
+from App.database import db
+from datetime import datetime, timezone
+from uuid import uuid4
+
+class PasswordResetToken(db.Model):
+    """Single-use reset token; only the SHA-256 of the token is stored."""
+    __tablename__ = "password_reset_tokens"
+
+    tokenID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    userID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False, index=True)
+    tokenHash = db.Column(db.String(64), nullable=False, unique=True)
+    createdAt = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    expiresAt = db.Column(db.DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f'<PasswordResetToken for {self.userID} until {self.expiresAt}>'
@@ -0,0 +1,33 @@
+from App.database import db
+from datetime import datetime, timezone
+from uuid import uuid4
+
+class PostComment(db.Model):
+    __tablename__ = "post_comments"
+
+    commentID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    postID = db.Column(db.String(36), db.ForeignKey("board_posts.postID"), nullable=False)
+    authorID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False)
+    content = db.Column(db.Text, nullable=False)
+    time = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    author = db.relationship("User")
+
+    __table_args__ = (
+        db.Index("ix_post_comments_post_time", "postID", "time", "commentID"),
+    )
+
+    def __repr__(self):
+        return f'<PostComment {self.commentID} on Post {self.postID}>'
+
+    def to_dict(self, author_name: str = None):
+        author_name = author_name or "Alumni"
+        return {
+            "commentID": self.commentID,
+            "postID": self.postID,
+            "authorID": self.authorID,
+            "authorName": author_name,
+            "content": self.content,
+            "time": self.time.isoformat(),
+            "avatar": f"https://ui-avatars.com/api/?name={author_name.replace(' ', '+')}&background=0D8ABC&color=fff",
+        }
@@ -0,0 +1,25 @@
+from App.database import db
+from datetime import datetime, timezone
+from uuid import uuid4
+
+class PostLike(db.Model):
+    __tablename__ = "post_likes"
+
+    likeID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    postID = db.Column(db.String(36), db.ForeignKey("board_posts.postID"), nullable=False)
+    alumniID = db.Column(db.String(36), db.ForeignKey("users.userID"), nullable=False)
+    likedAt = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.UniqueConstraint("postID", "alumniID", name="uq_post_like"),
+    )
+
+    def __repr__(self):
+        return f'<PostLike {self.alumniID} on Post {self.postID}>'
+
+    def to_dict(self):
+        return {
+            "postID": self.postID,
+            "alumniID": self.alumniID,
+            "likedAt": self.likedAt.isoformat(),
+        }
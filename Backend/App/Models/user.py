@@ -1,9 +1,48 @@
 from datetime import datetime, timezone
+from functools import lru_cache
 from uuid import uuid4
+from flask import current_app, has_app_context
 from werkzeug.security import generate_password_hash, check_password_hash
 
 from App.database import db
 
+# PASSWORD_HASH_METHOD may name one of these profiles or give any werkzeug method string
+PASSWORD_HASH_PROFILES = {
+    "default": "scrypt:32768:8:1",
+    "fast": "pbkdf2:sha256:100000",
+    "cheap": "pbkdf2:sha256:1000",  # tests and seeded sample data only
+}
+
+
+def password_hash_method(profile: str = None) -> str:
+    """Resolve a profile name (or the configured one; tests default to "cheap") to a method string."""
+    if profile is None:
+        if has_app_context():
+            profile = current_app.config.get("PASSWORD_HASH_METHOD", "cheap" if current_app.testing else "default")
+        else:
+            profile = "default"
+    return PASSWORD_HASH_PROFILES.get(profile, profile)
+
+
+def validate_password_hash_method(profile: str, setting: str = "PASSWORD_HASH_METHOD") -> str:
+    """Resolve `profile` and make sure werkzeug accepts it; raises ValueError naming the bad setting."""
+    method = password_hash_method(profile)
+    try:
+        _hash_prefix(method)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid {setting} {profile!r}: {e}") from e
+    return method
+
+
+def hash_password(password: str, profile: str = None) -> str:
+    return generate_password_hash(password, method=password_hash_method(profile))
+
+
+@lru_cache(maxsize=16)
+def _hash_prefix(method: str) -> str:
+    # werkzeug fills in omitted parameters, so normalize by hashing once
+    return generate_password_hash("", method=method).split("$", 1)[0]
+
 class User(db.Model):
     __tablename__ = "users"
 
@@ -17,6 +56,13 @@ class User(db.Model):
     notificationPreferences = db.Column(db.JSON, nullable=False, default=dict)
     savedJobIDs = db.Column(db.JSON, nullable=False, default=list)
     blockedUserIDs = db.Column(db.JSON, nullable=False, default=list)
+    isSuspended = db.Column(db.Boolean, nullable=False, default=False)
+    suspendedUntil = db.Column(db.DateTime, nullable=True)
+    banReason = db.Column(db.String(255), nullable=True)
+    # Bumped whenever claims embedded in issued tokens go stale; older tokens are rejected
+    tokenVersion = db.Column(db.Integer, nullable=False, default=0)
+    # Bumped on every cached-field write so other workers can tell their snapshot is stale
+    cacheVersion = db.Column(db.Integer, nullable=False, default=0)
 
     sentMessages = db.relationship(
         "Message",
@@ -48,6 +94,12 @@ class User(db.Model):
             self.savedJobIDs = []
         if getattr(self, 'blockedUserIDs', None) is None:
             self.blockedUserIDs = []
+        if getattr(self, 'isSuspended', None) is None:
+            self.isSuspended = False
+        if getattr(self, 'tokenVersion', None) is None:
+            self.tokenVersion = 0
+        if getattr(self, 'cacheVersion', None) is None:
+            self.cacheVersion = 0
         if getattr(self, 'isApproved', None) is None:
             # Auto-approve admin accounts by default; others remain unapproved
             if hasattr(self.__class__, 'adminID') or getattr(self, 'role', None) == 'admin':
@@ -56,11 +108,27 @@ class User(db.Model):
                 self.isApproved = False
 
     def set_password(self, password):
-        self.password = generate_password_hash(password)
+        self.password = hash_password(password)
+
+    def password_needs_rehash(self):
+        """True when the stored hash was made with a method or cost other than the configured one."""
+        return self.password.split("$", 1)[0] != _hash_prefix(password_hash_method())
 
     def check_password(self, password):
         return check_password_hash(self.password, password)
 
+    def is_suspended(self, now=None):
+        """True while a suspension is in force; a suspension without an end date is a ban."""
+        if not self.isSuspended:
+            return False
+        if self.suspendedUntil is None:
+            return True
+        now = now or datetime.now(timezone.utc)
+        until = self.suspendedUntil
+        if until.tzinfo is None:
+            until = until.replace(tzinfo=timezone.utc)
+        return until > now
+
     def __repr__(self):
         return f"<User {self.email}>"
     
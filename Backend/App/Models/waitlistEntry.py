@@ -0,0 +1,28 @@
+from App.database import db
+from datetime import datetime, timezone
+from uuid import uuid4
+
+class WaitlistEntry(db.Model):
+    __tablename__ = "event_waitlist"
+
+    entryID = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid4()))
+    eventID = db.Column(db.String(36), db.ForeignKey("events.eventID"), nullable=False)
+    attendeeID = db.Column(db.String(36), db.ForeignKey("alumni.alumniID"), nullable=False)
+    position = db.Column(db.Integer, nullable=False)
+    joinedAt = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.UniqueConstraint("eventID", "position", name="uq_event_waitlist_position"),
+        db.UniqueConstraint("eventID", "attendeeID", name="uq_event_waitlist_attendee"),
+    )
+
+    def __repr__(self):
+        return f'<WaitlistEntry {self.attendeeID} #{self.position} for Event {self.eventID}>'
+
+    def to_dict(self):
+        return {
+            "eventID": self.eventID,
+            "attendeeID": self.attendeeID,
+            "position": self.position,
+            "joinedAt": self.joinedAt.isoformat(),
+        }
@@ -1,19 +1,17 @@
 from flask import Blueprint, jsonify
-from flask_jwt_extended import jwt_required
-from App.Controllers import adminControllers
+from App.Controllers import adminControllers, taskController
 from App.utils import _payload
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import admin_required
+from App.Controllers.userCache import userCacheStats
 
 
 admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 
 
 @admin_bp.route("/users/<user_id>/approve", methods=["POST"])
-@jwt_required()
+@admin_required
 def approveUser(user_id):
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
     try:
         adminControllers.approveUser(user_id)
         return jsonify({"message": "User approved", "userID": user_id}), 200
@@ -22,11 +20,8 @@ def approveUser(user_id):
 
 
 @admin_bp.route("/moderate", methods=["POST"])
-@jwt_required()
+@admin_required
 def moderateContent():
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
     data = _payload()
     content_type = data.get("type")
     content_id = data.get("id")
@@ -41,21 +36,15 @@ def moderateContent():
 
 
 @admin_bp.route("/reports", methods=["GET"])
-@jwt_required()
+@admin_required
 def generateReport():
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
     report = adminControllers.generateReport()
     return jsonify({"report": report}), 200
 
 
 @admin_bp.route("/events/<event_id>/manage", methods=["POST"])
-@jwt_required()
+@admin_required
 def manageEvent(event_id):
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
     data = _payload()
     action = data.get("action")
     if not action:
@@ -68,27 +57,38 @@ def manageEvent(event_id):
 
 
 @admin_bp.route("/announcements", methods=["POST"])
-@jwt_required()
+@admin_required
 def sendAnnouncement():
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     content = data.get("content")
     if not content:
         return jsonify({"error": "content is required"}), 400
     try:
-        count = adminControllers.sendAnnouncement(user.userID, content)
-        return jsonify({"message": "Announcement sent", "recipientCount": count}), 200
+        count = adminControllers.sendAnnouncement(user.userID, content, data.get("expiresInDays"))
+        return jsonify({"message": "Announcement sent", "recipientCount": count}), 201
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
 
+
+@admin_bp.route("/tasks/<task_id>", methods=["GET"])
+@admin_required
+def getTask(task_id):
+    try:
+        return jsonify(taskController.getTask(task_id)), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+
+@admin_bp.route("/cache/users", methods=["GET"])
+@admin_required
+def showUserCacheStats():
+    return jsonify(userCacheStats()), 200
+
 @admin_bp.route("/users/<user_id>/suspend", methods=["POST"])
-@jwt_required()
+@admin_required
 def suspendUser(user_id):
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     reason = data.get("reason", "").strip()
     duration_days = data.get("durationDays")
@@ -103,11 +103,8 @@ def suspendUser(user_id):
         return jsonify({"error": str(e)}), 400
 
 @admin_bp.route("/users/<user_id>/unsuspend", methods=["POST"])
-@jwt_required()
+@admin_required
 def unsuspendUser(user_id):
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
     try:
         adminControllers.unsuspendUser(user_id)
         return jsonify({"message": "User unsuspended", "userID": user_id}), 200
@@ -115,11 +112,9 @@ def unsuspendUser(user_id):
         return jsonify({"error": str(e)}), 404
 
 @admin_bp.route("/users/<user_id>/ban", methods=["POST"])
-@jwt_required()
+@admin_required
 def banUser(user_id):
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     reason = data.get("reason", "").strip()
     if not reason:
@@ -131,11 +126,8 @@ def banUser(user_id):
         return jsonify({"error": str(e)}), 400
 
 @admin_bp.route("/users/<user_id>/unban", methods=["POST"])
-@jwt_required()
+@admin_required
 def unbanUser(user_id):
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
     try:
         adminControllers.unbanUser(user_id)
         return jsonify({"message": "User unbanned", "userID": user_id}), 200
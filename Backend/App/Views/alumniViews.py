@@ -1,19 +1,17 @@
 from flask import Blueprint, jsonify, request
-from flask_jwt_extended import jwt_required
 from App.Controllers import alumniControllers, eventRegistrationControllers, jobApplicationController, messageController
 from App.utils import _payload
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import alumni_required, member_required
 
 
 alumni_bp = Blueprint("alumni", __name__, url_prefix="/alumni")
 
 
 @alumni_bp.route("/connect", methods=["POST"])
-@jwt_required()
+@member_required
 def connectToAlumni():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     target_id = data.get("alumniID")
     message = data.get("message")
@@ -27,11 +25,9 @@ def connectToAlumni():
 
 
 @alumni_bp.route("/events/<event_id>/register", methods=["POST"])
-@jwt_required()
+@alumni_required
 def registerForEvent(event_id):
-    user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     try:
         reg_id = eventRegistrationControllers.registerForEvent(event_id, user.userID)
         return jsonify({"message": "Registered successfully", "registrationID": reg_id}), 201
@@ -45,11 +41,9 @@ def registerForEvent(event_id):
 
 
 @alumni_bp.route("/jobs/<job_id>/apply", methods=["POST"])
-@jwt_required()
+@alumni_required
 def applyForJob(job_id):
-    user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     try:
         app_obj = jobApplicationController.createApplication(user.userID, job_id)
         app_id = getattr(app_obj, 'applicationID', None) or getattr(app_obj, 'applicationId', None) or str(app_obj)
@@ -59,11 +53,8 @@ def applyForJob(job_id):
 
 
 @alumni_bp.route("/search", methods=["GET"])
-@jwt_required()
+@member_required
 def searchAlumni():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
     query = request.args.get("q")
     faculty = request.args.get("faculty")
     grad_year = request.args.get("graduationYear")
@@ -5,6 +5,7 @@ from App.Models import Alumni
 from App.database import db
 from App.utils import _payload
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import member_required
 
 
 board_post_bp = Blueprint("board_posts", __name__, url_prefix="/boardposts")
@@ -40,11 +41,9 @@ def getBoardPost(post_id):
 
 
 @board_post_bp.route("", methods=["POST"])
-@jwt_required()
+@member_required
 def createBoardPost():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     board_id = data.get("boardID")
     content = data.get("content")
@@ -65,16 +64,22 @@ def getAllPosts():
     user = currentUser()
     if not user:
         return jsonify({"error": "Authentication required"}), 401
-    posts = boardPostController.listAllPosts()
-    return jsonify({"posts": posts}), 200
+    try:
+        feed = boardPostController.listPostFeed(
+            limit=request.args.get("limit", 50),
+            cursor=request.args.get("cursor"),
+            board_id=request.args.get("board_id"),
+            viewer_id=user.userID,
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(feed), 200
 
 
 @board_post_bp.route("/<post_id>", methods=["PATCH"])
-@jwt_required()
+@member_required
 def updateBoardPost(post_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     content = data.get("content")
     if not content:
@@ -93,11 +98,9 @@ def updateBoardPost(post_id):
 
 
 @board_post_bp.route("/<post_id>", methods=["DELETE"])
-@jwt_required()
+@member_required
 def deleteBoardPost(post_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     is_admin = (user.role == "admin")
     try:
         boardPostController.deleteBoardPost(post_id, user.userID, is_admin)
@@ -112,11 +115,9 @@ def deleteBoardPost(post_id):
 
 
 @board_post_bp.route("/<post_id>/like", methods=["POST"])
-@jwt_required()
+@member_required
 def likePost(post_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     try:
         result = boardPostController.likePost(post_id, user.userID)
         return jsonify(result), 200
@@ -127,12 +128,46 @@ def likePost(post_id):
         return jsonify({"error": str(e)}), 400
 
 
-@board_post_bp.route("/<post_id>/comments", methods=["POST"])
+@board_post_bp.route("/<post_id>/likes", methods=["GET"])
 @jwt_required()
-def addComment(post_id):
+def listPostLikers(post_id):
     user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    if not user:
+        return jsonify({"error": "Authentication required"}), 401
+    try:
+        result = boardPostController.listPostLikers(
+            post_id, limit=request.args.get("limit", 50), cursor=request.args.get("cursor")
+        )
+        return jsonify(result), 200
+    except ValueError as e:
+        msg = str(e).lower()
+        if "not found" in msg:
+            return jsonify({"error": str(e)}), 404
+        return jsonify({"error": str(e)}), 400
+
+
+@board_post_bp.route("/<post_id>/comments", methods=["GET"])
+@jwt_required()
+def listComments(post_id):
+    user = currentUser()
+    if not user:
+        return jsonify({"error": "Authentication required"}), 401
+    try:
+        result = boardPostController.listComments(
+            post_id, limit=request.args.get("limit", 20), cursor=request.args.get("cursor")
+        )
+        return jsonify(result), 200
+    except ValueError as e:
+        msg = str(e).lower()
+        if "not found" in msg:
+            return jsonify({"error": str(e)}), 404
+        return jsonify({"error": str(e)}), 400
+
+
+@board_post_bp.route("/<post_id>/comments", methods=["POST"])
+@member_required
+def addComment(post_id):
+    user = currentUser(claims_only=True)
     data = _payload()
     content = data.get("content")
     if not content:
@@ -142,7 +177,8 @@ def addComment(post_id):
         return jsonify({"error": "Alumni profile not found"}), 404
     try:
         comment = boardPostController.addComment(post_id, user.userID, alumni.name, content)
-        return jsonify({"message": "Comment added", "comment": comment}), 201
+        post = boardPostController.viewBoardPost(post_id)
+        return jsonify({"message": "Comment added", "comment": comment, "commentsCount": post.commentsCount}), 201
     except ValueError as e:
         msg = str(e).lower()
         if "not found" in msg:
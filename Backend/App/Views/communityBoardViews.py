@@ -1,10 +1,11 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 from App.Controllers import communityBoardController
 from App.Controllers import jobController
 from App.Controllers import eventController
-from App.utils import _payload
+from App.utils import _payload, _to_bool
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import member_required
 
 
 community_board_bp = Blueprint("community_board", __name__, url_prefix="/boards")
@@ -16,7 +17,15 @@ def listBoards():
     user = currentUser()
     if not user:
         return jsonify({"error": "Authentication required"}), 401
-    boards = communityBoardController.listBoardsForUser(user.userID)
+    try:
+        boards = communityBoardController.listBoardsForUser(
+            user.userID,
+            search=request.args.get("search"),
+            limit=request.args.get("limit"),
+            offset=request.args.get("offset", 0),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     serialized = []
     for entry in boards:
         board = entry["board"]
@@ -25,8 +34,8 @@ def listBoards():
             "name": board.name,
             "description": board.description,
             "alumniID": board.alumniID,
-            "adminName": entry.get("adminName") or (board.owner.name if board.owner else "Unknown"),
-            "members": entry.get("members", len(board.memberIDs or [])),
+            "adminName": entry.get("adminName") or "Unknown",
+            "members": entry.get("members", 0),
             "isMember": entry.get("isMember", False),
         })
     return jsonify({"boards": serialized}), 200
@@ -39,18 +48,21 @@ def getBoardMembers(board_id):
     if not user:
         return jsonify({"error": "Authentication required"}), 401
     try:
-        members = communityBoardController.listBoardMembers(board_id)
+        members = communityBoardController.listBoardMembers(
+            board_id,
+            limit=request.args.get("limit"),
+            offset=request.args.get("offset", 0),
+            include_email=not _to_bool(request.args.get("compact")),
+        )
         return jsonify({"members": members}), 200
     except ValueError as e:
         return jsonify({"error": str(e)}), 404 if "not found" in str(e).lower() else 400
 
 
 @community_board_bp.route("", methods=["POST"])
-@jwt_required()
+@member_required
 def createBoard():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     name = data.get("name")
     description = data.get("description")
@@ -64,11 +76,9 @@ def createBoard():
 
 
 @community_board_bp.route("/<board_id>/join", methods=["POST"])
-@jwt_required()
+@member_required
 def joinBoard(board_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     try:
         communityBoardController.joinBoard(user.userID, board_id)
         return jsonify({"message": "Joined community", "boardID": board_id}), 200
@@ -82,11 +92,9 @@ def joinBoard(board_id):
 
 
 @community_board_bp.route("/<board_id>/leave", methods=["POST"])
-@jwt_required()
+@member_required
 def leaveBoard(board_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     try:
         communityBoardController.leaveBoard(user.userID, board_id)
         return jsonify({"message": "Left community", "boardID": board_id}), 200
@@ -116,11 +124,9 @@ def boardPage(board_id):
 
 
 @community_board_bp.route("/<board_id>/posts", methods=["POST"])
-@jwt_required()
+@member_required
 def createPost(board_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     content = data.get("content")
     if not content:
@@ -135,11 +141,9 @@ def createPost(board_id):
 
 
 @community_board_bp.route("/<board_id>/jobs", methods=["POST"])
-@jwt_required()
+@member_required
 def createBoardJob(board_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     required = ["title", "company", "description", "expiryDate"]
     missing = [field for field in required if not data.get(field)]
@@ -166,11 +170,9 @@ def createBoardJob(board_id):
 
 
 @community_board_bp.route("/<board_id>/events", methods=["POST"])
-@jwt_required()
+@member_required
 def createBoardEvent(board_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     required = ["title", "date", "time", "location"]
     missing = [field for field in required if not data.get(field)]
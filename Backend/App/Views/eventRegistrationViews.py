@@ -1,26 +1,30 @@
 from flask import Blueprint, jsonify
-from flask_jwt_extended import jwt_required
 from App.Controllers import eventRegistrationControllers
-from App.utils import _payload
+from App.utils import _payload, _to_bool
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import admin_required, member_required
 
 
 event_registration_bp = Blueprint("event_registrations", __name__, url_prefix="/registrations")
 
 
 @event_registration_bp.route("", methods=["POST"])
-@jwt_required()
+@member_required
 def registerForEvent():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     event_id = data.get("eventID")
     if not event_id:
         return jsonify({"error": "eventID is required"}), 400
     payment_status = data.get("paymentStatus", "pending")
     try:
-        reg_id = eventRegistrationControllers.registerForEvent(event_id, user.userID, payment_status)
+        if _to_bool(data.get("waitlist")):
+            result = eventRegistrationControllers.registerOrWaitlist(event_id, user.userID, payment_status)
+            if result["status"] == "waitlisted":
+                return jsonify({"message": "Added to waitlist", "position": result["position"]}), 202
+            reg_id = result["registrationID"]
+        else:
+            reg_id = eventRegistrationControllers.registerForEvent(event_id, user.userID, payment_status)
         return jsonify({"message": "Registration complete", "registrationID": reg_id}), 201
     except ValueError as e:
         msg = str(e).lower()
@@ -32,11 +36,9 @@ def registerForEvent():
 
 
 @event_registration_bp.route("/<registration_id>/cancel", methods=["POST"])
-@jwt_required()
+@member_required
 def cancelRegistration(registration_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     is_admin = (user.role == "admin")
     try:
         eventRegistrationControllers.cancelRegistration(registration_id, user.userID, is_admin)
@@ -51,11 +53,8 @@ def cancelRegistration(registration_id):
 
 
 @event_registration_bp.route("/<registration_id>/check-in", methods=["POST"])
-@jwt_required()
+@admin_required
 def checkIn(registration_id):
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
     try:
         eventRegistrationControllers.checkIn(registration_id)
         return jsonify({"message": "Attendee checked in", "registrationID": registration_id}), 200
@@ -1,10 +1,11 @@
 # File: App/Views/eventViews.py
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from flask_jwt_extended import jwt_required
-from App.Controllers import eventController, eventRegistrationControllers
-from App.utils import _payload
+from App.Controllers import eventController, eventRegistrationControllers, taskController
+from App.utils import _payload, _to_bool
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import alumni_required, member_required
 
 
 event_bp = Blueprint("events", __name__, url_prefix="/events")
@@ -32,18 +33,17 @@ def getEvent(event_id):
     user = currentUser()
     if not user:
         return jsonify({"error": "Authentication required"}), 401
-    event = next((record for record in eventController.listEvents(status="active", limit=500, offset=0, current_user=user) if str(record.get("eventID")) == str(event_id)), None)
-    if not event:
-        return jsonify({"error": "Event not found"}), 404
+    try:
+        event = eventController.getEventForUser(event_id, user)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
     return jsonify(event), 200
 
 
 @event_bp.route("", methods=["POST"])
-@jwt_required()
+@member_required
 def createEvent():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni or admin access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     required = ["title", "date", "time", "location", "maxAttendees", "boardID"]
     missing = [f for f in required if not data.get(f)]
@@ -66,11 +66,9 @@ def createEvent():
 
 
 @event_bp.route("/<event_id>/register-attendee", methods=["POST"])
-@jwt_required()
+@member_required
 def registerAttendee(event_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     # Payload is ignored; attendee is always the current user.
     try:
         reg_id = eventRegistrationControllers.registerForEvent(event_id, user.userID)
@@ -85,11 +83,9 @@ def registerAttendee(event_id):
 
 
 @event_bp.route("/<event_id>/cancel", methods=["POST"])
-@jwt_required()
+@member_required
 def cancelEvent(event_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     is_admin = (user.role == "admin")
     try:
         eventController.cancelEvent(event_id, user.userID, is_admin)
@@ -101,37 +97,49 @@ def cancelEvent(event_id):
 
 
 @event_bp.route("/<event_id>/send-reminders", methods=["POST"])
-@jwt_required()
+@member_required
 def sendReminders(event_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     try:
-        count = eventController.sendReminders(event_id, user.userID)
-        return jsonify({"message": "Reminders sent", "count": count}), 200
+        if _to_bool(request.args.get("async")):
+            queued = eventController.startReminders(event_id, user.userID)
+            return jsonify({"message": "Reminders queued", "jobID": queued["taskID"],
+                            "registeredCount": queued["registeredCount"]}), 202
+        result = eventController.dispatchReminders(event_id, user.userID)
+        return jsonify({"message": "Reminders sent", "count": result["sent"], "skipped": result["skipped"]}), 200
     except ValueError as e:
         return jsonify({"error": str(e)}), 404 if "not found" in str(e).lower() else 400
 
 
-@event_bp.route("/registrations/me", methods=["GET"])
+@event_bp.route("/tasks/<task_id>", methods=["GET"])
 @jwt_required()
-def getRegisteredEvents():
+def getReminderTask(task_id):
     user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    if not user:
+        return jsonify({"error": "Authentication required"}), 401
+    try:
+        return jsonify(taskController.getTask(task_id, user.userID, user.role == "admin")), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    except PermissionError as e:
+        return jsonify({"error": str(e)}), 403
+
+
+@event_bp.route("/registrations/me", methods=["GET"])
+@alumni_required
+def getRegisteredEvents():
+    user = currentUser(claims_only=True)
     event_ids = eventController.listRegisteredEvents(user.userID)
     return jsonify({"eventIDs": event_ids}), 200
 
 
 @event_bp.route("/<event_id>/register", methods=["POST"])
-@jwt_required()
+@alumni_required
 def registerEvent(event_id):
-    user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     try:
-        result = eventController.registerEvent(event_id, user.userID)
-        return jsonify(result), 201
+        result = eventController.registerEvent(event_id, user.userID, _to_bool(_payload().get("waitlist")))
+        return jsonify(result), 202 if result.get("waitlisted") else 201
     except ValueError as e:
         msg = str(e).lower()
         if "not found" in msg:
@@ -139,12 +147,92 @@ def registerEvent(event_id):
         return jsonify({"error": str(e)}), 400
 
 
+@event_bp.route("/<event_id>/waitlist", methods=["POST"])
+@alumni_required
+def joinWaitlist(event_id):
+    user = currentUser(claims_only=True)
+    try:
+        position = eventRegistrationControllers.joinWaitlist(event_id, user.userID)
+        return jsonify({"message": "Added to waitlist", "eventID": event_id, "position": position}), 201
+    except ValueError as e:
+        msg = str(e).lower()
+        if "already" in msg:
+            return jsonify({"error": str(e)}), 409
+        return jsonify({"error": str(e)}), 400
+
+
+@event_bp.route("/<event_id>/waitlist", methods=["GET"])
+@alumni_required
+def getWaitlistStatus(event_id):
+    user = currentUser(claims_only=True)
+    try:
+        return jsonify(eventRegistrationControllers.getWaitlistStatus(event_id, user.userID)), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+
+@event_bp.route("/<event_id>/waitlist", methods=["DELETE"])
+@alumni_required
+def leaveWaitlist(event_id):
+    user = currentUser(claims_only=True)
+    try:
+        eventRegistrationControllers.leaveWaitlist(event_id, user.userID)
+        return jsonify({"message": "Removed from waitlist", "eventID": event_id}), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+
+@event_bp.route("/<event_id>/check-in/bulk", methods=["POST"])
+@member_required
+def bulkCheckIn(event_id):
+    user = currentUser(claims_only=True)
+    data = _payload()
+    try:
+        results = eventRegistrationControllers.bulkCheckIn(
+            event_id, user.userID, data.get("registrationIDs"), data.get("attendeeIDs"), is_admin=user.role == "admin"
+        )
+        return jsonify({"eventID": event_id, "results": results}), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404 if "not found" in str(e).lower() else 400
+    except PermissionError as e:
+        return jsonify({"error": str(e)}), 403
+
+
+@event_bp.route("/<event_id>/check-in/snapshot", methods=["GET"])
+@member_required
+def exportCheckInSnapshot(event_id):
+    user = currentUser(claims_only=True)
+    try:
+        chunks = eventRegistrationControllers.exportCheckInSnapshot(event_id, user.userID, is_admin=user.role == "admin")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    except PermissionError as e:
+        return jsonify({"error": str(e)}), 403
+    return Response(stream_with_context(chunks), mimetype="application/gzip", headers={
+        "Content-Disposition": f"attachment; filename=event-{event_id}-checkin.tsv.gz",
+    })
+
+
+@event_bp.route("/<event_id>/check-in/replay", methods=["POST"])
+@member_required
+def replayCheckIns(event_id):
+    user = currentUser(claims_only=True)
+    data = _payload()
+    try:
+        results = eventRegistrationControllers.replayOfflineCheckIns(
+            event_id, user.userID, data.get("checkIns"), is_admin=user.role == "admin"
+        )
+        return jsonify({"eventID": event_id, "results": results}), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404 if "not found" in str(e).lower() else 400
+    except PermissionError as e:
+        return jsonify({"error": str(e)}), 403
+
+
 @event_bp.route("/<event_id>/unregister", methods=["POST"])
-@jwt_required()
+@alumni_required
 def unregisterEvent(event_id):
-    user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     try:
         result = eventController.unregisterEvent(event_id, user.userID)
         return jsonify(result), 200
@@ -3,6 +3,7 @@ from flask_jwt_extended import jwt_required
 from App.Controllers import jobApplicationController
 from App.utils import _payload
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import admin_required, alumni_required
 
 
 job_application_bp = Blueprint("job_applications", __name__, url_prefix="/applications")
@@ -36,11 +37,9 @@ def getApplication(application_id):
 
 
 @job_application_bp.route("", methods=["POST"])
-@jwt_required()
+@alumni_required
 def createApplication():
-    user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     job_id = data.get("jobID")
     if not job_id:
@@ -53,11 +52,9 @@ def createApplication():
 
 
 @job_application_bp.route("/<application_id>/withdraw", methods=["POST"])
-@jwt_required()
+@alumni_required
 def withdrawApplication(application_id):
-    user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     try:
         app = jobApplicationController.withdrawApplication(application_id, user.userID)
         return jsonify({"message": "Application withdrawn", "application": app.to_dict()}), 200
@@ -68,11 +65,8 @@ def withdrawApplication(application_id):
 
 
 @job_application_bp.route("/<application_id>/status", methods=["PATCH"])
-@jwt_required()
+@admin_required
 def updateApplicationStatus(application_id):
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
     data = _payload()
     new_status = data.get("status")
     if not new_status:
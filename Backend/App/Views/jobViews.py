@@ -5,6 +5,7 @@ from flask_jwt_extended import jwt_required
 from App.Controllers import jobController
 from App.utils import _payload
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import admin_required, alumni_required, member_required
 
 
 job_bp = Blueprint("jobs", __name__, url_prefix="/jobs")
@@ -18,12 +19,14 @@ def listJobs():
         return jsonify({"error": "Authentication required"}), 401
     status = request.args.get("status", "open")
     limit = request.args.get("limit")
-    offset = request.args.get("offset", 0)
-    if limit:
-        jobs = jobController.listJobs(status=status, limit=limit, offset=offset, current_user=user)
-        return jsonify({"jobs": jobs}), 200
-    jobs = jobController.listJobs(status)
-    return jsonify({"jobs": [job.to_dict() for job in jobs]}), 200
+    try:
+        if "offset" in request.args:
+            jobs = jobController.listJobs(status=status, limit=limit or 200, offset=request.args.get("offset"), current_user=user)
+            return jsonify({"jobs": jobs}), 200
+        page = jobController.listJobsPage(status=status, limit=limit, cursor=request.args.get("cursor"), current_user=user)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(page), 200
 
 
 @job_bp.route("/<job_id>", methods=["GET"])
@@ -32,18 +35,17 @@ def getJob(job_id):
     user = currentUser()
     if not user:
         return jsonify({"error": "Authentication required"}), 401
-    job = next((record for record in jobController.listJobs(status="open", limit=500, offset=0, current_user=user) if str(record.get("jobID")) == str(job_id)), None)
-    if not job:
-        return jsonify({"error": "Job not found"}), 404
+    try:
+        job = jobController.getJobForUser(job_id, user)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
     return jsonify(job), 200
 
 
 @job_bp.route("", methods=["POST"])
-@jwt_required()
+@member_required
 def postJob():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni or admin access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     required = ["boardID", "title", "company", "description", "expiryDate"]
     missing = [f for f in required if not data.get(f)]
@@ -68,11 +70,9 @@ def postJob():
 
 
 @job_bp.route("/<job_id>", methods=["PATCH"])
-@jwt_required()
+@member_required
 def updateJob(job_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     is_admin = (user.role == "admin")
     try:
@@ -88,11 +88,9 @@ def updateJob(job_id):
 
 
 @job_bp.route("/<job_id>/close", methods=["POST"])
-@jwt_required()
+@member_required
 def closeJob(job_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     is_admin = (user.role == "admin")
     try:
         jobController.closeJob(job_id, user.userID, is_admin)
@@ -107,11 +105,9 @@ def closeJob(job_id):
 
 
 @job_bp.route("/<job_id>/applications", methods=["GET"])
-@jwt_required()
+@member_required
 def getJobApplications(job_id):
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     is_admin = (user.role == "admin")
     try:
         apps = jobController.viewJobApplications(job_id, user.userID, is_admin)
@@ -126,31 +122,25 @@ def getJobApplications(job_id):
 
 
 @job_bp.route("/applied/me", methods=["GET"])
-@jwt_required()
+@alumni_required
 def getAppliedJobs():
-    user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     jobs = jobController.showAppliedJobs(user.userID)
     return jsonify({"applications": jobs}), 200
 
 
 @job_bp.route("/saved/me", methods=["GET"])
-@jwt_required()
+@alumni_required
 def getSavedJobs():
-    user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     saved_ids = jobController.showSavedJobs(user.userID)
     return jsonify({"savedJobIDs": saved_ids}), 200
 
 
 @job_bp.route("/<job_id>/save", methods=["POST"])
-@jwt_required()
+@alumni_required
 def saveJob(job_id):
-    user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
+    user = currentUser(claims_only=True)
     try:
         result = jobController.saveJob(user.userID, job_id)
         return jsonify(result), 200
@@ -162,11 +152,9 @@ def saveJob(job_id):
 
 
 @job_bp.route("/<job_id>/testimonials", methods=["POST"])
-@jwt_required()
+@alumni_required
 def addTestimonial(job_id):
     user = currentUser()
-    if not user or user.role != "alumni":
-        return jsonify({"error": "Alumni access required"}), 403
     data = _payload()
     stars = data.get("stars")
     comment = data.get("comment")
@@ -189,11 +177,8 @@ def addTestimonial(job_id):
 
 
 @job_bp.route("/<job_id>/testimonials/<testimonial_id>", methods=["DELETE"])
-@jwt_required()
+@admin_required
 def deleteTestimonial(job_id, testimonial_id):
-    user = currentUser()
-    if not user or user.role != "admin":
-        return jsonify({"error": "Admin access required"}), 403
     try:
         jobController.deleteTestimonial(job_id, testimonial_id, is_admin=True)
         return jsonify({"message": "Testimonial deleted"}), 200
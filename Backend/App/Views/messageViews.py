@@ -1,49 +1,134 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
-from App.Controllers import messageController
+from App.Controllers import announcementController, messageController
 from App.utils import _payload
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import member_required
 
 
 message_bp = Blueprint("messages", __name__, url_prefix="/messages")
 
 
+def _messagePageResponse(fetch_page, user_id):
+    """Serialize one keyset page of messages using the `limit`/`cursor` query args."""
+    try:
+        page = fetch_page(user_id, limit=request.args.get("limit"), cursor=request.args.get("cursor"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    messages = [m.to_dict() for m in page["messages"]]
+    return jsonify({"messages": messages, "nextCursor": page["nextCursor"]}), 200
+
+
 @message_bp.route("/inbox", methods=["GET"])
 @jwt_required()
 def inbox():
-    user = currentUser()
+    user = currentUser(claims_only=True)
     if not user:
         return jsonify({"error": "Authentication required"}), 401
-    messages = [m.to_dict() for m in messageController.showInbox(user.userID)]
-    return jsonify({"messages": messages}), 200
+    try:
+        page = messageController.showInboxFeed(
+            user.userID, limit=request.args.get("limit"), cursor=request.args.get("cursor"),
+            include_announcements=user.role == "alumni",
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(page), 200
 
 
 @message_bp.route("/sent", methods=["GET"])
 @jwt_required()
 def sent():
-    user = currentUser()
+    user = currentUser(claims_only=True)
     if not user:
         return jsonify({"error": "Authentication required"}), 401
-    messages = [m.to_dict() for m in messageController.showSentMessages(user.userID)]
-    return jsonify({"messages": messages}), 200
+    return _messagePageResponse(messageController.showSentMessagesPage, user.userID)
 
 
 @message_bp.route("/requests", methods=["GET"])
 @jwt_required()
 def messageRequests():
-    user = currentUser()
+    user = currentUser(claims_only=True)
     if not user:
         return jsonify({"error": "Authentication required"}), 401
-    messages = [m.to_dict() for m in messageController.showMessageRequests(user.userID)]
-    return jsonify({"messages": messages}), 200
+    return _messagePageResponse(messageController.showMessageRequestsPage, user.userID)
 
 
-@message_bp.route("/request", methods=["POST"])
+@message_bp.route("/conversations", methods=["GET"])
+@jwt_required()
+def conversations():
+    user = currentUser(claims_only=True)
+    if not user:
+        return jsonify({"error": "Authentication required"}), 401
+    try:
+        page = messageController.listConversations(
+            user.userID, limit=request.args.get("limit"), cursor=request.args.get("cursor")
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(page), 200
+
+
+@message_bp.route("/conversations/<thread_id>", methods=["GET"])
+@jwt_required()
+def conversationMessages(thread_id):
+    user = currentUser(claims_only=True)
+    if not user:
+        return jsonify({"error": "Authentication required"}), 401
+    try:
+        page = messageController.showThreadPage(
+            user.userID, thread_id, limit=request.args.get("limit"), cursor=request.args.get("cursor")
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404 if "not found" in str(e).lower() else 400
+    messages = [m.to_dict() for m in page["messages"]]
+    return jsonify({"messages": messages, "nextCursor": page["nextCursor"]}), 200
+
+
+@message_bp.route("/conversations/<thread_id>/read", methods=["POST"])
+@jwt_required()
+def markConversationRead(thread_id):
+    user = currentUser(claims_only=True)
+    if not user:
+        return jsonify({"error": "Authentication required"}), 401
+    try:
+        messageController.markConversationRead(user.userID, thread_id)
+        return jsonify({"message": "Conversation marked as read", "threadID": thread_id}), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+
+@message_bp.route("/announcements", methods=["GET"])
 @jwt_required()
+def announcements():
+    user = currentUser(claims_only=True)
+    if not user:
+        return jsonify({"error": "Authentication required"}), 401
+    try:
+        page = announcementController.listAnnouncementsPage(
+            user.userID, limit=request.args.get("limit"), cursor=request.args.get("cursor")
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(page), 200
+
+
+@message_bp.route("/announcements/<announcement_id>/read", methods=["POST"])
+@jwt_required()
+def markAnnouncementRead(announcement_id):
+    user = currentUser(claims_only=True)
+    if not user:
+        return jsonify({"error": "Authentication required"}), 401
+    try:
+        announcementController.markAnnouncementRead(user.userID, announcement_id)
+        return jsonify({"message": "Announcement marked as read", "announcementID": announcement_id}), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+
+
+@message_bp.route("/request", methods=["POST"])
+@member_required
 def requestMessage():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     receiver_id = data.get("receiverID")
     content = data.get("content")
@@ -87,11 +172,9 @@ def rejectRequest(message_id):
 
 
 @message_bp.route("", methods=["POST"])
-@jwt_required()
+@member_required
 def sendMessage():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Authentication required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     receiver_id = data.get("receiverID")
     content = data.get("content")
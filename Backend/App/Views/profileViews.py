@@ -7,17 +7,16 @@ from App.Models import Alumni
 from App.database import db
 from App.utils import _payload
 from App.Controllers.userController import currentUser
+from App.Controllers.auth import member_required
 
 
 profile_bp = Blueprint("profiles", __name__, url_prefix="/profiles")
 
 
 @profile_bp.route("/me/data", methods=["GET"])
-@jwt_required()
+@member_required
 def myProfileApi():
     user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni or admin access required"}), 403
     profile_dict = profileController.viewProfile(user.userID)
     return jsonify({
         "profile": profile_dict,
@@ -46,11 +45,9 @@ def publicProfile(alumni_id):
 
 
 @profile_bp.route("/me/bio", methods=["PATCH"])
-@jwt_required()
+@member_required
 def updateBio():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni or admin access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     try:
         updated = profileController.updateBio(
@@ -69,11 +66,9 @@ def updateBio():
 
 
 @profile_bp.route("/me/photo", methods=["PATCH"])
-@jwt_required()
+@member_required
 def uploadPhoto():
-    user = currentUser()
-    if not user or user.role not in ("alumni", "admin"):
-        return jsonify({"error": "Alumni or admin access required"}), 403
+    user = currentUser(claims_only=True)
     data = _payload()
     photo_url = data.get("profilePicture")
     if not photo_url:
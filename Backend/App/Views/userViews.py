@@ -1,12 +1,9 @@
 from flask import Blueprint, jsonify, session
-import secrets
 from flask_jwt_extended import jwt_required, set_access_cookies, unset_jwt_cookies, verify_jwt_in_request
 from App.Controllers import userController
 from App.Controllers.auth import issue_access_token
-from App.database import db
 from App.utils import _payload
 from App.Controllers.userController import currentUser
-from App.Models import User
 
 
 user_bp = Blueprint("users", __name__, url_prefix="/users")
@@ -110,13 +107,9 @@ def forgotPassword():
     email = str(data.get("email") or "").strip().lower()
     if not email:
         return jsonify({"error": "Email required"}), 400
-    user = User.query.filter_by(email=email).first()
-    if not user:
+    token = userController.createPasswordResetToken(email)
+    if not token:
         return jsonify({"message": "If that email exists, a reset link has been sent."}), 200
-    token = secrets.token_urlsafe(32)
-    user.savedJobIDs = user.savedJobIDs or []
-    user.savedJobIDs.append(f"reset:{token}")
-    db.session.commit()
     return jsonify({"resetToken": token, "message": "Reset link generated"}), 200
 
 
@@ -130,16 +123,10 @@ def resetPassword():
         new_password = data.get("newPassword")
         if not token or not new_password:
             return jsonify({"error": "Token and new password required"}), 400
-        user = None
-        for u in User.query.all():
-            if u.savedJobIDs and f"reset:{token}" in u.savedJobIDs:
-                user = u
-                break
-        if not user:
-            return jsonify({"error": "Invalid or expired token"}), 400
-        user.savedJobIDs = [x for x in (user.savedJobIDs or []) if x != f"reset:{token}"]
-        user.set_password(new_password)
-        db.session.commit()
+        try:
+            userController.resetPasswordWithToken(token, new_password)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         return jsonify({"message": "Password reset successful"}), 200
 
     # Authenticated password change (requires JWT)
@@ -5,6 +5,7 @@ from flask import Flask, send_from_directory
 from flask_cors import CORS
 from flask_migrate import Migrate
 from App.Controllers.auth import setup_jwt, add_auth_context
+from App.Models.user import validate_password_hash_method
 
 from .database import db
 
@@ -54,9 +55,16 @@ def create_app(config_overrides: dict | None = None):
     app.config["JWT_COOKIE_SECURE"] = os.environ.get('PRODUCTION', 'false').lower() == 'true'
     app.config["JWT_COOKIE_CSRF_PROTECT"] = False
     app.config['FLASK_ADMIN_SWATCH'] = 'darkly'
+    # Profile name from App.Models.user.PASSWORD_HASH_PROFILES or a werkzeug method string
+    if os.environ.get('PASSWORD_HASH_METHOD'):
+        app.config['PASSWORD_HASH_METHOD'] = os.environ['PASSWORD_HASH_METHOD']
 
     if config_overrides:
         app.config.update(config_overrides)
+    # Fail at startup rather than on the first login or registration
+    for key in ("PASSWORD_HASH_METHOD", "SEED_PASSWORD_HASH_METHOD"):
+        if app.config.get(key):
+            validate_password_hash_method(app.config[key], key)
 
     db.init_app(app)
     migrate.init_app(app, db)
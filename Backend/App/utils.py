@@ -1,5 +1,10 @@
+import base64
+import binascii
+import json
 import re
+from datetime import date, datetime
 from flask import request
+from sqlalchemy import String, cast, func, literal, tuple_
 
 
 def _payload():
@@ -30,4 +35,70 @@ def _to_bool(value, default=False):
         return default
     if isinstance(value, bool):
         return value
-    return str(value).strip().lower() in {'1', 'true', 'yes', 'on'}
\ No newline at end of file
+    return str(value).strip().lower() in {'1', 'true', 'yes', 'on'}
+
+
+def _encode_cursor(*values):
+    """
+    Encode keyset values (dates, datetimes, strings) into an opaque URL-safe token.
+    """
+    raw = json.dumps([v.isoformat() if isinstance(v, (date, datetime)) else v for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(token, columns):
+    """
+    Decode a token produced by `_encode_cursor` back into values typed for `columns`.
+    Returns None for an empty token; raises ValueError for a malformed one or for
+    a value whose type does not match its column.
+    """
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        decoded = []
+        for column, value in zip(columns, values):
+            python_type = column.type.python_type
+            if python_type in (date, datetime):
+                value = python_type.fromisoformat(value)
+            elif not isinstance(value, python_type) or (isinstance(value, bool) and python_type is not bool):
+                raise ValueError
+            decoded.append(value)
+        return decoded
+    except (ValueError, TypeError, UnicodeError, binascii.Error):
+        raise ValueError("Invalid cursor")
+
+
+def _keyset_page(query, columns, cursor=None, limit=50, key=None):
+    """
+    Seek past `cursor` on `columns` (newest first) and return (rows, nextCursor).
+    `key` maps a result row to its keyset values; defaults to reading the column names off the row.
+    """
+    values = _decode_cursor(cursor, columns)
+    if values is not None:
+        query = query.filter(tuple_(*columns) < tuple_(*values))
+    rows = query.order_by(*[column.desc() for column in columns]).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    key = key or (lambda row: [getattr(row, column.key) for column in columns])
+    return rows, _encode_cursor(*key(rows[-1]))
+
+
+def _sql_uuid(dialect_name):
+    """
+    SQL expression yielding a random UUID-formatted string per row, so set-based
+    INSERT ... SELECT statements can mint String(36) primary keys in the database.
+    """
+    if dialect_name == "postgresql":
+        return cast(func.gen_random_uuid(), String(36))
+    if dialect_name in ("mysql", "mariadb"):
+        return func.uuid()
+    pieces = [func.lower(func.hex(func.randomblob(size))) for size in (4, 2, 2, 2, 6)]
+    expression = pieces[0]
+    for piece in pieces[1:]:
+        expression = expression + literal("-") + piece
+    return expression
@@ -1,5 +1,6 @@
 # File: UnitTests.py
 
+import gzip
 import sys
 import os
 import unittest
@@ -14,7 +15,8 @@ from App.main import create_app
 from App.database import db
 from App.Models import (
     User, Alumni, Admin, Event, EventRegistration, Job, JobApplication,
-    Message, BoardPost, CommunityBoard, Profile
+    Message, BoardPost, CommunityBoard, BoardMember, Profile, PostLike, PostComment,
+    Announcement, AnnouncementRead, WaitlistEntry, PasswordResetToken
 )
 
 from App.Controllers import (
@@ -28,8 +30,17 @@ from App.Controllers import (
     boardPostController,
     messageController,
     profileController,
+    taskController,
+    announcementController,
     communityBoardController
 )
+from App.Controllers.auth import issue_access_token, current_token_version, revoke_user_tokens, role_required, _resolve_user
+from flask_jwt_extended import decode_token
+from App.Controllers.userCache import clearUserCache, userCacheStats
+from App.Controllers.initialize import upgrade_schema
+from App.utils import _encode_cursor
+from flask_jwt_extended.exceptions import RevokedTokenError
+from sqlalchemy import event as sa_event, text as sa_text
 
 LOGGER = logging.getLogger(__name__)
 
@@ -219,6 +230,117 @@ class UserControllerUnitTests(unittest.TestCase):
         self.assertEqual(user.name, "New Name")
         self.assertEqual(user.email, "new@test.com")
 
+    def testResetPasswordWithToken(self):
+        user = userController.registerUser(
+            email="tokenreset@test.com", password="oldpass", name="Token", role="alumni",
+            graduationYear=2020, faculty="FST", degree="CS"
+        )
+        self.assertIsNone(userController.createPasswordResetToken("nobody@test.com"))
+        token = userController.createPasswordResetToken("TokenReset@test.com")
+        stored = PasswordResetToken.query.one()
+        self.assertNotEqual(stored.tokenHash, token)
+        userController.resetPasswordWithToken(token, "brandnew123")
+        self.assertTrue(check_password_hash(db.session.get(User, user["userID"]).password, "brandnew123"))
+        with self.assertRaises(ValueError):
+            userController.resetPasswordWithToken(token, "again12345")
+
+    def testSweepExpiredResetTokens(self):
+        userController.registerUser(
+            email="sweep@test.com", password="oldpass", name="Sweep", role="alumni",
+            graduationYear=2020, faculty="FST", degree="CS"
+        )
+        token = userController.createPasswordResetToken("sweep@test.com")
+        PasswordResetToken.query.update({"expiresAt": datetime(2000, 1, 1)})
+        db.session.commit()
+        with self.assertRaises(ValueError):
+            userController.resetPasswordWithToken(token, "brandnew123")
+        self.assertEqual(userController.sweepExpiredResetTokens(), 1)
+        self.assertEqual(PasswordResetToken.query.count(), 0)
+
+    def testUserSnapshotCacheInvalidation(self):
+        clearUserCache()
+        uid = userController.registerUser(
+            email="cache@test.com", password="pass123", name="Cache", role="alumni",
+            graduationYear=2020, faculty="FST", degree="CS"
+        )["userID"]
+        userController.showNotificationPreferences(uid)
+        userController.showNotificationPreferences(uid)
+        self.assertEqual((userCacheStats()["hits"], userCacheStats()["misses"]), (1, 1))
+        userController.updateNotificationPreferences(uid, {"email": True})
+        self.assertTrue(userController.showNotificationPreferences(uid)["email"])
+        # Another worker rewrites the row: visible once the local entry is rechecked
+        User.query.filter_by(userID=uid).update(
+            {"notificationPreferences": {"jobs": True}, "cacheVersion": User.cacheVersion + 1}
+        )
+        db.session.commit()
+        self.assertTrue(userController.showNotificationPreferences(uid)["email"])
+        self.app.config["USER_CACHE_TTL"] = 0
+        self.assertEqual(userController.showNotificationPreferences(uid), {"jobs": True})
+        self.assertEqual(userController.showNotificationPreferences(uid), {"jobs": True})
+        self.assertEqual(userCacheStats()["revalidations"], 1)
+
+    def testLoginRehashesOutdatedPassword(self):
+        uid = userController.registerUser(
+            email="rehash@test.com", password="pass123", name="Rehash", role="alumni",
+            graduationYear=2020, faculty="FST", degree="CS"
+        )["userID"]
+        user = db.session.get(User, uid)
+        self.assertTrue(user.password.startswith("pbkdf2:sha256:1000$"))
+        user.isApproved = True
+        db.session.commit()
+        self.app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:2000"
+        self.assertTrue(user.password_needs_rehash())
+        userController.loginUser("rehash@test.com", "pass123")
+        self.assertTrue(user.password.startswith("pbkdf2:sha256:2000$"))
+        self.assertFalse(user.password_needs_rehash())
+        self.assertTrue(user.check_password("pass123"))
+
+    def testInvalidPasswordHashMethodFailsAtStartup(self):
+        with self.assertRaises(ValueError) as ctx:
+            create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:', 'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:x'})
+        self.assertIn("PASSWORD_HASH_METHOD", str(ctx.exception))
+        with self.assertRaises(ValueError) as ctx:
+            create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:', 'SEED_PASSWORD_HASH_METHOD': 'bogus'})
+        self.assertIn("SEED_PASSWORD_HASH_METHOD", str(ctx.exception))
+
+    def testCurrentUserLoadedOncePerRequest(self):
+        user = userController.registerUser(
+            email="resolve@test.com", password="pass123", name="Resolve", role="alumni",
+            graduationYear=2020, faculty="FST", degree="CS"
+        )
+        token = issue_access_token(db.session.get(User, user["userID"]))
+        current_token_version(user["userID"])
+        db.session.expunge_all()
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        sa_event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            with self.app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+                claims = userController.currentUser(claims_only=True)
+                self.assertEqual((claims.role, claims.isApproved), ("alumni", False))
+                self.assertEqual(statements, [])
+                first = userController.currentUser()
+                second = userController.currentUser()
+        finally:
+            sa_event.remove(db.engine, "before_cursor_execute", listener)
+        self.assertIs(first, second)
+        self.assertIsInstance(first, Alumni)
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(first.faculty, "FST")
+        self.assertEqual(len(statements), 1)
+
+    def testDeletedUserTokenDoesNotResolve(self):
+        user = Admin(email="gone@test.com", password="h", name="Gone", role="admin",
+                     adminLevel="super", department="IT", isApproved=True)
+        db.session.add(user)
+        db.session.commit()
+        jwt_data = decode_token(issue_access_token(user))
+        db.session.delete(user)
+        db.session.commit()
+        with self.app.test_request_context():
+            self.assertIsNone(_resolve_user(jwt_data, claims_only=True))
+            self.assertIsNone(_resolve_user(jwt_data))
+
     def testResetPasswordSuccess(self):
         u = userController.registerUser(
             email="reset@test.com", password="oldpass", name="Reset", role="alumni",
@@ -363,6 +485,44 @@ class AdminControllerUnitTests(unittest.TestCase):
         adminControllers.approveUser(alum.userID)
         self.assertTrue(alum.isApproved)
 
+    def testClaimsDecoratorsAndSuspensionRevokeTokens(self):
+        alum = Alumni(email="claims@test.com", password="h", name="Claims", role="alumni",
+                      graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
+        db.session.add(alum)
+        db.session.commit()
+        alumni_view = role_required("alumni")(lambda: ("ok", 200))
+        admin_view = role_required("admin")(lambda: ("ok", 200))
+        headers = {"Authorization": f"Bearer {issue_access_token(alum)}"}
+        with self.app.test_request_context(headers=headers):
+            self.assertEqual(alumni_view(), ("ok", 200))
+            self.assertEqual(admin_view()[1], 403)
+        adminControllers.suspendUser(alum.userID, "spam", 3, self.admin_id)
+        self.assertTrue(alum.is_suspended())
+        with self.app.test_request_context(headers=headers):
+            with self.assertRaises(RevokedTokenError):
+                alumni_view()
+        headers = {"Authorization": f"Bearer {issue_access_token(alum)}"}
+        with self.app.test_request_context(headers=headers):
+            response, status = alumni_view()
+            self.assertEqual((status, response.get_json()["error"]), (403, "Account suspended"))
+
+    def testTokenRevocationAppliedOnlyOnCommit(self):
+        alum = Alumni(email="pending@test.com", password="h", name="Pending", role="alumni",
+                      graduationYear=2020, faculty="FST", degree="CS", isApproved=False)
+        db.session.add(alum)
+        db.session.commit()
+        self.assertEqual(current_token_version(alum.userID), 0)
+        revoke_user_tokens(db.session.get(User, alum.userID))
+        self.assertEqual(current_token_version(alum.userID), 0)
+        db.session.rollback()
+        self.assertEqual(current_token_version(alum.userID), 0)
+        headers = {"Authorization": f"Bearer {issue_access_token(alum)}"}
+        adminControllers.approveUser(alum.userID)
+        self.assertEqual(current_token_version(alum.userID), 1)
+        with self.app.test_request_context(headers=headers):
+            with self.assertRaises(RevokedTokenError):
+                role_required("alumni")(lambda: ("ok", 200))()
+
     def testGenerateReport(self):
         alum1 = Alumni(email="a1@test.com", password="h", name="A1", role="alumni",
                        graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
@@ -383,11 +543,30 @@ class AdminControllerUnitTests(unittest.TestCase):
         db.session.commit()
         count = adminControllers.sendAnnouncement(self.admin_id, "Test announcement")
         self.assertEqual(count, 3)
-        msgs = Message.query.filter_by(senderID=self.admin_id).all()
-        self.assertEqual(len(msgs), 3)
-        for msg in msgs:
-            self.assertEqual(msg.content, "Test announcement")
-            self.assertEqual(msg.status, "sent")
+        self.assertEqual(Announcement.query.count(), 1)
+        self.assertEqual(Announcement.query.first().content, "Test announcement")
+        self.assertEqual(Message.query.filter_by(senderID=self.admin_id).count(), 0)
+
+    def testInboxFeedMergesAnnouncements(self):
+        alum = Alumni(email="feed@test.com", password="h", name="Feed", role="alumni",
+                      graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
+        db.session.add(alum)
+        db.session.commit()
+        db.session.add(Message(senderID=self.admin_id, receiverID=alum.userID, content="Direct",
+                               status="sent", attachments=[], timestamp=datetime(2024, 1, 1)))
+        db.session.commit()
+        adminControllers.sendAnnouncement(self.admin_id, "Broadcast")
+        feed = messageController.showInboxFeed(alum.userID, limit=1, include_announcements=True)
+        self.assertEqual(feed["messages"][0]["type"], "announcement")
+        self.assertEqual(feed["messages"][0]["status"], "sent")
+        rest = messageController.showInboxFeed(alum.userID, limit=1, cursor=feed["nextCursor"], include_announcements=True)
+        self.assertEqual([m["content"] for m in rest["messages"]], ["Direct"])
+        self.assertIsNone(rest["nextCursor"])
+        announcementController.markAnnouncementRead(alum.userID, feed["messages"][0]["messageID"])
+        announcementController.markAnnouncementRead(alum.userID, feed["messages"][0]["messageID"])
+        feed = messageController.showInboxFeed(alum.userID, include_announcements=True)
+        self.assertEqual(feed["messages"][0]["status"], "read")
+        self.assertEqual(AnnouncementRead.query.count(), 1)
 
     # ---------- Negative Tests ----------
     def testApproveNonExistentFails(self):
@@ -473,6 +652,13 @@ class EventControllerUnitTests(unittest.TestCase):
         db.drop_all()
         self.ctx.pop()
 
+    def _guest(self, email="guest@test.com"):
+        guest = Alumni(email=email, password="h", name="Guest", role="alumni",
+                       graduationYear=2021, faculty="FST", degree="CS", isApproved=True)
+        db.session.add(guest)
+        db.session.commit()
+        return guest
+
     # ---------- Positive Tests ----------
     def testCreateEventSuccess(self):
         event_id = eventController.createEvent(
@@ -496,6 +682,191 @@ class EventControllerUnitTests(unittest.TestCase):
         reg = db.session.get(EventRegistration, reg_id)
         self.assertEqual(reg.status, "registered")
 
+    def testSendRemindersSkipsDuplicates(self):
+        event_id = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Remind Event", description="", date_str="2030-12-31",
+            time_str="18:00", location="", max_attendees=5
+        )
+        guest = self._guest()
+        eventRegistrationControllers.registerForEvent(event_id, self.alum.userID)
+        eventRegistrationControllers.registerForEvent(event_id, guest.userID)
+        self.assertEqual(eventController.sendReminders(event_id, self.alum.userID), 1)
+        self.assertEqual(eventController.dispatchReminders(event_id, self.alum.userID), {"sent": 0, "skipped": 1})
+        reminder = Message.query.filter_by(receiverID=guest.userID).one()
+        self.assertEqual(len(reminder.messageID), 36)
+        self.assertIn("Remind Event", reminder.content)
+        self.assertEqual(reminder.attachments, [])
+        thread = messageController.listConversations(guest.userID)["conversations"][0]
+        self.assertEqual((thread["threadID"], thread["unreadCount"]), (reminder.threadID, 1))
+        self.assertEqual(thread["lastMessageID"], reminder.messageID)
+
+    def testStartRemindersReportsCounts(self):
+        event_id = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Async Event", description="", date_str="2030-12-31",
+            time_str="18:00", location="", max_attendees=5
+        )
+        eventRegistrationControllers.registerForEvent(event_id, self._guest().userID)
+        queued = eventController.startReminders(event_id, self.alum.userID)
+        task = taskController.getTask(queued["taskID"], self.alum.userID)
+        self.assertEqual(task["status"], "completed")
+        self.assertEqual(task["result"], {"sent": 1, "skipped": 0})
+        with self.assertRaises(PermissionError):
+            taskController.getTask(queued["taskID"], "someone-else")
+
+    def testSendUpcomingRemindersWithinWindow(self):
+        soon = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Soon", description="", date_str="2030-06-01",
+            time_str="09:00", location="", max_attendees=5
+        )
+        later = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Later", description="", date_str="2030-06-05",
+            time_str="09:00", location="", max_attendees=5
+        )
+        guest = self._guest()
+        for event_id in (soon, later):
+            eventRegistrationControllers.registerForEvent(event_id, guest.userID)
+        now = datetime(2030, 5, 31, 12, 0)
+        self.assertEqual(eventController.sendUpcomingReminders(24, now=now), {"events": 1, "sent": 1})
+        self.assertEqual(eventController.sendUpcomingReminders(24, now=now), {"events": 1, "sent": 0})
+        self.assertEqual(eventController.sendUpcomingReminders(24 * 7, now=now), {"events": 2, "sent": 1})
+        self.assertEqual(messageController.listConversations(guest.userID)["conversations"][0]["unreadCount"], 2)
+
+    def testSeatCounterAndReconcile(self):
+        event_id = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Seats", description="", date_str="2030-12-31",
+            time_str="18:00", location="", max_attendees=1
+        )
+        reg_id = eventRegistrationControllers.registerForEvent(event_id, self.alum.userID)
+        self.assertEqual(db.session.get(Event, event_id).registeredCount, 1)
+        eventRegistrationControllers.cancelRegistration(reg_id, self.alum.userID)
+        eventRegistrationControllers.cancelRegistration(reg_id, self.alum.userID)
+        self.assertEqual(db.session.get(Event, event_id).registeredCount, 0)
+        Event.query.filter_by(eventID=event_id).update({"registeredCount": 1})
+        db.session.commit()
+        self.assertEqual(eventRegistrationControllers.reconcileSeatCounts(), 1)
+        self.assertEqual(db.session.get(Event, event_id).registeredCount, 0)
+
+    def testWaitlistPromotedWhenSeatFrees(self):
+        other = Alumni(email="waiter@test.com", password="h", name="Waiter", role="alumni",
+                       graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
+        db.session.add(other)
+        db.session.commit()
+        event_id = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Waitlisted", description="", date_str="2030-12-31",
+            time_str="18:00", location="", max_attendees=1
+        )
+        reg_id = eventRegistrationControllers.registerForEvent(event_id, self.alum.userID)
+        self.assertEqual(eventRegistrationControllers.joinWaitlist(event_id, other.userID), 1)
+        eventRegistrationControllers.cancelRegistration(reg_id, self.alum.userID)
+        promoted = EventRegistration.query.filter_by(eventID=event_id, attendeeID=other.userID).one()
+        self.assertEqual(promoted.status, "registered")
+        self.assertEqual(db.session.get(Event, event_id).registeredCount, 1)
+        self.assertEqual(WaitlistEntry.query.count(), 0)
+
+    def testCancelledAttendeeCanRegisterAgain(self):
+        event_id = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Second Chance", description="", date_str="2030-12-31",
+            time_str="18:00", location="", max_attendees=1
+        )
+        reg_id = eventRegistrationControllers.registerForEvent(event_id, self.alum.userID)
+        eventRegistrationControllers.cancelRegistration(reg_id, self.alum.userID)
+        result = eventRegistrationControllers.registerOrWaitlist(event_id, self.alum.userID, "paid")
+        self.assertEqual(result, {"status": "registered", "registrationID": reg_id})
+        reg = db.session.get(EventRegistration, reg_id)
+        self.assertEqual((reg.status, reg.paymentStatus), ("registered", "paid"))
+        self.assertEqual(db.session.get(Event, event_id).registeredCount, 1)
+
+        guest = self._guest()
+        eventRegistrationControllers.cancelRegistration(reg_id, self.alum.userID)
+        eventRegistrationControllers.registerForEvent(event_id, guest.userID)
+        result = eventRegistrationControllers.registerOrWaitlist(event_id, self.alum.userID)
+        self.assertEqual(result, {"status": "waitlisted", "position": 1})
+
+    def testWaitlistIsFifoAndNotifiesPromoted(self):
+        waiters = []
+        for i in range(3):
+            waiter = Alumni(email=f"fifo{i}@test.com", password="h", name=f"Fifo{i}", role="alumni",
+                            graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
+            db.session.add(waiter)
+            waiters.append(waiter)
+        db.session.commit()
+        event_id = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Reunion", description="", date_str="2030-12-31",
+            time_str="18:00", location="", max_attendees=1
+        )
+        reg_id = eventController.registerEvent(event_id, self.alum.userID, waitlist=True)["registrationID"]
+        results = [eventController.registerEvent(event_id, w.userID, waitlist=True) for w in waiters]
+        self.assertEqual([r["position"] for r in results], [1, 2, 3])
+        self.assertEqual(eventRegistrationControllers.getWaitlistStatus(event_id, waiters[2].userID)["ahead"], 2)
+        eventRegistrationControllers.leaveWaitlist(event_id, waiters[0].userID)
+        eventRegistrationControllers.cancelRegistration(reg_id, self.alum.userID)
+        seated = EventRegistration.query.filter_by(eventID=event_id, status="registered").one()
+        self.assertEqual(seated.attendeeID, waiters[1].userID)
+        notice = Message.query.filter_by(receiverID=waiters[1].userID).one()
+        self.assertIsNotNone(notice.threadID)
+        self.assertIn("Reunion", notice.content)
+        self.assertEqual(eventRegistrationControllers.getWaitlistStatus(event_id, waiters[2].userID)["ahead"], 0)
+
+    def testBulkCheckInIsIdempotent(self):
+        event_id = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Door", description="", date_str="2030-12-31",
+            time_str="18:00", location="", max_attendees=5
+        )
+        reg_id = eventRegistrationControllers.registerForEvent(event_id, self.alum.userID)
+        first = eventRegistrationControllers.bulkCheckIn(event_id, self.alum.userID, [reg_id, "missing"])
+        self.assertEqual([r["result"] for r in first], ["checked_in", "not_found"])
+        retry = eventRegistrationControllers.bulkCheckIn(event_id, self.alum.userID, attendee_ids=[self.alum.userID])
+        self.assertEqual(retry, [{"attendeeID": self.alum.userID, "result": "already_checked_in"}])
+        reg = db.session.get(EventRegistration, reg_id)
+        self.assertEqual(reg.status, "checked_in")
+        self.assertIsNotNone(reg.checkedInAt)
+        with self.assertRaises(PermissionError):
+            eventRegistrationControllers.bulkCheckIn(event_id, "someone-else", [reg_id])
+        with self.assertRaises(ValueError):
+            eventRegistrationControllers.bulkCheckIn(event_id, self.alum.userID, [[reg_id]])
+        with self.assertRaises(ValueError):
+            eventRegistrationControllers.bulkCheckIn(event_id, self.alum.userID, attendee_ids=self.alum.userID)
+
+    def testOfflineSnapshotAndReplay(self):
+        event_id = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Offline", description="", date_str="2030-12-31",
+            time_str="18:00", location="", max_attendees=5
+        )
+        eventRegistrationControllers.registerForEvent(event_id, self.alum.userID)
+        snapshot = gzip.decompress(b"".join(eventRegistrationControllers.exportCheckInSnapshot(event_id, self.alum.userID)))
+        header, line = snapshot.decode("utf-8").splitlines()
+        attendee_id, name, code, checked_in = line.split("\t")
+        self.assertEqual((attendee_id, name, checked_in), (self.alum.userID, "EventUser", "0"))
+        results = eventRegistrationControllers.replayOfflineCheckIns(event_id, self.alum.userID, [
+            {"attendeeID": attendee_id, "code": code, "checkedInAt": "2030-12-31T18:05:00Z"},
+            {"attendeeID": attendee_id, "code": code, "checkedInAt": "2030-12-31T18:01:00Z"},
+            {"attendeeID": attendee_id, "code": "wrong", "checkedInAt": "2030-12-31T18:00:00Z"},
+        ])
+        self.assertEqual([r["result"] for r in results], ["checked_in", "duplicate", "invalid"])
+        with self.assertRaises(ValueError):
+            eventRegistrationControllers.replayOfflineCheckIns(event_id, self.alum.userID, [
+                {"attendeeID": [attendee_id], "code": code, "checkedInAt": "2030-12-31T18:00:00Z"},
+            ])
+        reg = EventRegistration.query.filter_by(eventID=event_id).one()
+        self.assertEqual(reg.status, "checked_in")
+        self.assertEqual(reg.checkedInAt, datetime(2030, 12, 31, 18, 1))
+        again = eventRegistrationControllers.replayOfflineCheckIns(event_id, self.alum.userID, [
+            {"attendeeID": attendee_id, "code": code, "checkedInAt": "2030-12-31T17:59:00"},
+        ])
+        self.assertEqual(again[0]["result"], "already_checked_in")
+        db.session.expire_all()
+        self.assertEqual(db.session.get(EventRegistration, reg.registrationID).checkedInAt, datetime(2030, 12, 31, 17, 59))
+
     def testCancelEventAsCreator(self):
         event_id = eventController.createEvent(
             alumni_id=self.alum.userID, board_id=self.board.boardID,
@@ -526,6 +897,20 @@ class EventControllerUnitTests(unittest.TestCase):
         result = eventController.unregisterEvent(event_id, self.alum.userID)
         self.assertFalse(result["registered"])
 
+    def testGetEventForUser(self):
+        event_id = eventController.createEvent(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Detail Event", description="", date_str="2025-12-31",
+            time_str="18:00", location="", max_attendees=5
+        )
+        event = eventController.getEventForUser(event_id, self.alum)
+        self.assertFalse(event["registered"])
+        self.assertEqual(event["registeredCount"], 0)
+        eventController.registerEvent(event_id, self.alum.userID)
+        event = eventController.getEventForUser(event_id, self.alum)
+        self.assertTrue(event["registered"])
+        self.assertEqual(event["registeredCount"], 1)
+
     # ---------- Negative Tests ----------
     def testCreateEventInvalidDateFails(self):
         with self.assertRaises(ValueError):
@@ -546,6 +931,10 @@ class EventControllerUnitTests(unittest.TestCase):
             eventRegistrationControllers.registerForEvent(event_id, self.alum.userID)
         self.assertIn("already registered", str(ctx.exception).lower())
 
+    def testGetEventForUserNotFoundFails(self):
+        with self.assertRaises(ValueError):
+            eventController.getEventForUser("missing-event", self.alum)
+
     def testCancelEventAsNonCreatorFails(self):
         other = Alumni(email="other@test.com", password="h", name="Other", role="alumni",
                        graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
@@ -645,6 +1034,60 @@ class JobControllerUnitTests(unittest.TestCase):
         job = db.session.get(Job, job_id)
         self.assertEqual(job.testimonials, [])
 
+    def testListJobsPageKeyset(self):
+        for i in range(5):
+            jobController.createJob(
+                alumni_id=self.alum.userID, board_id=self.board.boardID,
+                title=f"Job{i}", company="Co", description="", expiry_date_str="2025-12-31"
+            )
+        closed_id = jobController.createJob(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Closed", company="Co", description="", expiry_date_str="2025-12-31"
+        )
+        jobController.closeJob(closed_id, self.alum.userID)
+        first = jobController.listJobsPage(status="open", limit=2, current_user=self.alum)
+        self.assertEqual(len(first["jobs"]), 2)
+        self.assertIsNotNone(first["nextCursor"])
+        seen = [job["jobID"] for job in first["jobs"]]
+        cursor = first["nextCursor"]
+        while cursor:
+            page = jobController.listJobsPage(status="open", limit=2, cursor=cursor, current_user=self.alum)
+            seen.extend(job["jobID"] for job in page["jobs"])
+            cursor = page["nextCursor"]
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+        self.assertNotIn(closed_id, seen)
+        self.assertFalse(first["jobs"][0]["applied"])
+
+    def testListJobsOffsetFiltersStatus(self):
+        open_id = jobController.createJob(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Open", company="Co", description="", expiry_date_str="2025-12-31"
+        )
+        closed_id = jobController.createJob(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Closed", company="Co", description="", expiry_date_str="2025-12-31"
+        )
+        jobController.closeJob(closed_id, self.alum.userID)
+        open_jobs = jobController.listJobs(status="open", limit=10, current_user=self.alum)
+        closed_jobs = jobController.listJobs(status="closed", limit=10, current_user=self.alum)
+        self.assertEqual([job["jobID"] for job in open_jobs], [open_id])
+        self.assertEqual([job["jobID"] for job in closed_jobs], [closed_id])
+
+    def testGetJobForUser(self):
+        job_id = jobController.createJob(
+            alumni_id=self.alum.userID, board_id=self.board.boardID,
+            title="Single", company="Co", description="", expiry_date_str="2025-12-31"
+        )
+        jobController.saveJob(self.alum.userID, job_id)
+        db.session.add(JobApplication(jobID=job_id, alumniID=self.alum.userID, status="pending"))
+        db.session.commit()
+        job = jobController.getJobForUser(job_id, self.alum)
+        self.assertEqual(job["jobID"], job_id)
+        self.assertTrue(job["applied"])
+        self.assertEqual(job["applicationStatus"], "pending")
+        self.assertTrue(job["saved"])
+
     # ---------- Negative Tests ----------
     def testCreateJobInvalidExpiryFails(self):
         with self.assertRaises(ValueError):
@@ -654,6 +1097,22 @@ class JobControllerUnitTests(unittest.TestCase):
                 expiry_date_str="invalid"
             )
 
+    def testGetJobForUserNotFoundFails(self):
+        with self.assertRaises(ValueError):
+            jobController.getJobForUser("missing-job", self.alum)
+
+    def testListJobsPageInvalidCursorFails(self):
+        with self.assertRaises(ValueError):
+            jobController.listJobsPage(cursor="not-a-cursor")
+
+    def testListJobsPageMistypedCursorFails(self):
+        posted = datetime(2025, 1, 1)
+        for job_id in (5, True, None, ["job"], {"id": "job"}):
+            with self.assertRaises(ValueError):
+                jobController.listJobsPage(cursor=_encode_cursor(posted, job_id))
+        with self.assertRaises(ValueError):
+            jobController.listJobsPage(cursor=_encode_cursor(20250101, "job"))
+
     def testUpdateJobAsNonOwnerFails(self):
         other = Alumni(email="otherjob@test.com", password="h", name="Other", role="alumni",
                        graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
@@ -700,6 +1159,16 @@ class JobApplicationControllerUnitTests(unittest.TestCase):
         self.assertIsNotNone(app_obj)
         self.assertEqual(app_obj.status, "pending")
 
+    def testApplicationConfirmationLandsInThread(self):
+        admin = Admin(email="sysadmin@test.com", password="h", name="Admin", role="admin",
+                      adminLevel="super", department="IT", isApproved=True)
+        db.session.add(admin)
+        db.session.commit()
+        jobApplicationController.createApplication(self.alum.userID, self.job.jobID)
+        threads = messageController.listConversations(self.alum.userID)["conversations"]
+        self.assertEqual([(t["peerID"], t["unreadCount"]) for t in threads], [(admin.userID, 1)])
+        self.assertIn("Test Job", threads[0]["lastMessage"]["content"])
+
     def testViewApplicationAsOwner(self):
         app = jobApplicationController.createApplication(self.alum.userID, self.job.jobID)
         fetched = jobApplicationController.viewApplication(app.applicationID, self.alum.userID, is_admin=False)
@@ -787,7 +1256,8 @@ class BoardPostControllerUnitTests(unittest.TestCase):
         comment = boardPostController.addComment(post.postID, self.alum.userID, "Author Name", "Nice post")
         self.assertEqual(comment["content"], "Nice post")
         post_refresh = db.session.get(BoardPost, post.postID)
-        self.assertEqual(len(post_refresh.comments), 1)
+        self.assertEqual(post_refresh.commentsCount, 1)
+        self.assertEqual(PostComment.query.filter_by(postID=post.postID).count(), 1)
 
     def testListAllPosts(self):
         boardPostController.createBoardPost(self.alum.userID, self.board.boardID, "Hello world")
@@ -797,6 +1267,81 @@ class BoardPostControllerUnitTests(unittest.TestCase):
         self.assertIn("authorName", first)
         self.assertIn("commentsCount", first)
 
+    def testListPostFeedPaginates(self):
+        for i in range(5):
+            boardPostController.createBoardPost(self.alum.userID, self.board.boardID, f"Post {i}")
+        first = boardPostController.listPostFeed(limit=3)
+        self.assertEqual(len(first["posts"]), 3)
+        self.assertEqual(first["posts"][0]["authorName"], "PostUser")
+        self.assertEqual(first["posts"][0]["content"], "Post 4")
+        second = boardPostController.listPostFeed(limit=3, cursor=first["nextCursor"])
+        self.assertEqual([p["content"] for p in second["posts"]], ["Post 1", "Post 0"])
+        self.assertIsNone(second["nextCursor"])
+
+    def testLikesStoredInPostLikes(self):
+        post = boardPostController.createBoardPost(self.alum.userID, self.board.boardID, "Like table")
+        boardPostController.likePost(post.postID, self.alum.userID)
+        self.assertTrue(boardPostController.isPostLikedBy(post.postID, self.alum.userID))
+        self.assertEqual(PostLike.query.filter_by(postID=post.postID).count(), 1)
+        feed = boardPostController.listPostFeed(viewer_id=self.alum.userID)
+        self.assertTrue(feed["posts"][0]["liked"])
+        self.assertEqual(feed["posts"][0]["likedBy"], [self.alum.userID])
+        likers = boardPostController.listPostLikers(post.postID)
+        self.assertEqual(likers["likedBy"], [self.alum.userID])
+
+    def testMigrateLegacyLikes(self):
+        post = BoardPost(boardID=self.board.boardID, alumniID=self.alum.userID, content="Legacy",
+                         likesCount=2, likedBy=[self.alum.userID, "someone-else"])
+        db.session.add(post)
+        db.session.commit()
+        self.assertEqual(boardPostController.migrateLegacyLikes(), {"inserted": 1, "skipped": 1})
+        self.assertEqual(boardPostController.migrateLegacyLikes(), {"inserted": 0, "skipped": 0})
+        refreshed = db.session.get(BoardPost, post.postID)
+        self.assertEqual(refreshed.likedBy, [])
+        self.assertEqual(refreshed.likesCount, 1)
+        self.assertTrue(boardPostController.isPostLikedBy(post.postID, self.alum.userID))
+
+    def testListCommentsPaginatesAndFeedShowsLatest(self):
+        post = boardPostController.createBoardPost(self.alum.userID, self.board.boardID, "Thread")
+        for i in range(5):
+            boardPostController.addComment(post.postID, self.alum.userID, "PostUser", f"Comment {i}")
+        page = boardPostController.listComments(post.postID, limit=4)
+        self.assertEqual(page["comments"][0]["content"], "Comment 4")
+        self.assertEqual(page["comments"][0]["authorName"], "PostUser")
+        rest = boardPostController.listComments(post.postID, limit=4, cursor=page["nextCursor"])
+        self.assertEqual([c["content"] for c in rest["comments"]], ["Comment 0"])
+        feed_post = boardPostController.listPostFeed()["posts"][0]
+        self.assertEqual(feed_post["commentsCount"], 5)
+        self.assertEqual([c["content"] for c in feed_post["comments"]], ["Comment 2", "Comment 3", "Comment 4"])
+
+    def testMigrateLegacyComments(self):
+        post = BoardPost(boardID=self.board.boardID, alumniID=self.alum.userID, content="Legacy", comments=[
+            {"commentID": "1", "authorID": self.alum.userID, "authorName": "PostUser",
+             "content": "Old comment", "time": "2024-01-01T10:00:00"},
+            {"commentID": "2", "authorID": "deleted-user", "content": "Orphan"},
+            {"commentID": "3", "authorID": self.alum.userID, "content": ""},
+        ])
+        db.session.add(post)
+        db.session.commit()
+        self.assertEqual(boardPostController.migrateLegacyComments(), {"inserted": 1, "skipped": 2})
+        self.assertEqual(boardPostController.migrateLegacyComments(), {"inserted": 0, "skipped": 2})
+        refreshed = db.session.get(BoardPost, post.postID)
+        self.assertEqual([c["commentID"] for c in refreshed.comments], ["2", "3"])
+        self.assertEqual(refreshed.commentsCount, 1)
+
+    def testUpgradeSchemaAddsMissingColumnsAndIndexes(self):
+        post = boardPostController.createBoardPost(self.alum.userID, self.board.boardID, "Before upgrade")
+        db.session.execute(sa_text("DROP INDEX ix_board_posts_posted"))
+        db.session.execute(sa_text('ALTER TABLE board_posts DROP COLUMN "commentsCount"'))
+        db.session.execute(sa_text('ALTER TABLE users DROP COLUMN "tokenVersion"'))
+        db.session.commit()
+        applied = upgrade_schema()
+        self.assertEqual(sorted(applied), ["board_posts.commentsCount", "ix_board_posts_posted", "users.tokenVersion"])
+        self.assertEqual(upgrade_schema(), [])
+        db.session.expire_all()
+        self.assertEqual(db.session.get(BoardPost, post.postID).commentsCount, 0)
+        self.assertEqual(current_token_version(self.alum.userID), 0)
+
     # ---------- Negative Tests ----------
     def testCreateBoardPostEmptyContentFails(self):
         with self.assertRaises(ValueError):
@@ -867,6 +1412,55 @@ class MessageControllerUnitTests(unittest.TestCase):
         self.assertEqual(len(requests), 1)
         self.assertEqual(requests[0].status, "requested")
 
+    def testInboxCursorPagination(self):
+        base = datetime(2024, 1, 1, 12, 0)
+        for i in range(5):
+            db.session.add(Message(senderID=self.sender.userID, receiverID=self.receiver.userID,
+                                   content=f"m{i}", status="sent", attachments=[],
+                                   timestamp=base + timedelta(minutes=i)))
+        db.session.commit()
+        first = messageController.showInboxPage(self.receiver.userID, limit=2)
+        self.assertEqual([m.content for m in first["messages"]], ["m4", "m3"])
+        second = messageController.showInboxPage(self.receiver.userID, limit=2, cursor=first["nextCursor"])
+        third = messageController.showInboxPage(self.receiver.userID, limit=2, cursor=second["nextCursor"])
+        self.assertEqual([m.content for m in second["messages"] + third["messages"]], ["m2", "m1", "m0"])
+        self.assertIsNone(third["nextCursor"])
+        with self.assertRaises(ValueError):
+            messageController.showSentMessagesPage(self.sender.userID, cursor="bogus")
+
+    def testInboxPageLoadsNamesEagerly(self):
+        messageController.sendMessage(self.sender.userID, self.receiver.userID, "Hello")
+        db.session.expire_all()
+        messages = messageController.showInbox(self.receiver.userID)
+        db.session.expunge_all()  # a lazy load on a detached instance would raise
+        data = messages[0].to_dict()
+        self.assertEqual(data["senderName"], "Sender")
+        self.assertEqual(data["receiverName"], "Receiver")
+
+    def testSendMessageUpdatesConversation(self):
+        messageController.sendMessage(self.sender.userID, self.receiver.userID, "One")
+        last_id = messageController.sendMessage(self.sender.userID, self.receiver.userID, "Two")
+        threads = messageController.listConversations(self.receiver.userID)["conversations"]
+        self.assertEqual(len(threads), 1)
+        self.assertEqual(threads[0]["peerName"], "Sender")
+        self.assertEqual(threads[0]["unreadCount"], 2)
+        self.assertEqual(threads[0]["lastMessageID"], last_id)
+        thread_id = threads[0]["threadID"]
+        page = messageController.showThreadPage(self.sender.userID, thread_id)
+        self.assertEqual([m.content for m in page["messages"]], ["Two", "One"])
+        messageController.markConversationRead(self.receiver.userID, thread_id)
+        self.assertEqual(messageController.listConversations(self.receiver.userID)["conversations"][0]["unreadCount"], 0)
+        self.assertEqual(messageController.listConversations(self.sender.userID)["conversations"][0]["unreadCount"], 0)
+
+    def testBackfillConversations(self):
+        db.session.add(Message(senderID=self.sender.userID, receiverID=self.receiver.userID,
+                               content="Old", status="sent", attachments=[]))
+        db.session.commit()
+        self.assertEqual(messageController.backfillConversations(), 1)
+        self.assertEqual(messageController.backfillConversations(), 0)
+        threads = messageController.listConversations(self.sender.userID)["conversations"]
+        self.assertEqual(threads[0]["lastMessage"]["content"], "Old")
+
     # ---------- Negative Tests ----------
     def testRequestMessageToBlockedUserFails(self):
         # Block receiver
@@ -874,6 +1468,25 @@ class MessageControllerUnitTests(unittest.TestCase):
         with self.assertRaises(PermissionError):
             messageController.requestMessage(self.sender.userID, self.receiver.userID, "Hi")
 
+    def testShowThreadPageRequiresParticipant(self):
+        messageController.sendMessage(self.sender.userID, self.receiver.userID, "Hi")
+        thread_id = messageController.listConversations(self.sender.userID)["conversations"][0]["threadID"]
+        outsider = Alumni(email="outsider@test.com", password="h", name="Out", role="alumni",
+                          graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
+        db.session.add(outsider)
+        db.session.commit()
+        with self.assertRaises(ValueError):
+            messageController.showThreadPage(outsider.userID, thread_id)
+
+    def testSelfMessageRejectedAndSkippedByBackfill(self):
+        with self.assertRaises(ValueError):
+            messageController.sendMessage(self.sender.userID, self.sender.userID, "Note to self")
+        db.session.add(Message(senderID=self.sender.userID, receiverID=self.sender.userID,
+                               content="Legacy note", status="sent", attachments=[]))
+        db.session.commit()
+        self.assertEqual(messageController.backfillConversations(batch_size=1), 0)
+        self.assertEqual(messageController.listConversations(self.sender.userID)["conversations"], [])
+
 
 class ProfileControllerUnitTests(unittest.TestCase):
     def setUp(self):
@@ -978,6 +1591,68 @@ class CommunityBoardControllerUnitTests(unittest.TestCase):
         members = communityBoardController.listBoardMembers(board_id)
         self.assertFalse(any(m["userID"] == other.userID for m in members))
 
+    def testMembershipStoredInBoardMembers(self):
+        board_id = communityBoardController.createBoard(self.alum.userID, "Rows Board", "")
+        owner_row = BoardMember.query.filter_by(boardID=board_id, alumniID=self.alum.userID).first()
+        self.assertEqual(owner_row.role, "owner")
+        other = Alumni(email="rowjoiner@test.com", password="h", name="RowJoiner", role="alumni",
+                       graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
+        db.session.add(other)
+        db.session.commit()
+        communityBoardController.joinBoard(other.userID, board_id)
+        self.assertTrue(communityBoardController.isBoardMember(board_id, other.userID))
+        entry = next(b for b in communityBoardController.listBoardsForUser(other.userID) if b["board"].boardID == board_id)
+        self.assertEqual(entry["members"], 2)
+        self.assertTrue(entry["isMember"])
+
+    def testListBoardsForUserSearchAndPaging(self):
+        for name in ["Alpha Club", "Beta Club", "Gamma Guild"]:
+            communityBoardController.createBoard(self.alum.userID, name, "")
+        clubs = communityBoardController.listBoardsForUser(self.alum.userID, search="club")
+        self.assertEqual([b["board"].name for b in clubs], ["Alpha Club", "Beta Club"])
+        self.assertEqual(clubs[0]["adminName"], "Owner")
+        self.assertEqual(clubs[0]["members"], 1)
+        self.assertTrue(clubs[0]["isMember"])
+        page = communityBoardController.listBoardsForUser(self.alum.userID, limit=1, offset=2)
+        self.assertEqual([b["board"].name for b in page], ["Gamma Guild"])
+
+    def testListBoardsForUserSearchIsLiteral(self):
+        for name in ["100% Alumni", "Class_2020", "Class 2020", "Back\\Slash"]:
+            communityBoardController.createBoard(self.alum.userID, name, "")
+        def names(search):
+            return [b["board"].name for b in communityBoardController.listBoardsForUser(self.alum.userID, search=search)]
+        self.assertEqual(names("%"), ["100% Alumni"])
+        self.assertEqual(names("s_2"), ["Class_2020"])
+        self.assertEqual(names("\\"), ["Back\\Slash"])
+
+    def testListBoardMembersOrderingAndProjection(self):
+        board_id = communityBoardController.createBoard(self.alum.userID, "Sorted Board", "")
+        for name in ["Zed", "Amy"]:
+            member = Alumni(email=f"{name.lower()}@test.com", password="h", name=name, role="alumni",
+                            graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
+            db.session.add(member)
+            db.session.commit()
+            communityBoardController.joinBoard(member.userID, board_id)
+        members = communityBoardController.listBoardMembers(board_id)
+        self.assertEqual([m["name"] for m in members], ["Owner", "Amy", "Zed"])
+        self.assertTrue(members[0]["isAdmin"])
+        page = communityBoardController.listBoardMembers(board_id, limit=1, offset=2, include_email=False)
+        self.assertEqual([m["name"] for m in page], ["Zed"])
+        self.assertNotIn("email", page[0])
+
+    def testMigrateLegacyMembers(self):
+        other = Alumni(email="legacymember@test.com", password="h", name="Legacy", role="alumni",
+                       graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
+        db.session.add(other)
+        db.session.commit()
+        board = CommunityBoard(alumniID=self.alum.userID, name="Legacy Board", memberIDs=[other.userID, "deleted-user"])
+        db.session.add(board)
+        db.session.commit()
+        self.assertEqual(communityBoardController.migrateLegacyMembers(), {"inserted": 2, "skipped": 1})
+        self.assertEqual(communityBoardController.migrateLegacyMembers(), {"inserted": 0, "skipped": 0})
+        self.assertTrue(communityBoardController.isBoardMember(board.boardID, other.userID))
+        self.assertEqual(db.session.get(CommunityBoard, board.boardID).memberIDs, [])
+
     # ---------- Negative Tests ----------
     def testCreateBoardMissingNameFails(self):
         with self.assertRaises(ValueError):
@@ -993,6 +1668,15 @@ class CommunityBoardControllerUnitTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             communityBoardController.leaveBoard(self.alum.userID, board_id)
 
+    def testCreatePostInBoardNonMemberFails(self):
+        board_id = communityBoardController.createBoard(self.alum.userID, "Closed Board", "")
+        outsider = Alumni(email="outsider@test.com", password="h", name="Outsider", role="alumni",
+                          graduationYear=2020, faculty="FST", degree="CS", isApproved=True)
+        db.session.add(outsider)
+        db.session.commit()
+        with self.assertRaises(PermissionError):
+            communityBoardController.createPostInBoard(board_id, outsider.userID, "Hi")
+
     def testLeaveBoardNonMemberFails(self):
         board_id = communityBoardController.createBoard(self.alum.userID, "Leave Board", "")
         other = Alumni(email="nonmember@test.com", password="h", name="NonMember", role="alumni",
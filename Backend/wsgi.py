@@ -7,18 +7,20 @@ from flask_migrate import Migrate
 from App.main import create_app
 from App.database import db
 from App.Models import User, Alumni, Admin, Event, Job, BoardPost, CommunityBoard, Message
-from App.Controllers.initialize import initialize_database, reset_database, add_sample_data
-from App.Controllers.userController import registerUser, loginUser, updateProfile, resetPassword
+from App.Controllers.initialize import initialize_database, reset_database, add_sample_data, upgrade_schema
+from App.Controllers.userController import registerUser, loginUser, updateProfile, resetPassword, sweepExpiredResetTokens
 from App.Controllers.adminControllers import approveUser, moderateContent, generateReport, manageEvent, sendAnnouncement
 from App.Controllers.alumniControllers import searchAlumni
-from App.Controllers.eventRegistrationControllers import registerForEvent as register_event_ctrl
-from App.Controllers.eventController import createEvent, cancelEvent, sendReminders, listEvents, registerEvent, unregisterEvent
+from App.Controllers.eventRegistrationControllers import registerForEvent as register_event_ctrl, reconcileSeatCounts
+from App.Controllers.eventController import createEvent, cancelEvent, sendReminders, listEvents, registerEvent, unregisterEvent, sendUpcomingReminders
 from App.Controllers.jobController import createJob, updateJob, closeJob, listJobs, saveJob, showSavedJobs, addTestimonial, deleteTestimonial
 from App.Controllers.jobApplicationController import createApplication, viewApplication, listApplications, withdrawApplication, updateApplicationStatus
-from App.Controllers.boardPostController import createBoardPost, viewBoardPost, listBoardPosts, updateBoardPost, deleteBoardPost, likePost, addComment, listAllPosts
-from App.Controllers.messageController import requestMessage, acceptMessageRequest, rejectMessageRequest, sendMessage, showInbox, showSentMessages, showMessageRequests, blockUser
+from App.Controllers.boardPostController import createBoardPost, viewBoardPost, listBoardPosts, updateBoardPost, deleteBoardPost, likePost, addComment, listAllPosts, migrateLegacyLikes, migrateLegacyComments
+from App.Controllers.messageController import requestMessage, acceptMessageRequest, rejectMessageRequest, sendMessage, showInbox, showSentMessages, showMessageRequests, blockUser, backfillConversations
 from App.Controllers.profileController import ensureProfile, updateBio, updateProfilePhoto, viewProfile
-from App.Controllers.communityBoardController import createBoard, joinBoard, leaveBoard, listBoardsForUser, viewBoardDetails, createPostInBoard
+from App.Controllers.communityBoardController import createBoard, joinBoard, leaveBoard, listBoardsForUser, viewBoardDetails, createPostInBoard, migrateLegacyMembers
+from App.Controllers.auth import benchmark_password_hashing
+from App.Models.user import password_hash_method
 
 app = create_app()
 migrate = Migrate(app, db)
@@ -30,6 +32,8 @@ migrate = Migrate(app, db)
 with app.app_context():
     # First, create all tables if they don't exist
     db.create_all()
+    # create_all never alters existing tables; add columns and indexes from newer models
+    upgrade_schema()
     
     # Now check if any users exist; if not, add sample data
     if not User.query.first():
@@ -61,6 +65,11 @@ def seed():
     add_sample_data(app)
     print("Sample data added.")
 
+@app.cli.command("upgrade-schema", help="Add new model columns and indexes to existing tables (idempotent)")
+def upgrade_schema_cmd():
+    applied = upgrade_schema()
+    print(f"Applied {len(applied)} schema changes" + (": " + ", ".join(applied) if applied else ""))
+
 @app.cli.command("run", help="Run the Flask development server")
 def run_server():
     app.run(debug=True, host="0.0.0.0", port=5000)
@@ -91,7 +100,7 @@ def list_events():
 def list_boards():
     boards = CommunityBoard.query.all()
     for b in boards:
-        print(f"{b.name} (owner: {b.owner.name}) - members: {len(b.memberIDs)}")
+        print(f"{b.name} (owner: {b.owner.name}) - members: {b.members.count()}")
 
 @app.cli.command("listPosts", help="Lists all board posts")
 def list_posts():
@@ -106,6 +115,15 @@ def list_messages():
         print(f"From {m.sender.email} to {m.receiver.email}: {m.content[:50]}...")
 
 
+messages_cli = AppGroup('messages', help='Message commands')
+app.cli.add_command(messages_cli)
+
+@messages_cli.command("backfill-conversations", help="Attach messages sent before threads existed to conversations")
+def backfill_conversations_cmd():
+    count = backfillConversations()
+    print(f"Attached {count} messages to conversations")
+
+
 # ---------------------------
 # Alumni interactive commands (AppGroup)
 # ---------------------------
@@ -234,6 +252,12 @@ def list_upcoming_events():
     for e in events:
         print(f"{e.title} on {e.date} at {e.location}")
 
+@events_cli.command("reconcile-seats", help="Recompute event seat counters from registrations and fill freed seats from waitlists")
+@click.option('--event-id', default=None, help="Only reconcile this event")
+def reconcile_seats_cmd(event_id):
+    fixed = reconcileSeatCounts(event_id)
+    print(f"Corrected seat counts on {fixed} events")
+
 @events_cli.command("create", help="Create a new event")
 @click.argument("board_id")
 @click.argument("title")
@@ -257,6 +281,31 @@ def create_event_cmd(board_id, title, description, date_str, time_str, location,
         print(f"Error: {e}")
 
 
+# ---------------------------
+# Reminder scheduler
+# ---------------------------
+reminders_cli = AppGroup('reminders', help='Event reminder commands')
+app.cli.add_command(reminders_cli)
+
+@reminders_cli.command("run", help="Send reminders for events starting soon, repeating every --interval seconds")
+@click.option('--window-hours', type=float, default=24, show_default=True, help="How far ahead to look for events")
+@click.option('--interval', type=int, default=300, show_default=True, help="Seconds between passes")
+@click.option('--once', is_flag=True, help="Run a single pass and exit")
+def run_reminders_cmd(window_hours, interval, once):
+    import time
+    while True:
+        try:
+            result = sendUpcomingReminders(window_hours=window_hours)
+            print(f"Checked {result['events']} upcoming events, sent {result['sent']} reminders")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error: {e}")
+        if once:
+            break
+        db.session.remove()
+        time.sleep(interval)
+
+
 # ---------------------------
 # Boards interactive commands
 # ---------------------------
@@ -267,7 +316,12 @@ app.cli.add_command(boards_cli)
 def list_all_boards():
     boards = CommunityBoard.query.all()
     for b in boards:
-        print(f"{b.name} (owner: {b.owner.name}) - members: {len(b.memberIDs)}")
+        print(f"{b.name} (owner: {b.owner.name}) - members: {b.members.count()}")
+
+@boards_cli.command("migrate-members", help="Move legacy memberIDs JSON lists into the board_members table")
+def migrate_members_cmd():
+    result = migrateLegacyMembers()
+    print(f"Migrated {result['inserted']} memberships, skipped {result['skipped']} of unknown users")
 
 @boards_cli.command("create", help="Create a new board")
 @click.argument("name")
@@ -281,6 +335,23 @@ def create_board_cmd(name, description):
     print(f"Board created with ID: {board_id}")
 
 
+# ---------------------------
+# Posts interactive commands
+# ---------------------------
+posts_cli = AppGroup('posts', help='Board post commands')
+app.cli.add_command(posts_cli)
+
+@posts_cli.command("migrate-likes", help="Move legacy likedBy JSON lists into the post_likes table")
+def migrate_likes_cmd():
+    result = migrateLegacyLikes()
+    print(f"Migrated {result['inserted']} likes, skipped {result['skipped']} from unknown users")
+
+@posts_cli.command("migrate-comments", help="Move legacy comments JSON lists into the post_comments table")
+def migrate_comments_cmd():
+    result = migrateLegacyComments()
+    print(f"Migrated {result['inserted']} comments, kept {result['skipped']} that could not be moved")
+
+
 # ---------------------------
 # Admin interactive commands
 # ---------------------------
@@ -307,6 +378,21 @@ def moderate_cmd(content_type, content_id, action):
     except Exception as e:
         print(f"Error: {e}")
 
+@admin_cli.command("sweep-reset-tokens", help="Delete expired password reset tokens")
+def sweep_reset_tokens_cmd():
+    removed = sweepExpiredResetTokens()
+    print(f"Removed {removed} expired reset tokens")
+
+@admin_cli.command("bench-passwords", help="Report logins per second per core for each password hashing profile")
+@click.option('--seconds', '-s', default=1.0, help="Time spent on each profile")
+@click.option('--profile', '-p', 'profiles', multiple=True, help="Profile name or werkzeug method (repeatable)")
+def bench_passwords_cmd(seconds, profiles):
+    configured = password_hash_method()
+    for row in benchmark_password_hashing(profiles or None, seconds):
+        marker = " (configured)" if row["method"] == configured else ""
+        print(f"{row['profile']:<10} {row['method']:<24} {row['verifyMs']:>10.3f} ms  "
+              f"{row['loginsPerSecondPerCore']:>10.1f} logins/s/core{marker}")
+
 @admin_cli.command("report", help="Generate a site report summary")
 def report_cmd():
     try:
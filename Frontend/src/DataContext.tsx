@@ -101,6 +101,19 @@ export interface Message {
   unread?: boolean;
 }
 
+export interface Conversation {
+  threadId: string;
+  peerId: string;
+  sender: string;
+  avatar: string;
+  preview: string;
+  time: string;
+  rawTimestamp: string;
+  unread: boolean;
+  unreadCount: number;
+  online?: boolean;
+}
+
 export interface MessageRequest {
   id: string;
   name: string;
@@ -171,6 +184,7 @@ interface DataContextType {
   jobs: Job[];
   events: Event[];
   messages: Message[];
+  conversations: Conversation[];
   messageRequests: MessageRequest[];
   userProfile: UserProfile;
   posts: Post[];
@@ -204,6 +218,15 @@ interface DataContextType {
   cancelEvent: (eventId: string) => void;
   reopenEvent?: (eventId: string) => Promise<boolean>;
   sendMessage: (chatId: string, content: string) => Promise<void>;
+  fetchThread: (peerId: string) => Promise<void>;
+  hasMoreConversations: boolean;
+  loadMoreConversations: () => Promise<void>;
+  hasOlderMessages: (peerId: string) => boolean;
+  loadOlderMessages: (peerId: string) => Promise<void>;
+  hasMoreMessageRequests: boolean;
+  loadMoreMessageRequests: () => Promise<void>;
+  hasMorePosts: boolean;
+  loadMorePosts: () => Promise<void>;
   acceptMessageRequest: (id: string) => Promise<void>;
   rejectMessageRequest: (id: string) => Promise<void>;
   updateProfile: (profile: Partial<UserProfile>) => Promise<void>;
@@ -239,6 +262,33 @@ const authHeaders = (extra: HeadersInit = {}): HeadersInit => {
   return token ? { Authorization: `Bearer ${token}`, ...extra } : extra;
 };
 
+// Rows requested per page of a cursor-paginated list
+const PAGE_SIZE = 50;
+
+interface Page {
+  items: any[];
+  nextCursor: string | null;
+}
+
+/**
+ * Fetch one page of a cursor-paginated list, starting after `cursor` when given.
+ * Returns null when the request fails so callers can distinguish "empty" from "error".
+ */
+const fetchPage = async (path: string, key: string, cursor: string | null = null, pageSize = PAGE_SIZE): Promise<Page | null> => {
+  const separator = path.includes('?') ? '&' : '?';
+  const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+  const res = await fetch(`${API_BASE}${path}${separator}limit=${pageSize}${cursorParam}`, { headers: authHeaders() });
+  if (!res.ok) return null;
+  const data = await res.json();
+  return { items: data[key] || [], nextCursor: data.nextCursor || null };
+};
+
+// Append a further page to a list, dropping rows already loaded
+const appendUnique = <T,>(prev: T[], next: T[], keyOf: (item: T) => string): T[] => {
+  const seen = new Set(prev.map(keyOf));
+  return [...prev, ...next.filter((item) => !seen.has(keyOf(item)))];
+};
+
 const formatTo12Hour = (timeValue: string): string => {
   const parsed = new Date(`1970-01-01T${timeValue}`);
   if (Number.isNaN(parsed.getTime())) return timeValue;
@@ -381,6 +431,7 @@ export function DataProvider({ children }: { children: ReactNode }) {
   const [jobs, setJobs] = useState<Job[]>([]);
   const [events, setEvents] = useState<Event[]>([]);
   const [messages, setMessages] = useState<Message[]>([]);
+  const [conversations, setConversations] = useState<Conversation[]>([]);
   const [messageRequests, setMessageRequests] = useState<MessageRequest[]>([]);
   const [userProfile, setUserProfile] = useState<UserProfile | null>(null);
   const [posts, setPosts] = useState<Post[]>([]);
@@ -390,6 +441,20 @@ export function DataProvider({ children }: { children: ReactNode }) {
   const [loading, setLoading] = useState<LoadingState>({});
 
   const fetchedJobsCache = useRef<Set<string>>(new Set());
+  // peerId -> threadID, refreshed with every conversation list load
+  const threadIds = useRef<Map<string, string>>(new Map());
+  // API path -> cursor of its next page; null once the list is exhausted
+  const [nextCursors, setNextCursors] = useState<Record<string, string | null>>({});
+
+  // First page of a list, or the page after its stored cursor when appending
+  const loadPage = async (path: string, key: string, append = false): Promise<Page | null> => {
+    const cursor = append ? nextCursors[path] : null;
+    if (append && !cursor) return null;
+    const page = await fetchPage(path, key, cursor);
+    if (page) setNextCursors((prev) => ({ ...prev, [path]: page.nextCursor }));
+    return page;
+  };
+  const hasNextPage = (path: string) => Boolean(nextCursors[path]);
 
   const getAdminId = () => {
     const admin = alumni.find(a => a.role === 'admin');
@@ -454,56 +519,97 @@ export function DataProvider({ children }: { children: ReactNode }) {
     setEvents((prev) => prev.map((event) => ({ ...event, registered: registeredIds.has(toId(event.id)) })));
   };
 
-  const fetchMessages = async () => {
-    const [inboxRes, sentRes] = await Promise.all([
-      fetch(`${API_BASE}/messages/inbox`, { headers: authHeaders() }),
-      fetch(`${API_BASE}/messages/sent`, { headers: authHeaders() }),
-    ]);
-    if (!inboxRes.ok && !sentRes.ok) {
-      setMessages([]);
+  const transformMessage = (message: any): Message => {
+    const isMine = toId(message.senderID) === toId(user?.id);
+    const counterpartName = isMine ? (message.receiverName || toId(message.receiverID)) : (message.senderName || toId(message.senderID));
+    return {
+      id: toId(message.messageID),
+      senderId: toId(message.senderID),
+      receiverId: toId(message.receiverID),
+      sender: counterpartName,
+      content: message.content,
+      time: new Date(message.timestamp).toLocaleTimeString(),
+      rawTimestamp: message.timestamp,
+      status: normalizeMessageStatus(message.status),
+      avatar: `https://ui-avatars.com/api/?name=${encodeURIComponent(counterpartName || 'User')}&background=random`,
+      online: false,
+      preview: message.content,
+      unread: !isMine && (message.status === 'requested' || message.status === 'sent' || message.status === 'unread'),
+    };
+  };
+
+  // Conversation list: one thread query per page instead of merging inbox and sent
+  const fetchMessages = async (append = false) => {
+    const page = await loadPage('/messages/conversations', 'conversations', append);
+    if (!page) {
+      if (!append) setConversations([]);
       return;
     }
-    const inboxData = inboxRes.ok ? await inboxRes.json().catch(() => ({})) : {};
-    const sentData = sentRes.ok ? await sentRes.json().catch(() => ({})) : {};
-    const merged = [...(inboxData.messages || []), ...(sentData.messages || [])];
-    const seen = new Set<string>();
-    const transformed = merged
-      .filter((message: any) => {
-        const id = toId(message.messageID);
-        if (seen.has(id)) return false;
-        seen.add(id);
-        return true;
-      })
-      .map((message: any) => {
-        const isMine = toId(message.senderID) === toId(user?.id);
-        const counterpartName = isMine ? (message.receiverName || toId(message.receiverID)) : (message.senderName || toId(message.senderID));
-        return {
-          id: toId(message.messageID),
-          senderId: toId(message.senderID),
-          receiverId: toId(message.receiverID),
-          sender: counterpartName,
-          content: message.content,
-          time: new Date(message.timestamp).toLocaleTimeString(),
-          rawTimestamp: message.timestamp,
-          status: normalizeMessageStatus(message.status),
-          avatar: `https://ui-avatars.com/api/?name=${encodeURIComponent(counterpartName || 'User')}&background=random`,
-          online: false,
-          preview: message.content,
-          unread: !isMine && (message.status === 'requested' || message.status === 'sent' || message.status === 'unread'),
-        };
-      })
-      .sort((a, b) => new Date(b.rawTimestamp || b.time).getTime() - new Date(a.rawTimestamp || a.time).getTime());
-    setMessages(transformed);
+    const rows = page.items;
+    const pairs = rows.map((row: any): [string, string] => [toId(row.peerID), toId(row.threadID)]);
+    threadIds.current = append ? new Map([...threadIds.current, ...pairs]) : new Map(pairs);
+    const loaded: Conversation[] = rows.map((row: any) => {
+      const peerName = row.peerName || toId(row.peerID);
+      return {
+        threadId: toId(row.threadID),
+        peerId: toId(row.peerID),
+        sender: peerName,
+        avatar: `https://ui-avatars.com/api/?name=${encodeURIComponent(peerName || 'User')}&background=random`,
+        preview: row.lastMessage?.content || '',
+        time: new Date(row.lastMessageAt).toLocaleTimeString(),
+        rawTimestamp: row.lastMessageAt,
+        unread: Number(row.unreadCount || 0) > 0,
+        unreadCount: Number(row.unreadCount || 0),
+        online: false,
+      };
+    });
+    setConversations((prev) => (append ? appendUnique(prev, loaded, (item) => item.threadId) : loaded));
   };
 
-  const fetchMessageRequests = async () => {
-    const res = await fetch(`${API_BASE}/messages/requests`, { headers: authHeaders() });
-    if (!res.ok) {
-      setMessageRequests([]);
+  const threadPath = (peerId: string) => {
+    const threadId = threadIds.current.get(toId(peerId));
+    return threadId ? `/messages/conversations/${threadId}` : null;
+  };
+
+  // Newest page of one thread, loaded when the chat is opened; marks the thread read
+  const fetchThread = async (peerId: string) => {
+    const threadId = threadIds.current.get(toId(peerId));
+    if (!threadId) return;
+    const page = await loadPage(`/messages/conversations/${threadId}`, 'messages');
+    if (!page) return;
+    const threadMessages = page.items.map(transformMessage);
+    setMessages((prev) => [
+      ...prev.filter((message) => message.senderId !== toId(peerId) && message.receiverId !== toId(peerId)),
+      ...threadMessages,
+    ]);
+    const conversation = conversations.find((item) => item.threadId === threadId);
+    if (conversation?.unread) {
+      const res = await fetch(`${API_BASE}/messages/conversations/${threadId}/read`, { method: 'POST', headers: authHeaders() });
+      if (res.ok) {
+        setConversations((prev) =>
+          prev.map((item) => (item.threadId === threadId ? { ...item, unread: false, unreadCount: 0 } : item)),
+        );
+      }
+    }
+  };
+
+  // Older messages of an open thread, one page per call
+  const loadOlderMessages = async (peerId: string) => {
+    const path = threadPath(peerId);
+    if (!path) return;
+    const page = await loadPage(path, 'messages', true);
+    if (!page) return;
+    const older = page.items.map(transformMessage);
+    setMessages((prev) => appendUnique(prev, older, (message) => message.id));
+  };
+
+  const fetchMessageRequests = async (append = false) => {
+    const page = await loadPage('/messages/requests', 'messages', append);
+    if (!page) {
+      if (!append) setMessageRequests([]);
       return;
     }
-    const data = await res.json();
-    const requests = (data.messages || [])
+    const requests: MessageRequest[] = page.items
       .filter((message: any) => message.status === 'requested')
       .map((message: any) => ({
         id: toId(message.messageID),
@@ -512,7 +618,7 @@ export function DataProvider({ children }: { children: ReactNode }) {
         avatar: `https://ui-avatars.com/api/?name=${encodeURIComponent(message.senderName || 'User')}&background=random`,
         message: message.content,
       }));
-    setMessageRequests(requests);
+    setMessageRequests((prev) => (append ? appendUnique(prev, requests, (item) => item.id) : requests));
   };
 
   const fetchUserProfile = async () => {
@@ -593,14 +699,37 @@ export function DataProvider({ children }: { children: ReactNode }) {
     setCommunities(transformed);
   };
 
-  const fetchPosts = async () => {
-    const res = await fetch(`${API_BASE}/boardposts/all`, { headers: authHeaders() });
-    if (!res.ok) {
-      setPosts([]);
+  const fetchAnnouncements = async (authorAvatar?: string, append = false) => {
+    const page = await loadPage('/messages/announcements', 'announcements', append);
+    if (!page) {
+      if (!append) setAnnouncements([]);
       return;
     }
-    const data = await res.json();
-    const transformed = (data.posts || []).map((post: any) => ({
+    const loaded: Announcement[] = page.items.map((row: any) => ({
+      id: toId(row.announcementID),
+      author: row.authorName || 'UWI Admin',
+      avatar: (toId(row.authorID) === toId(user?.id) && authorAvatar) || `https://ui-avatars.com/api/?name=${encodeURIComponent(row.authorName || 'Admin')}&background=0D8ABC&color=fff`,
+      content: `📢 ${row.content}`,
+      time: new Date(row.createdAt).toLocaleString(),
+      likes: 0,
+      likedBy: [],
+      commentsCount: 0,
+      comments: [],
+      liked: false,
+      communityId: undefined,
+      isAnnouncement: true,
+      sentAsMessage: true,
+    }));
+    setAnnouncements((prev) => (append ? appendUnique(prev, loaded, (item) => item.id) : loaded));
+  };
+
+  const fetchPosts = async (append = false) => {
+    const page = await loadPage('/boardposts/all', 'posts', append);
+    if (!page) {
+      if (!append) setPosts([]);
+      return;
+    }
+    const transformed: Post[] = page.items.map((post: any) => ({
       id: toId(post.postID),
       author: post.authorName || 'Unknown User',
       avatar: `https://ui-avatars.com/api/?name=${encodeURIComponent(post.authorName || 'User')}&background=random`,
@@ -616,11 +745,16 @@ export function DataProvider({ children }: { children: ReactNode }) {
         content: comment.content || '',
         time: comment.time ? new Date(comment.time).toLocaleString() : '',
       })),
-      liked: Boolean((post.likedBy || []).map((value: unknown) => toId(value)).includes(toId(user?.id))),
+      liked: typeof post.liked === 'boolean' ? post.liked : Boolean((post.likedBy || []).map((value: unknown) => toId(value)).includes(toId(user?.id))),
       communityId: toId(post.boardID),
       isAnnouncement: false,
     }));
-    setPosts(transformed);
+    setPosts((prev) => (append ? appendUnique(prev, transformed, (item) => item.id) : transformed));
+  };
+
+  // The feed interleaves announcements with posts, so "load more" advances both lists
+  const loadMorePosts = async () => {
+    await Promise.all([fetchPosts(true), fetchAnnouncements(undefined, true)]);
   };
 
   const allPosts = [...announcements, ...posts].sort((a, b) => {
@@ -642,6 +776,7 @@ export function DataProvider({ children }: { children: ReactNode }) {
           fetchAlumni(),
           fetchCommunities(),
           fetchPosts(),
+          fetchAnnouncements(),
         ]);
         await Promise.all([fetchAppliedJobs(), fetchRegisteredEvents()]);
       } catch (error) {
@@ -1341,43 +1476,14 @@ export function DataProvider({ children }: { children: ReactNode }) {
     }
   };
 
+  // Announcements are stored once on the server; admins publish with a single request
   const addAnnouncement = async (content: string, adminName: string, adminAvatar: string) => {
-    const newAnnouncement: Announcement = {
-      id: `announcement-${Date.now()}`,
-      author: adminName || 'UWI Admin',
-      avatar: adminAvatar || `https://ui-avatars.com/api/?name=Admin&background=0D8ABC&color=fff`,
-      content: `📢 ${content}`,
-      time: new Date().toLocaleString(),
-      likes: 0,
-      likedBy: [],
-      commentsCount: 0,
-      comments: [],
-      liked: false,
-      communityId: undefined,
-      isAnnouncement: true,
-      sentAsMessage: false,
-    };
-
-    setAnnouncements((prev) => [newAnnouncement, ...prev]);
-
-    const alumniList = alumni;
-    const messagePromises = alumniList.map(async (recipient) => {
-      try {
-        await fetch(`${API_BASE}/messages`, {
-          method: 'POST',
-          headers: authHeaders({ 'Content-Type': 'application/json' }),
-          body: JSON.stringify({ receiverID: toId(recipient.id), content: `📢 Announcement: ${content}` }),
-        });
-      } catch {}
-    });
-
-    Promise.all(messagePromises).then(() => {
-      setAnnouncements((prev) =>
-        prev.map((a) => (a.id === newAnnouncement.id ? { ...a, sentAsMessage: true } : a))
-      );
+    const res = await fetch(`${API_BASE}/admin/announcements`, {
+      method: 'POST',
+      headers: authHeaders({ 'Content-Type': 'application/json' }),
+      body: JSON.stringify({ content }),
     });
-
-    setTimeout(() => fetchMessages(), 1000);
+    if (res.ok) await fetchAnnouncements(adminAvatar);
   };
 
   const reportUser = async (reportedUserId: string, reportedUserName: string, reason: string, details?: string) => {
@@ -1414,7 +1520,7 @@ export function DataProvider({ children }: { children: ReactNode }) {
 
   const stats = {
     alumniCount: alumni.length,
-    unreadCount: messages.filter((message) => message.unread).length,
+    unreadCount: conversations.reduce((total, conversation) => total + conversation.unreadCount, 0),
     appliedJobsCount: jobs.filter((job) => job.applied).length,
     registeredEventsCount: events.filter((event) => event.registered).length,
     pendingJobsCount: jobs.filter((job) => job.status === 'pending').length,
@@ -1424,6 +1530,7 @@ export function DataProvider({ children }: { children: ReactNode }) {
     jobs,
     events,
     messages,
+    conversations,
     messageRequests,
     userProfile: userProfile || emptyProfile,
     posts: allPosts,
@@ -1445,6 +1552,18 @@ export function DataProvider({ children }: { children: ReactNode }) {
     toggleRegisterEvent,
     cancelEvent,
     sendMessage,
+    fetchThread,
+    hasMoreConversations: hasNextPage('/messages/conversations'),
+    loadMoreConversations: () => fetchMessages(true),
+    hasOlderMessages: (peerId: string) => {
+      const path = threadPath(peerId);
+      return path ? hasNextPage(path) : false;
+    },
+    loadOlderMessages,
+    hasMoreMessageRequests: hasNextPage('/messages/requests'),
+    loadMoreMessageRequests: () => fetchMessageRequests(true),
+    hasMorePosts: hasNextPage('/boardposts/all') || hasNextPage('/messages/announcements'),
+    loadMorePosts,
     acceptMessageRequest,
     rejectMessageRequest,
     updateProfile,
@@ -26,7 +26,8 @@ export default function CommunityBoard() {
     jobs, addJob, submitJobApplication, approveApplication, rejectApplication,
     fetchAndSetJobApplications,
     events, addEvent, cancelEvent, toggleRegisterEvent,
-    userProfile, alumni, getCommunityMembers
+    userProfile, alumni, getCommunityMembers,
+    hasMorePosts, loadMorePosts
   } = useData();
   const { showToast } = useToast();
 
@@ -367,6 +368,11 @@ export default function CommunityBoard() {
                     </motion.div>
                   ))
                 )}
+                {!isLoading && hasMorePosts && (
+                  <button onClick={() => loadMorePosts()} className="w-full py-2 text-xs font-bold text-blue-600 hover:bg-blue-50 rounded-xl transition-colors">
+                    Load more posts
+                  </button>
+                )}
               </div>
             </>
           )}
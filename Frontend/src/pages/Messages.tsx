@@ -1,6 +1,6 @@
 // File: src/pages/Messages.tsx
 
-import React, { useState, useEffect, useMemo } from 'react';
+import React, { useState, useEffect } from 'react';
 import { useAuth } from '../AuthContext';
 import { useData } from '../DataContext';
 import { motion } from 'motion/react';
@@ -12,7 +12,10 @@ import { getAuthToken } from '../AuthContext';
 
 export default function Messages() {
   const { user } = useAuth();
-  const { messages, messageRequests, acceptMessageRequest, rejectMessageRequest, sendMessage, loading, alumni, reportUser } = useData();
+  const {
+    messages, conversations, fetchThread, messageRequests, acceptMessageRequest, rejectMessageRequest, sendMessage, loading, alumni, reportUser,
+    hasMoreConversations, loadMoreConversations, hasOlderMessages, loadOlderMessages, hasMoreMessageRequests, loadMoreMessageRequests,
+  } = useData();
   const { showToast } = useToast();
   const [activeTab, setActiveTab] = useState<'inbox' | 'requests'>('inbox');
   const navigate = useNavigate();
@@ -65,9 +68,6 @@ export default function Messages() {
     }
   }, [searchParams, alumni, navigate]);
 
-  const getChatPartnerId = (message: (typeof messages)[number]) =>
-    message.senderId === user?.id ? message.receiverId : message.senderId;
-
   const resolveRecipientId = (value: string) => {
     const query = value.trim().toLowerCase();
     if (!query) return '';
@@ -106,19 +106,12 @@ export default function Messages() {
     setNewMessageBody('');
   };
 
-  // Group messages by conversation partner to ensure unique chats
-  const conversations = useMemo(() => {
-    const map = new Map<string, typeof messages[number]>();
-    messages.forEach(msg => {
-      const partnerId = getChatPartnerId(msg);
-      if (!map.has(partnerId)) {
-        map.set(partnerId, msg);
-      }
-    });
-    return Array.from(map.values());
-  }, [messages, user?.id]);
+  const activeChat = conversations.find((conversation) => conversation.peerId === selectedChat);
 
-  const activeChat = messages.find((message) => getChatPartnerId(message) === selectedChat);
+  // Load the open thread, and reload it whenever its last message changes
+  useEffect(() => {
+    if (selectedChat) fetchThread(selectedChat);
+  }, [selectedChat, activeChat?.threadId, activeChat?.rawTimestamp]);
   const conversationMessages = selectedChat
     ? messages
         .filter(
@@ -158,7 +151,7 @@ export default function Messages() {
   };
 
   // Check if message is from system/admin
-  const isSystemMessage = (msg: typeof messages[0]) => {
+  const isSystemMessage = (msg: { sender: string; content: string }) => {
     return msg.sender === 'UWI Admin' || msg.sender === 'System' || msg.content.startsWith('📢 Announcement:') || msg.content.startsWith('🚨 User Report');
   };
 
@@ -282,6 +275,11 @@ export default function Messages() {
 
             {/* Messages Area */}
             <div className="flex-1 overflow-y-auto p-4 space-y-4 bg-slate-50/30">
+              {selectedChat && hasOlderMessages(selectedChat) && (
+                <button onClick={() => loadOlderMessages(selectedChat)} className="w-full py-2 text-xs font-bold text-blue-600 hover:bg-blue-50 rounded-xl transition-colors">
+                  Load older messages
+                </button>
+              )}
               {conversationMessages.length === 0 ? (
                 <p className="text-sm text-slate-400 text-center py-6">No messages yet.</p>
               ) : (
@@ -370,13 +368,13 @@ export default function Messages() {
               </div>
             ) : (
               conversations.map((msg) => {
-                const systemMsg = isSystemMessage(msg);
+                const systemMsg = isSystemMessage({ sender: msg.sender, content: msg.preview });
                 return (
                   <motion.div 
-                    key={msg.id}
+                    key={msg.threadId}
                     initial={{ opacity: 0, y: 5 }}
                     animate={{ opacity: 1, y: 0 }}
-                    onClick={() => setSelectedChat(getChatPartnerId(msg))}
+                    onClick={() => setSelectedChat(msg.peerId)}
                     className={`p-4 rounded-2xl cursor-pointer transition-all border ${
                       msg.unread 
                         ? 'bg-white border-blue-100 shadow-sm' 
@@ -412,6 +410,11 @@ export default function Messages() {
                 );
               })
             )}
+            {hasMoreConversations && (
+              <button onClick={() => loadMoreConversations()} className="w-full py-2 text-xs font-bold text-blue-600 hover:bg-blue-50 rounded-xl transition-colors">
+                Load more conversations
+              </button>
+            )}
           </div>
         )
       ) : (
@@ -456,6 +459,11 @@ export default function Messages() {
               </motion.div>
             ))
           )}
+          {hasMoreMessageRequests && (
+            <button onClick={() => loadMoreMessageRequests()} className="w-full py-2 text-xs font-bold text-blue-600 hover:bg-blue-50 rounded-xl transition-colors">
+              Load more requests
+            </button>
+          )}
         </div>
       )}
 